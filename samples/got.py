@@ -82,8 +82,12 @@ def run_simulation_with_profiling(simulation: Simulation, years: int) -> None:
     print(f"Simulating {years} years ({total_time_steps} timesteps) ...")
 
     with Profile() as profile:
-        for _ in tqdm.trange(total_time_steps):  # type: ignore
-            simulation.step()
+        with tqdm.tqdm(total=total_time_steps) as progress_bar:  # type: ignore
+            simulation.run(
+                months=total_time_steps,
+                on_tick=lambda _: progress_bar.update(MONTHS_PER_YEAR),
+                tick_interval=MONTHS_PER_YEAR,
+            )
 
         profile_path = "profile_{}_{}.prof".format(  # pylint: disable=C0209
             simulation.config.seed, datetime.now().strftime("%Y%m%d_%H_%M")
@@ -103,8 +107,12 @@ def run_simulation(simulation: Simulation, years: int) -> None:
 
     print(f"Simulating {years} years ({total_time_steps} timesteps) ...")
 
-    for _ in tqdm.trange(total_time_steps):  # type: ignore
-        simulation.step()
+    with tqdm.tqdm(total=total_time_steps) as progress_bar:  # type: ignore
+        simulation.run(
+            months=total_time_steps,
+            on_tick=lambda _: progress_bar.update(MONTHS_PER_YEAR),
+            tick_interval=MONTHS_PER_YEAR,
+        )
 
 
 def run_visualization(simulation: Simulation) -> None:
@@ -160,6 +168,7 @@ if __name__ == "__main__":
         run_simulation(sim, int(args.years))
 
     sim.export_db(str(args.db_out))
+    sim.close()
 
     # Create inspector for when the script is run with the python "-i" flag
     inspector = SimulationInspector(sim)
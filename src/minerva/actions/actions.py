@@ -57,6 +57,7 @@ from minerva.traits.helpers import add_trait
 from minerva.world_map.components import InRevolt, PopulationHappiness, Territory
 from minerva.world_map.helpers import (
     increment_political_influence,
+    set_political_influence,
     set_territory_controlling_family,
 )
 
@@ -70,13 +71,12 @@ class IdleAction(AIAction):
         super().__init__(performer, "Idle")
 
     def execute(self) -> bool:
-        current_date = self.world.get_resource(SimDate)
-
-        _logger.debug(
-            "[%s]: %s is idle.",
-            current_date.to_iso_str(),
-            self.performer.name_with_uid,
-        )
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug(
+                "[%s]: %s is idle.",
+                self.world.get_resource(SimDate).to_iso_str(),
+                self.performer.name_with_uid,
+            )
 
         return True
 
@@ -561,8 +561,7 @@ class ExpandIntoTerritoryAction(AIAction):
 
         family_head_component = family_head.get_component(HeadOfFamily)
 
-        territory_component = territory.get_component(Territory)
-        territory_component.political_influence[family_head_component.family] = 50
+        set_political_influence(territory, family_head_component.family, 50)
         family_head_component.family.get_component(Family).territories_present_in.add(
             territory
         )
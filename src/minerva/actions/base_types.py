@@ -402,15 +402,19 @@ class AIAction(ABC):
 class AIActionLibrary:
     """The library of AI actions."""
 
-    __slots__ = ("actions",)
+    __slots__ = ("actions", "_is_shared")
 
     actions: dict[str, AIActionType]
+    _is_shared: bool
+    """Is the actions dict shared with a copy of this library."""
 
     def __init__(self) -> None:
         self.actions = {}
+        self._is_shared = False
 
     def add_action(self, action: AIActionType) -> None:
         """Add an action to the library."""
+        self._detach()
         self.actions[action.name] = action
 
     def iter_actions(self) -> Iterator[AIActionType]:
@@ -421,6 +425,23 @@ class AIActionLibrary:
         """Get an action using its name."""
         return self.actions[name]
 
+    def copy(self) -> AIActionLibrary:
+        """Create a copy-on-write copy of the library.
+
+        The copy shares actions with this library until either one adds to them.
+        """
+        library = AIActionLibrary()
+        library.actions = self.actions
+        library._is_shared = True
+        self._is_shared = True
+        return library
+
+    def _detach(self) -> None:
+        """Stop sharing actions with copies of this library before modifying them."""
+        if self._is_shared:
+            self.actions = dict(self.actions)
+            self._is_shared = False
+
 
 class AIBehavior(ABC):
     """A behavior that can be performed by a character."""
@@ -461,15 +482,19 @@ class AIBehavior(ABC):
 class AIBehaviorLibrary:
     """The library of AI behaviors."""
 
-    __slots__ = ("behaviors",)
+    __slots__ = ("behaviors", "_is_shared")
 
     behaviors: dict[str, AIBehavior]
+    _is_shared: bool
+    """Is the behaviors dict shared with a copy of this library."""
 
     def __init__(self) -> None:
         self.behaviors = {}
+        self._is_shared = False
 
     def add_behavior(self, behavior: AIBehavior) -> None:
         """Add behavior to the library."""
+        self._detach()
         self.behaviors[behavior.get_name()] = behavior
 
     def iter_behaviors(self) -> Iterator[AIBehavior]:
@@ -480,6 +505,23 @@ class AIBehaviorLibrary:
         """Get a behavior by name."""
         return self.behaviors[name]
 
+    def copy(self) -> AIBehaviorLibrary:
+        """Create a copy-on-write copy of the library.
+
+        The copy shares behaviors with this library until either one adds to them.
+        """
+        library = AIBehaviorLibrary()
+        library.behaviors = self.behaviors
+        library._is_shared = True
+        self._is_shared = True
+        return library
+
+    def _detach(self) -> None:
+        """Stop sharing behaviors with copies of this library before modifying them."""
+        if self._is_shared:
+            self.behaviors = dict(self.behaviors)
+            self._is_shared = False
+
 
 class SchemeData(Component, ABC):
     """Context-specific data for a scheme.
@@ -487,6 +529,8 @@ class SchemeData(Component, ABC):
     This class should be derived from when creating new scheme types.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def get_description(self, scheme: Scheme) -> str:
         """Get a string description of the scheme."""
@@ -44,8 +44,10 @@ from minerva.characters.components import (
     Sex,
     SexualOrientation,
 )
+from minerva.characters.genealogy import GenealogyIndex
 from minerva.characters.succession_helpers import get_current_ruler
 from minerva.characters.war_data import Alliance
+from minerva.config import Config
 from minerva.ecs import Active, Entity
 from minerva.relationships.base_types import Attraction
 from minerva.relationships.helpers import get_relationship
@@ -449,6 +451,8 @@ class CheatOnSpouseBehavior(AIBehavior):
     def get_actions(self, character: Entity) -> list[AIAction]:
         # Loop through the people that this character is attracted to and are adults
         world = character.world
+        config = world.get_resource(Config)
+        genealogy = world.get_resource(GenealogyIndex)
 
         character_component = character.get_component(Character)
         character_spouse = character_component.spouse
@@ -490,15 +494,9 @@ class CheatOnSpouseBehavior(AIBehavior):
                     or c.sexual_orientation == SexualOrientation.BISEXUAL
                     or c.sexual_orientation == SexualOrientation.ASEXUAL
                 )
-                and c.entity not in character_component.siblings
-                and c.entity != character_component.mother
-                and c.entity != character_component.father
-                and c.entity != character_component.biological_father
-                and c.entity not in character_component.children
-                and c.entity not in character_component.grandchildren
-                and c.entity not in character_component.grandparents
-                and len(c.grandparents.intersection(character_component.grandparents))
-                < 2
+                and not genealogy.are_related(
+                    character, c.entity, config.max_marriage_kinship_degree
+                )
                 and c != character_component
             ]
 
@@ -519,15 +517,9 @@ class CheatOnSpouseBehavior(AIBehavior):
                     or c.sexual_orientation == SexualOrientation.BISEXUAL
                     or c.sexual_orientation == SexualOrientation.ASEXUAL
                 )
-                and c.entity not in character_component.siblings
-                and c.entity != character_component.mother
-                and c.entity != character_component.father
-                and c.entity != character_component.biological_father
-                and c.entity not in character_component.children
-                and c.entity not in character_component.grandchildren
-                and c.entity not in character_component.grandparents
-                and len(c.grandparents.intersection(character_component.grandparents))
-                < 2
+                and not genealogy.are_related(
+                    character, c.entity, config.max_marriage_kinship_degree
+                )
                 and c != character_component
             ]
 
@@ -548,15 +540,9 @@ class CheatOnSpouseBehavior(AIBehavior):
                     or c.sexual_orientation == SexualOrientation.BISEXUAL
                     or c.sexual_orientation == SexualOrientation.ASEXUAL
                 )
-                and c.entity not in character_component.siblings
-                and c.entity != character_component.mother
-                and c.entity != character_component.father
-                and c.entity != character_component.biological_father
-                and c.entity not in character_component.children
-                and c.entity not in character_component.grandchildren
-                and c.entity not in character_component.grandparents
-                and len(c.grandparents.intersection(character_component.grandparents))
-                < 2
+                and not genealogy.are_related(
+                    character, c.entity, config.max_marriage_kinship_degree
+                )
                 and c != character_component
             ]
 
@@ -577,15 +563,9 @@ class CheatOnSpouseBehavior(AIBehavior):
                     or c.sexual_orientation == SexualOrientation.BISEXUAL
                     or c.sexual_orientation == SexualOrientation.ASEXUAL
                 )
-                and c.entity not in character_component.siblings
-                and c.entity != character_component.mother
-                and c.entity != character_component.father
-                and c.entity != character_component.biological_father
-                and c.entity not in character_component.children
-                and c.entity not in character_component.grandchildren
-                and c.entity not in character_component.grandparents
-                and len(c.grandparents.intersection(character_component.grandparents))
-                < 2
+                and not genealogy.are_related(
+                    character, c.entity, config.max_marriage_kinship_degree
+                )
                 and c != character_component
             ]
 
@@ -605,11 +585,9 @@ class CheatOnSpouseBehavior(AIBehavior):
                     c.sexual_orientation == SexualOrientation.HOMOSEXUAL
                     or c.sexual_orientation == SexualOrientation.BISEXUAL
                 )
-                and c.entity not in character_component.siblings
-                and c.entity != character_component.mother
-                and c.entity != character_component.father
-                and c.entity != character_component.biological_father
-                and c.entity not in character_component.children
+                and not genealogy.are_related(
+                    character, c.entity, config.max_marriage_kinship_degree
+                )
                 and c != character_component
             ]
 
@@ -629,11 +607,9 @@ class CheatOnSpouseBehavior(AIBehavior):
                     c.sexual_orientation == SexualOrientation.HOMOSEXUAL
                     or c.sexual_orientation == SexualOrientation.BISEXUAL
                 )
-                and c.entity not in character_component.siblings
-                and c.entity != character_component.mother
-                and c.entity != character_component.father
-                and c.entity != character_component.biological_father
-                and c.entity not in character_component.children
+                and not genealogy.are_related(
+                    character, c.entity, config.max_marriage_kinship_degree
+                )
                 and c != character_component
             ]
 
@@ -652,11 +628,9 @@ class CheatOnSpouseBehavior(AIBehavior):
                     c.sexual_orientation == SexualOrientation.ASEXUAL
                     or c.sexual_orientation == SexualOrientation.BISEXUAL
                 )
-                and c.entity not in character_component.siblings
-                and c.entity != character_component.mother
-                and c.entity != character_component.father
-                and c.entity != character_component.biological_father
-                and c.entity not in character_component.children
+                and not genealogy.are_related(
+                    character, c.entity, config.max_marriage_kinship_degree
+                )
                 and c != character_component
             ]
 
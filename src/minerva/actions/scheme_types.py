@@ -57,6 +57,8 @@ class CoupScheme(SchemeData):
 class AllianceScheme(SchemeData):
     """Create a new alliance scheme"""
 
+    __slots__ = ()
+
     def get_description(self, scheme: Scheme) -> str:
         """Get a string description of the scheme."""
         return f"{scheme.initiator.name_with_uid} is trying to start an alliance."
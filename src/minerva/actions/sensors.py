@@ -9,6 +9,7 @@ from minerva.characters.components import Family, HeadOfFamily
 from minerva.characters.war_data import Alliance
 from minerva.ecs import Entity
 from minerva.world_map.components import InRevolt, Territory
+from minerva.world_map.territory_index import TerritoryIndex
 
 
 class TerritoriesInRevoltSensor(AISensor):
@@ -34,21 +35,16 @@ class UnexpandedTerritoriesSensor(AISensor):
 
     def evaluate(self, context: AIContext) -> None:
         # Check if the character is a family head
-        unexpanded_territories: OrderedSet[Entity] = OrderedSet([])
+        unexpanded_territories: list[Entity] = []
 
         if context.character.has_component(HeadOfFamily):
             family_head_component = context.character.get_component(HeadOfFamily)
-            family_component = family_head_component.family.get_component(Family)
-            for territory in family_component.controlled_territories:
-                territory_component = territory.get_component(Territory)
-                for neighboring_territory in territory_component.neighbors:
-                    if (
-                        neighboring_territory
-                        not in family_component.controlled_territories
-                    ):
-                        unexpanded_territories.add(neighboring_territory)
-
-        context["unexpanded_territories"] = list(unexpanded_territories)
+            territory_index = context.world.get_resource(TerritoryIndex)
+            unexpanded_territories = territory_index.get_frontier(
+                family_head_component.family
+            )
+
+        context["unexpanded_territories"] = unexpanded_territories
 
 
 class UnControlledTerritoriesSensor(AISensor):
@@ -5,7 +5,7 @@ from __future__ import annotations
 
 import dataclasses
 import enum
-from typing import Optional
+from typing import Any, Iterable, Iterator, MutableSet, Optional, overload
 
 from ordered_set import OrderedSet
 
@@ -147,19 +147,40 @@ class SpeciesLibrary:
 
     species: dict[str, Species]
     """Species instances."""
+    _is_shared: bool
+    """Is the species dict shared with a copy of this library."""
 
     def __init__(self) -> None:
         super().__init__()
         self.species = {}
+        self._is_shared = False
 
     def add_species(self, species: Species) -> None:
         """Add species to the library."""
+        self._detach()
         self.species[species.definition_id] = species
 
     def get_species(self, definition_id: str) -> Species:
         """Get a species instance."""
         return self.species[definition_id]
 
+    def copy(self) -> SpeciesLibrary:
+        """Create a copy-on-write copy of the library.
+
+        The copy shares species with this library until either one adds to them.
+        """
+        library = SpeciesLibrary()
+        library.species = self.species
+        library._is_shared = True
+        self._is_shared = True
+        return library
+
+    def _detach(self) -> None:
+        """Stop sharing species with copies of this library before modifying them."""
+        if self._is_shared:
+            self.species = dict(self.species)
+            self._is_shared = False
+
 
 class RelationType(enum.Enum):
     """Describes how two characters are related."""
@@ -179,8 +200,113 @@ class RelationType(enum.Enum):
     HEIR_TO = enum.auto()
 
 
+class EntityTupleSet(MutableSet[Entity]):
+    """An insertion-ordered set of entities backed by a tuple stored on its owner.
+
+    Instances are lightweight views created on attribute access. The entities
+    themselves live in a private slot of the owning object, so empty sets share the
+    empty tuple and only cost a single pointer.
+    """
+
+    __slots__ = ("_owner", "_slot")
+
+    _owner: Any
+    """The object that stores the entities."""
+    _slot: str
+    """The name of the owner's slot holding the entity tuple."""
+
+    def __init__(self, owner: Any, slot: str) -> None:
+        self._owner = owner
+        self._slot = slot
+
+    def add(self, value: Entity) -> None:
+        entities: tuple[Entity, ...] = getattr(self._owner, self._slot)
+
+        if value not in entities:
+            setattr(self._owner, self._slot, entities + (value,))
+
+    def append(self, value: Entity) -> None:
+        """Add an entity to the end of the set (alias of add)."""
+        self.add(value)
+
+    def discard(self, value: Entity) -> None:
+        entities: tuple[Entity, ...] = getattr(self._owner, self._slot)
+
+        if value in entities:
+            setattr(self._owner, self._slot, tuple(e for e in entities if e != value))
+
+    def clear(self) -> None:
+        setattr(self._owner, self._slot, ())
+
+    def index(self, value: Entity) -> int:
+        """Get the position of an entity within the set."""
+        return getattr(self._owner, self._slot).index(value)
+
+    def __contains__(self, value: object) -> bool:
+        return value in getattr(self._owner, self._slot)
+
+    def __iter__(self) -> Iterator[Entity]:
+        return iter(getattr(self._owner, self._slot))
+
+    def __len__(self) -> int:
+        return len(getattr(self._owner, self._slot))
+
+    @overload
+    def __getitem__(self, index: int) -> Entity: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> tuple[Entity, ...]: ...
+
+    def __getitem__(self, index: int | slice) -> Entity | tuple[Entity, ...]:
+        return getattr(self._owner, self._slot)[index]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(getattr(self._owner, self._slot))!r})"
+
+
+class EntitySetField:
+    """Descriptor exposing a tuple slot as an insertion-ordered set of entities.
+
+    The owning class must define a slot with the same name as the field, prefixed
+    with an underscore.
+    """
+
+    __slots__ = ("_slot",)
+
+    _slot: str
+    """The name of the owner's slot holding the entity tuple."""
+
+    def __init__(self) -> None:
+        self._slot = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._slot = f"_{name}"
+
+    @overload
+    def __get__(self, instance: None, owner: type) -> EntitySetField: ...
+
+    @overload
+    def __get__(self, instance: object, owner: type) -> EntityTupleSet: ...
+
+    def __get__(
+        self, instance: Optional[object], owner: type
+    ) -> EntitySetField | EntityTupleSet:
+        if instance is None:
+            return self
+
+        return EntityTupleSet(instance, self._slot)
+
+    def __set__(self, instance: object, value: Iterable[Entity]) -> None:
+        setattr(instance, self._slot, tuple(dict.fromkeys(value)))
+
+
 class Character(Component):
-    """A character that inhabits the world."""
+    """A character that inhabits the world.
+
+    Relationship collections (siblings, children, etc.) are stored as tuples and
+    exposed through EntitySetField descriptors. Most characters have few or no
+    entries in each collection, so this avoids allocating a container per field.
+    """
 
     __slots__ = (
         "first_name",
@@ -196,19 +322,19 @@ class Character(Component):
         "mother",
         "father",
         "biological_father",
-        "siblings",
-        "children",
-        "grandparents",
-        "grandchildren",
+        "_siblings",
+        "_children",
+        "_grandparents",
+        "_grandchildren",
         "spouse",
-        "former_spouses",
+        "_former_spouses",
         "marriage",
-        "past_marriages",
+        "_past_marriages",
         "betrothed_to",
         "betrothal",
-        "past_betrothals",
+        "_past_betrothals",
         "love_affair",
-        "past_love_affairs",
+        "_past_love_affairs",
         "lover",
         "is_alive",
         "family",
@@ -233,19 +359,19 @@ class Character(Component):
     mother: Optional[Entity]
     father: Optional[Entity]
     biological_father: Optional[Entity]
-    siblings: OrderedSet[Entity]
-    children: OrderedSet[Entity]
-    grandparents: OrderedSet[Entity]
-    grandchildren: OrderedSet[Entity]
+    _siblings: tuple[Entity, ...]
+    _children: tuple[Entity, ...]
+    _grandparents: tuple[Entity, ...]
+    _grandchildren: tuple[Entity, ...]
     spouse: Optional[Entity]
-    former_spouses: OrderedSet[Entity]
+    _former_spouses: tuple[Entity, ...]
     marriage: Optional[Entity]
-    past_marriages: OrderedSet[Entity]
+    _past_marriages: tuple[Entity, ...]
     betrothed_to: Optional[Entity]
     betrothal: Optional[Entity]
-    past_betrothals: OrderedSet[Entity]
+    _past_betrothals: tuple[Entity, ...]
     love_affair: Optional[Entity]
-    past_love_affairs: OrderedSet[Entity]
+    _past_love_affairs: tuple[Entity, ...]
     lover: Optional[Entity]
     is_alive: bool
     family: Optional[Entity]
@@ -256,6 +382,23 @@ class Character(Component):
     influence_points: int
     killed_by: Optional[Entity]
 
+    siblings = EntitySetField()
+    """The character's siblings."""
+    children = EntitySetField()
+    """The character's (biological and adopted) children."""
+    grandparents = EntitySetField()
+    """The character's grandparents."""
+    grandchildren = EntitySetField()
+    """The character's grandchildren."""
+    former_spouses = EntitySetField()
+    """Characters this character was previously married to."""
+    past_marriages = EntitySetField()
+    """Marriage entities from previous marriages."""
+    past_betrothals = EntitySetField()
+    """Betrothal entities from previous betrothals."""
+    past_love_affairs = EntitySetField()
+    """Love affair entities from previous affairs."""
+
     def __init__(
         self,
         first_name: str,
@@ -281,19 +424,19 @@ class Character(Component):
         self.mother = None
         self.father = None
         self.biological_father = None
-        self.siblings = OrderedSet([])
-        self.children = OrderedSet([])
-        self.grandparents = OrderedSet([])
-        self.grandchildren = OrderedSet([])
+        self._siblings = ()
+        self._children = ()
+        self._grandparents = ()
+        self._grandchildren = ()
         self.spouse = None
-        self.former_spouses = OrderedSet([])
+        self._former_spouses = ()
         self.marriage = None
-        self.past_marriages = OrderedSet([])
+        self._past_marriages = ()
         self.betrothed_to = None
         self.betrothal = None
-        self.past_betrothals = OrderedSet([])
+        self._past_betrothals = ()
         self.love_affair = None
-        self.past_love_affairs = OrderedSet([])
+        self._past_love_affairs = ()
         self.lover = None
         self.is_alive = True
         self.family = None
@@ -552,6 +695,8 @@ class FormerFamilyHead(Component):
 class Ruler(TagComponent):
     """Tags the character as the ruler of the land."""
 
+    __slots__ = ()
+
 
 class Dynasty(Component):
     """Information about a dynasty."""
@@ -652,6 +797,8 @@ class DynastyTracker:
 class Lifespan(StatComponent):
     """Tracks an entity's lifespan."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         calculation_strategy: IStatCalculationStrategy,
@@ -663,6 +810,8 @@ class Lifespan(StatComponent):
 class Fertility(StatComponent):
     """Tracks an entity's fertility."""
 
+    __slots__ = ()
+
     MAX_VALUE: int = 100
 
     def __init__(
@@ -676,6 +825,8 @@ class Fertility(StatComponent):
 class Stewardship(StatComponent):
     """Tracks an entity's stewardship."""
 
+    __slots__ = ()
+
     MAX_VALUE: int = 100
 
     def __init__(
@@ -689,6 +840,8 @@ class Stewardship(StatComponent):
 class Martial(StatComponent):
     """Tracks an entity's martial."""
 
+    __slots__ = ()
+
     MAX_VALUE: int = 100
 
     def __init__(
@@ -702,6 +855,8 @@ class Martial(StatComponent):
 class Intrigue(StatComponent):
     """Tracks an entity's intrigue."""
 
+    __slots__ = ()
+
     MAX_VALUE: int = 100
 
     def __init__(
@@ -715,6 +870,8 @@ class Intrigue(StatComponent):
 class Intelligence(StatComponent):
     """Tracks a character's intelligence stat."""
 
+    __slots__ = ()
+
     MAX_VALUE: int = 100
 
     def __init__(
@@ -728,6 +885,8 @@ class Intelligence(StatComponent):
 class Prowess(StatComponent):
     """Tracks an entityprowess."""
 
+    __slots__ = ()
+
     MAX_VALUE: int = 100
 
     def __init__(
@@ -741,6 +900,8 @@ class Prowess(StatComponent):
 class Sociability(StatComponent):
     """Tracks an entity's sociability."""
 
+    __slots__ = ()
+
     MAX_VALUE: int = 100
 
     def __init__(
@@ -754,6 +915,8 @@ class Sociability(StatComponent):
 class Honor(StatComponent):
     """Tracks an entityhonor."""
 
+    __slots__ = ()
+
     MAX_VALUE: int = 100
 
     def __init__(
@@ -767,6 +930,8 @@ class Honor(StatComponent):
 class Boldness(StatComponent):
     """Tracks an entity's boldness."""
 
+    __slots__ = ()
+
     MAX_VALUE: int = 100
 
     def __init__(
@@ -780,6 +945,8 @@ class Boldness(StatComponent):
 class Compassion(StatComponent):
     """Tracks an entity's compassion."""
 
+    __slots__ = ()
+
     MAX_VALUE: int = 100
 
     def __init__(
@@ -793,6 +960,8 @@ class Compassion(StatComponent):
 class Diplomacy(StatComponent):
     """Tracks an entitydiplomacy."""
 
+    __slots__ = ()
+
     MAX_VALUE: int = 100
 
     def __init__(
@@ -806,6 +975,8 @@ class Diplomacy(StatComponent):
 class Greed(StatComponent):
     """Tracks an entity's greed."""
 
+    __slots__ = ()
+
     MAX_VALUE: int = 100
 
     def __init__(
@@ -819,6 +990,8 @@ class Greed(StatComponent):
 class Rationality(StatComponent):
     """Tracks an entity's rationality."""
 
+    __slots__ = ()
+
     MAX_VALUE: int = 100
 
     def __init__(
@@ -832,6 +1005,8 @@ class Rationality(StatComponent):
 class Vengefulness(StatComponent):
     """Tracks an entity's vengefulness."""
 
+    __slots__ = ()
+
     MAX_VALUE: int = 100
 
     def __init__(
@@ -845,6 +1020,8 @@ class Vengefulness(StatComponent):
 class RomancePropensity(StatComponent):
     """Tracks an entity's propensity for romantic actions."""
 
+    __slots__ = ()
+
     MAX_VALUE: int = 100
 
     def __init__(
@@ -858,6 +1035,8 @@ class RomancePropensity(StatComponent):
 class Luck(StatComponent):
     """Tracks an entity's propensity to be successful."""
 
+    __slots__ = ()
+
     MAX_VALUE: int = 100
 
     def __init__(
@@ -871,6 +1050,8 @@ class Luck(StatComponent):
 class FamilyPrestige(StatComponent):
     """Tracks the prestige level of a family."""
 
+    __slots__ = ()
+
     MAX_VALUE = 999_999
 
     def __init__(
@@ -0,0 +1,215 @@
+"""In-memory genealogy index for fast kinship queries.
+
+The relations table in the simulation database records who is related to whom, but
+querying it requires a round-trip through SQLite, and the Character component only
+tracks relatives up to two generations away. The GenealogyIndex keeps parent/child
+adjacency for every character that has ever lived and memoizes each character's
+ancestors up to a configurable number of generations.
+
+Kinship degree is measured by counting generations up from each character to their
+closest common ancestor and summing the two distances. For example, parents and
+children are 1 degree apart, siblings and grandparents are 2 degrees apart, aunts and
+uncles are 3 degrees apart, and first cousins are 4 degrees apart.
+
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from minerva.ecs import Entity, EntityId
+
+
+class GenealogyIndex:
+    """Shared singleton that indexes parent/child links between characters."""
+
+    __slots__ = ("_max_depth", "_parents", "_children", "_ancestors")
+
+    _max_depth: int
+    """The max number of generations to search when collecting ancestors."""
+    _parents: dict[EntityId, set[EntityId]]
+    """Character UIDs mapped to the UIDs of their (biological or adoptive) parents."""
+    _children: dict[EntityId, set[EntityId]]
+    """Character UIDs mapped to the UIDs of their (biological or adoptive) children."""
+    _ancestors: dict[EntityId, dict[EntityId, int]]
+    """Memoized ancestors of characters mapped to their generational distance."""
+
+    def __init__(self, max_depth: int = 4) -> None:
+        if max_depth < 1:
+            raise ValueError("Genealogy max depth must be at least 1.")
+
+        self._max_depth = max_depth
+        self._parents = {}
+        self._children = {}
+        self._ancestors = {}
+
+    @property
+    def max_depth(self) -> int:
+        """The max number of generations to search when collecting ancestors."""
+        return self._max_depth
+
+    def add_parent(self, child: Entity, parent: Entity) -> None:
+        """Record that a character is the parent of another.
+
+        This is used for births and adoptions alike.
+        """
+        if child.uid == parent.uid:
+            raise ValueError(f"{child.name_with_uid} cannot be their own parent.")
+
+        child_parents = self._parents.setdefault(child.uid, set())
+
+        if parent.uid in child_parents:
+            return
+
+        child_parents.add(parent.uid)
+        self._children.setdefault(parent.uid, set()).add(child.uid)
+
+        self._invalidate_descendants(child.uid)
+
+    def remove_parent(self, child: Entity, parent: Entity) -> None:
+        """Remove a parent/child link between two characters."""
+        child_parents = self._parents.get(child.uid)
+
+        if child_parents is None or parent.uid not in child_parents:
+            return
+
+        child_parents.discard(parent.uid)
+        self._children[parent.uid].discard(child.uid)
+
+        self._invalidate_descendants(child.uid)
+
+    def get_parents(self, character: Entity) -> set[EntityId]:
+        """Get the UIDs of a character's parents."""
+        return set(self._parents.get(character.uid, ()))
+
+    def get_children(self, character: Entity) -> set[EntityId]:
+        """Get the UIDs of a character's children."""
+        return set(self._children.get(character.uid, ()))
+
+    def get_ancestors(self, character: Entity) -> dict[EntityId, int]:
+        """Get a character's ancestors mapped to how many generations back they are.
+
+        Parameters
+        ----------
+        character
+            The character to get the ancestors of.
+
+        Returns
+        -------
+        dict[EntityId, int]
+            Ancestor UIDs mapped to their generational distance (parents are 1,
+            grandparents are 2, etc.). Only ancestors within max_depth are included.
+        """
+        return dict(self._get_ancestors(character.uid))
+
+    def common_ancestors(
+        self, character_a: Entity, character_b: Entity
+    ) -> set[EntityId]:
+        """Get the UIDs of all ancestors shared by two characters."""
+        ancestors_a = self._get_ancestors(character_a.uid)
+        ancestors_b = self._get_ancestors(character_b.uid)
+
+        if len(ancestors_a) > len(ancestors_b):
+            ancestors_a, ancestors_b = ancestors_b, ancestors_a
+
+        return {uid for uid in ancestors_a if uid in ancestors_b}
+
+    def get_kinship_degree(
+        self, character_a: Entity, character_b: Entity
+    ) -> Optional[int]:
+        """Get the degree of kinship between two characters.
+
+        Returns
+        -------
+        int or None
+            The sum of generations between each character and their closest common
+            ancestor (or each other). None if the characters are not related within
+            the index's max depth.
+        """
+        uid_a = character_a.uid
+        uid_b = character_b.uid
+
+        if uid_a == uid_b:
+            return 0
+
+        ancestors_a = self._get_ancestors(uid_a)
+        ancestors_b = self._get_ancestors(uid_b)
+
+        degree: Optional[int] = None
+
+        # Direct descendants are related through one of the characters themself.
+        if uid_b in ancestors_a:
+            degree = ancestors_a[uid_b]
+
+        if uid_a in ancestors_b:
+            if degree is None or ancestors_b[uid_a] < degree:
+                degree = ancestors_b[uid_a]
+
+        if len(ancestors_a) > len(ancestors_b):
+            ancestors_a, ancestors_b = ancestors_b, ancestors_a
+
+        for uid, distance in ancestors_a.items():
+            other_distance = ancestors_b.get(uid)
+
+            if other_distance is None:
+                continue
+
+            total = distance + other_distance
+
+            if degree is None or total < degree:
+                degree = total
+
+        return degree
+
+    def are_related(
+        self, character_a: Entity, character_b: Entity, max_degree: int
+    ) -> bool:
+        """Check if two characters are related within a given degree of kinship."""
+        degree = self.get_kinship_degree(character_a, character_b)
+
+        return degree is not None and degree <= max_degree
+
+    def _get_ancestors(self, uid: EntityId) -> dict[EntityId, int]:
+        """Get (and memoize) the ancestors of the character with the given UID."""
+        if (cached := self._ancestors.get(uid)) is not None:
+            return cached
+
+        ancestors: dict[EntityId, int] = {}
+
+        # Registered before recursing so that malformed (cyclic) adoption chains
+        # terminate instead of recursing forever.
+        self._ancestors[uid] = ancestors
+
+        for parent_uid in self._parents.get(uid, ()):
+            ancestors[parent_uid] = 1
+
+            if self._max_depth == 1:
+                continue
+
+            for ancestor_uid, distance in self._get_ancestors(parent_uid).items():
+                distance += 1
+
+                if distance > self._max_depth:
+                    continue
+
+                if distance < ancestors.get(ancestor_uid, distance + 1):
+                    ancestors[ancestor_uid] = distance
+
+        return ancestors
+
+    def _invalidate_descendants(self, uid: EntityId) -> None:
+        """Clear memoized ancestors for a character and their descendants."""
+        frontier: list[EntityId] = [uid]
+
+        # Descendants further than max_depth generations never see the change.
+        for _ in range(self._max_depth):
+            next_frontier: list[EntityId] = []
+
+            for descendant_uid in frontier:
+                self._ancestors.pop(descendant_uid, None)
+                next_frontier.extend(self._children.get(descendant_uid, ()))
+
+            if not next_frontier:
+                break
+
+            frontier = next_frontier
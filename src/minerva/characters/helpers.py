@@ -28,6 +28,7 @@ from minerva.characters.components import (
     Stewardship,
     Betrothal,
 )
+from minerva.characters.genealogy import GenealogyIndex
 from minerva.characters.metric_data import CharacterMetrics
 from minerva.characters.succession_helpers import (
     remove_current_ruler,
@@ -35,14 +36,29 @@ from minerva.characters.succession_helpers import (
 from minerva.characters.war_helpers import end_alliance
 from minerva.config import Config
 from minerva.datetime import SimDate
-from minerva.ecs import Active, Entity
+from minerva.ecs import Entity
 from minerva.relationships.helpers import deactivate_relationships
 from minerva.sim_db import SimDB
 from minerva.world_map.components import Territory
-from minerva.world_map.helpers import set_territory_controlling_family
+from minerva.world_map.helpers import (
+    remove_political_influence,
+    set_political_influence,
+    set_territory_controlling_family,
+)
+from minerva.world_map.territory_index import TerritoryIndex
 
 _logger = logging.getLogger(__name__)
 
+SimDB.register_query(
+    "character_relations",
+    """
+    SELECT target_id
+    FROM relations
+    WHERE character_id=? AND relation_type=?;
+    """,
+    ("relations",),
+)
+
 
 # ===================================
 # Family Functions
@@ -185,8 +201,7 @@ def set_family_home_base(family: Entity, territory: Optional[Entity]) -> None:
         territory_component.families.remove(family)
         family_component.home_base = None
         cur.execute("""UPDATE families SET home_base_id=NULL WHERE uid=?""", (family,))
-        if family in territory_component.political_influence:
-            del territory_component.political_influence[family]
+        remove_political_influence(former_home_base, family)
 
     if territory is not None:
         territory_component = territory.get_component(Territory)
@@ -197,7 +212,7 @@ def set_family_home_base(family: Entity, territory: Optional[Entity]) -> None:
             (territory.uid, family),
         )
         if family not in territory_component.political_influence:
-            territory_component.political_influence[family] = 0
+            set_political_influence(territory, family, 0)
 
     db.commit()
 
@@ -233,12 +248,13 @@ def remove_family_from_play(family: Entity) -> None:
     # Remove the family from play
     set_family_home_base(family, None)
 
-    for _, (territory, _) in world.query_components((Territory, Active)):
-        if family in territory.political_influence:
-            del territory.political_influence[family]
+    territory_index = world.get_resource(TerritoryIndex)
 
-        if territory.controlling_family == family:
-            set_territory_controlling_family(territory.entity, None)
+    for territory in territory_index.get_territories_present_in(family):
+        remove_political_influence(territory, family)
+
+    for territory in territory_index.get_controlled_territories(family):
+        set_territory_controlling_family(territory, None)
 
     family.deactivate()
 
@@ -723,18 +739,9 @@ def unset_relation(
 def get_relations(character: Entity, relation_type: RelationType) -> list[Entity]:
     """Get all characters related to the given character by the provided relation."""
     world = character.world
-    db = world.get_resource(SimDB).db
+    db = world.get_resource(SimDB)
 
-    cursor = db.cursor()
-
-    result = cursor.execute(
-        """
-        SELECT target_id
-        FROM relations
-        WHERE character_id=? AND relation_type=?;
-        """,
-        (character.uid, relation_type.name),
-    ).fetchall()
+    result = db.query("character_relations", (character.uid, relation_type.name))
 
     output = [world.get_entity(r) for (r,) in result]
 
@@ -745,12 +752,15 @@ def set_character_mother(character: Entity, mother: Optional[Entity]) -> None:
     """Set the mother of a character."""
 
     character_component = character.get_component(Character)
+    genealogy = character.world.get_resource(GenealogyIndex)
 
     if character_component.mother is not None:
+        genealogy.remove_parent(character, character_component.mother)
         character_component.mother = None
 
     if mother is not None:
         character_component.mother = mother
+        genealogy.add_parent(character, mother)
 
     if mother is not None:
         set_relation(character, mother, RelationType.MOTHER)
@@ -759,9 +769,18 @@ def set_character_mother(character: Entity, mother: Optional[Entity]) -> None:
 def set_character_father(character: Entity, father: Optional[Entity]) -> None:
     """Set the father of a character."""
 
-    character.get_component(Character).father = father
+    character_component = character.get_component(Character)
+    genealogy = character.world.get_resource(GenealogyIndex)
+
+    if character_component.father is not None:
+        # Keep the parent link if the previous father is still the biological father
+        if character_component.father != character_component.biological_father:
+            genealogy.remove_parent(character, character_component.father)
+        character_component.father = None
 
     if father is not None:
+        character_component.father = father
+        genealogy.add_parent(character, father)
         set_relation(character, father, RelationType.FATHER)
 
 
@@ -770,9 +789,18 @@ def set_character_biological_father(
 ) -> None:
     """Set the biological father of a character."""
 
-    character.get_component(Character).biological_father = father
+    character_component = character.get_component(Character)
+    genealogy = character.world.get_resource(GenealogyIndex)
+
+    if character_component.biological_father is not None:
+        # Keep the parent link if the previous biological father is still the father
+        if character_component.biological_father != character_component.father:
+            genealogy.remove_parent(character, character_component.biological_father)
+        character_component.biological_father = None
 
     if father is not None:
+        character_component.biological_father = father
+        genealogy.add_parent(character, father)
         set_relation(character, father, RelationType.FATHER)
 
 
@@ -1053,6 +1081,8 @@ def set_relation_child(character: Entity, child: Entity) -> None:
 
     character.get_component(Character).children.append(child)
 
+    character.world.get_resource(GenealogyIndex).add_parent(child, character)
+
     set_relation(character, child, RelationType.CHILD)
 
 
@@ -1,15 +1,20 @@
 """Helper Functions and Data Types for working with character-related stats."""
 
 import enum
+import math
 
 from minerva.characters.components import (
+    Character,
     Intelligence,
+    Lifespan,
     Luck,
     Martial,
     Prowess,
     Stewardship,
 )
+from minerva.datetime import MONTHS_PER_YEAR
 from minerva.ecs import Entity
+from minerva.scheduler import schedule_wake
 
 EXCELLENT_STAT_THRESHOLD = 85
 GOOD_STAT_THRESHOLD = 20
@@ -105,3 +110,19 @@ def get_prowess_level(character: Entity) -> StatLevel:
         return StatLevel.BAD
     else:
         return StatLevel.TERRIBLE
+
+
+def schedule_lifespan_check(character: Entity) -> None:
+    """Schedule when the CharacterLifespanSystem should next check a character.
+
+    This should be called whenever a character's lifespan might have decreased. The
+    check is scheduled a month early to account for aging happening before or after
+    the caller within the same time step.
+    """
+    remaining_years = (
+        character.get_component(Lifespan).value - character.get_component(Character).age
+    )
+
+    schedule_wake(
+        Lifespan, character, math.floor(remaining_years * MONTHS_PER_YEAR) - 1
+    )
@@ -17,6 +17,12 @@ class Config(pydantic.BaseModel):
     """Value used for pseudo-random number generation."""
     db_path: str = ":memory:"
     """Path to the sqlite database instance."""
+    entity_archive_interval: int = 12
+    """Months between passes that evict inactive entities to cold storage (0=off)."""
+    system_worker_threads: int = 0
+    """Threads used to update non-conflicting systems concurrently (<2 = serial)."""
+    verify_system_access: bool = False
+    """(Debug) Raise errors when systems access types they did not declare."""
 
     # === LOGGING ===
 
@@ -28,6 +34,12 @@ class Config(pydantic.BaseModel):
     """Toggles if logging output should be save to this file name in log_directory."""
     log_to_terminal: bool = True
     """Toggles if logs should be printed to the terminal or saved to a file."""
+    materialize_life_event_descriptions: bool = True
+    """Toggles if life event descriptions are rendered and stored when logged."""
+    history_stream_target: str = ""
+    """Where to stream new history rows each tick ('-', 'unix:<path>', or a path)."""
+    history_stream_format: str = "ndjson"
+    """The record format of the history stream ('ndjson' or 'length_prefixed')."""
 
     # === INITIAL GENERATION ===
 
@@ -58,6 +70,8 @@ class Config(pydantic.BaseModel):
     """Display debug outputs."""
     sim_update_frequency: int = 12
     """Number of simulation steps per second."""
+    sim_worker_thread: bool = False
+    """Step the simulation on a background thread instead of the render loop."""
     background_color: str = "#42ACAF"
     """Background color of the pygame window."""
 
@@ -73,6 +87,10 @@ class Config(pydantic.BaseModel):
     """The starting number of influence points given to each character."""
     behavior_utility_threshold: float = 0.01
     """The required utility score for a behavior to be considered."""
+    genealogy_max_depth: int = 4
+    """The max number of generations tracked when searching for common ancestors."""
+    max_marriage_kinship_degree: int = 4
+    """Characters related within this degree of kinship cannot marry (cousins are 4)."""
 
     # === Family Settings ===
 
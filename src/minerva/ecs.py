@@ -12,7 +12,10 @@ for the base ECS design goes to the esper library (referenced below).
 Please check them out if you're looking for something more general-purpose.
 
 This ECS implementation is not thread-safe. It assumes that everything happens
-sequentially on the same thread.
+sequentially on the same thread. The one exception is systems that declare the
+component types and resources they read and write. When a world has system worker
+threads, neighboring systems with non-conflicting declarations may be updated
+concurrently.
 
 There is no external documentation for this ECS. All public classes,
 properties, and methods have doc comments to help ease confusion.
@@ -29,14 +32,26 @@ References:
 from __future__ import annotations
 
 import dataclasses
+import heapq
+import io
+import operator
+import pickle
+import threading
+import zlib
 from abc import ABC, abstractmethod
-from queue import PriorityQueue
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     Any,
+    Callable,
     ClassVar,
     Generator,
+    Generic,
+    Hashable,
     Iterator,
+    Literal,
     Optional,
+    Sequence,
     Type,
     TypeVar,
     Union,
@@ -52,19 +67,36 @@ _ST = TypeVar("_ST", bound="System")
 EntityId = int
 """Type alias int to entity ID."""
 
+_SLOT_BITS = 32
+"""The number of low bits of an entity ID that hold its slot index."""
+_SLOT_MASK = (1 << _SLOT_BITS) - 1
+"""Mask that extracts the slot index from an entity ID."""
+
 
 class Entity:
-    """A reference to an entity within the world."""
+    """A reference to an entity within the world.
+
+    The world creates one Entity instance per UID and reuses it for the lifetime
+    of the entity, including while the entity is in cold storage.
+
+    UIDs are generational indices. The low bits hold the index of the slot the
+    entity occupies in the world, and the high bits hold how many times that slot
+    has been reused. Slots are recycled once destroyed entities are cleared, but the
+    generation ensures that a UID is never given to two different entities.
+    """
 
     __slots__ = (
         "_uid",
         "world",
+        "_components",
     )
 
     _uid: EntityId
     """The unique ID of this entity."""
     world: World
     """The world instance this entity belongs to."""
+    _components: Optional[dict[Type[Component], Component]]
+    """The entity's component data (None if not spawned, archived, or destroyed)."""
 
     def __init__(
         self,
@@ -73,12 +105,23 @@ class Entity:
     ) -> None:
         self._uid = uid
         self.world = world
+        self._components = None
 
     @property
     def uid(self) -> EntityId:
         """The entity's unique ID."""
         return self._uid
 
+    @property
+    def slot(self) -> int:
+        """The index of the world slot the entity occupies."""
+        return self._uid & _SLOT_MASK
+
+    @property
+    def generation(self) -> int:
+        """The number of times the entity's slot was used before this entity."""
+        return self._uid >> _SLOT_BITS
+
     @property
     def name(self) -> str:
         """The entity's name."""
@@ -126,11 +169,26 @@ class Entity:
 
     def get_component(self, component_type: Type[_CT]) -> _CT:
         """Get a component with the given type."""
-        return self.world.get_component(self, component_type)
+        # pylint: disable=protected-access
+        components = self._components
+
+        if components is not None and not self.world._verify_access:
+            component = components.get(component_type)
+
+            if component is not None:
+                return component  # type: ignore
+
+        return self.world.get_component(self._uid, component_type)
 
     def has_component(self, component_type: Type[Component]) -> bool:
         """Check if this entity has a component."""
-        return self.world.has_component(self, component_type)
+        # pylint: disable=protected-access
+        components = self._components
+
+        if components is not None and not self.world._verify_access:
+            return component_type in components
+
+        return self.world.has_component(self._uid, component_type)
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, Entity):
@@ -173,6 +231,8 @@ class Component(ABC):
 class TagComponent(Component):
     """An Empty component used to mark a entity as having a state or type."""
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         return self.__class__.__name__
 
@@ -183,6 +243,8 @@ class TagComponent(Component):
 class Active(TagComponent):
     """Tags a entity as active within the simulation."""
 
+    __slots__ = ()
+
 
 class System(ABC):
     """Base class for systems, providing implementation for most lifecycle methods."""
@@ -193,6 +255,19 @@ class System(ABC):
     """The system group the system will be added to."""
     __update_order__: ClassVar[tuple[str, ...]] = ()
     """Ordering constraints for when the system should be update."""
+    __tick_interval__: ClassVar[int] = 1
+    """The number of ticks between updates."""
+    __tick_phase__: ClassVar[int] = 0
+    """The tick (modulo the interval) on which the system updates."""
+    __stagger_entities__: ClassVar[bool] = False
+    """Update every tick but spread entity work evenly across the interval."""
+    __reads__: ClassVar[Optional[tuple[Type[Any], ...]]] = None
+    """Component and resource types the system reads (None if undeclared)."""
+    __writes__: ClassVar[Optional[tuple[Type[Any], ...]]] = None
+    """Component and resource types the system writes (None if undeclared).
+
+    Include Entity to create, destroy, activate, or deactivate entities.
+    """
 
     __slots__ = ("_active",)
 
@@ -264,21 +339,121 @@ class System(ABC):
         """Get the tuple of update order constraints."""
         return cls.__update_order__
 
+    @classmethod
+    def tick_interval(cls) -> int:
+        """Get the number of ticks between updates."""
+        return cls.__tick_interval__
+
+    @classmethod
+    def tick_phase(cls) -> int:
+        """Get the tick (modulo the interval) on which the system updates."""
+        return cls.__tick_phase__ % max(1, cls.__tick_interval__)
+
+    @classmethod
+    def declares_access(cls) -> bool:
+        """Check if the system declares the types it reads and writes."""
+        return cls.__reads__ is not None or cls.__writes__ is not None
+
+    @classmethod
+    def reads(cls) -> frozenset[Type[Any]]:
+        """Get the types the system reads, including those it writes."""
+        return frozenset(cls.__reads__ or ()) | frozenset(cls.__writes__ or ())
+
+    @classmethod
+    def writes(cls) -> frozenset[Type[Any]]:
+        """Get the types the system writes."""
+        return frozenset(cls.__writes__ or ())
+
+    @classmethod
+    def conflicts_with(cls, other: Type[System]) -> bool:
+        """Check if the system and another system may not be updated concurrently.
+
+        Systems conflict when either one has not declared its access or when one
+        writes a type that the other reads or writes.
+
+        Parameters
+        ----------
+        other
+            The type of the other system.
+
+        Returns
+        -------
+        bool
+            True if the systems conflict.
+        """
+        if not cls.declares_access() or not other.declares_access():
+            return True
+
+        return bool(cls.writes() & other.reads()) or bool(other.writes() & cls.reads())
+
+    def is_scheduled(self, tick: int) -> bool:
+        """Check if the system should update on the given tick.
+
+        Parameters
+        ----------
+        tick
+            The number of steps the world has completed.
+
+        Returns
+        -------
+        bool
+            True if the system should update.
+        """
+        interval = self.__tick_interval__
+
+        if interval <= 1 or self.__stagger_entities__:
+            return True
+
+        return tick % interval == self.tick_phase()
+
+    def is_entity_scheduled(self, world: World, entity: Entity) -> bool:
+        """Check if a staggered system should process an entity this tick.
+
+        Entity k is processed on ticks where (tick - phase) mod interval equals
+        k mod interval, so each entity is still processed once per interval while
+        the work is spread evenly across ticks.
+
+        Parameters
+        ----------
+        world
+            The world instance the system is updating.
+        entity
+            The entity to check.
+
+        Returns
+        -------
+        bool
+            True if the entity should be processed this tick.
+        """
+        interval = self.__tick_interval__
+
+        if interval <= 1 or not self.__stagger_entities__:
+            return True
+
+        return entity.uid % interval == (world.tick - self.tick_phase()) % interval
+
 
 class SystemGroup(System, ABC):
     """A group of ECS systems that run as a unit.
 
     SystemGroups allow users to better structure the execution order of their systems.
+    Children are sorted lazily, the next time the group is updated or iterated.
     """
 
-    __slots__ = ("_children",)
+    __slots__ = ("_children", "_stages", "_is_sorted")
 
     _children: list[System]
     """The systems that belong to this group"""
+    _stages: Optional[list[list[System]]]
+    """Children batched into stages that may be updated concurrently."""
+    _is_sorted: bool
+    """Are the children in topologically sorted order."""
 
     def __init__(self) -> None:
         super().__init__()
         self._children = []
+        self._stages = None
+        self._is_sorted = True
 
     def set_active(self, value: bool) -> None:
         super().set_active(value)
@@ -293,6 +468,9 @@ class SystemGroup(System, ABC):
         Iterator[System]
             An iterator for the child system collection.
         """
+        if not self._is_sorted:
+            self.sort_children()
+
         return iter(self._children)
 
     def add_child(self, system: System) -> None:
@@ -304,6 +482,8 @@ class SystemGroup(System, ABC):
             The system to add to this group.
         """
         self._children.append(system)
+        self._stages = None
+        self._is_sorted = False
 
     def remove_child(self, system_type: Type[System]) -> None:
         """Remove a child system.
@@ -322,6 +502,7 @@ class SystemGroup(System, ABC):
 
         if children_to_remove:
             self._children.remove(children_to_remove[0])
+            self._stages = None
 
     def on_update(self, world: World) -> None:
         """Run all sub-systems.
@@ -331,16 +512,39 @@ class SystemGroup(System, ABC):
         world
             The world instance the system is updating
         """
-        for child in self._children:
-            if child.is_active:
-                child.on_update(world)
+        tick = world.tick
+
+        if not self._is_sorted:
+            self.sort_children()
+
+        # pylint: disable=protected-access
+        if not world._has_system_workers():
+            for child in self._children:
+                if child.is_active and child.is_scheduled(tick):
+                    world._update_system(child)
+                    world.commands.apply()
+            return
+
+        if self._stages is None:
+            self._stages = SystemGroup._build_stages(self._children)
+
+        for stage in self._stages:
+            world._update_systems(
+                [
+                    child
+                    for child in stage
+                    if child.is_active and child.is_scheduled(tick)
+                ]
+            )
 
     def sort_children(self) -> None:
         """Performs topologically sort child systems."""
         self._children = SystemGroup._topological_sort(self._children)
+        self._stages = None
+        self._is_sorted = True
 
         for child in self._children:
-            if isinstance(child, SystemGroup):
+            if isinstance(child, SystemGroup) and not child._is_sorted:
                 child.sort_children()
 
     @dataclasses.dataclass
@@ -353,33 +557,48 @@ class SystemGroup(System, ABC):
     @dataclasses.dataclass(order=True)
     class _NodeQueueEntry:
         priority: int
+        index: int
         item: SystemGroup._SystemSortNode = dataclasses.field(compare=False)
 
     @staticmethod
-    def _get_incoming_edges(
-        edges: list[
-            tuple[
-                str,
-                str,
-            ]
-        ],
-        node: _SystemSortNode,
-    ) -> list[str]:
-        """Get incoming edges for a node in a system sorting graph."""
-        return [n for n, m in edges if m == node.system.system_name()]
+    def _build_stages(systems: list[System]) -> list[list[System]]:
+        """Batch sorted systems into stages of systems that may run concurrently.
+
+        Neighboring systems share a stage when their declared reads and writes do
+        not conflict and neither has an ordering constraint that names the other.
+        Stages keep the sorted order, so conflicting systems still update in the
+        same order as they would serially.
+        """
+        stages: list[list[System]] = []
+
+        for system in systems:
+            if stages and all(
+                SystemGroup._can_run_concurrently(system, other) for other in stages[-1]
+            ):
+                stages[-1].append(system)
+            else:
+                stages.append([system])
+
+        return stages
 
     @staticmethod
-    def _get_outgoing_edges(
-        edges: list[
-            tuple[
-                str,
-                str,
-            ]
-        ],
-        node: _SystemSortNode,
-    ) -> list[str]:
-        """Get outgoing edges for a node in a system sorting graph."""
-        return [m for n, m in edges if n == node.system.system_name()]
+    def _can_run_concurrently(system: System, other: System) -> bool:
+        """Check if two systems may be updated at the same time."""
+        if isinstance(system, SystemGroup) or isinstance(other, SystemGroup):
+            return False
+
+        if type(system).conflicts_with(type(other)):
+            return False
+
+        for constraint in system.update_order():
+            if constraint.split(":")[-1].strip() == other.system_name():
+                return False
+
+        for constraint in other.update_order():
+            if constraint.split(":")[-1].strip() == system.system_name():
+                return False
+
+        return True
 
     @staticmethod
     def _topological_sort(systems: list[System]) -> list[System]:
@@ -420,48 +639,47 @@ class SystemGroup(System, ABC):
 
             nodes[system.system_name()] = node
 
-        # Remove edges missing nodes
-        for i in reversed(range(len(edges))):
-            _n, _m = edges[i]
+        # Index the edges between nodes in this group, ignoring the rest.
+        indices = {name: i for i, name in enumerate(nodes)}
+        in_degrees = dict.fromkeys(nodes, 0)
+        dependents: dict[str, list[str]] = {name: [] for name in nodes}
 
-            if _n not in nodes:
-                edges.pop(i)
-                continue
-
-            if _m not in nodes:
-                edges.pop(i)
-                continue
+        for _n, _m in edges:
+            if _n in nodes and _m in nodes:
+                dependents[_n].append(_m)
+                in_degrees[_m] += 1
 
         result: list[System] = []
 
-        # Get all nodes with no incoming edges.
-        starting_nodes = [
-            node
-            for node in nodes.values()
-            if len(SystemGroup._get_incoming_edges(edges, node)) == 0
+        # Nodes with the same priority keep their relative order, so sorting an
+        # already sorted list of systems does not change it.
+        node_queue: list[SystemGroup._NodeQueueEntry] = [
+            SystemGroup._NodeQueueEntry(
+                priority=node.order, index=indices[name], item=node
+            )
+            for name, node in nodes.items()
+            if in_degrees[name] == 0
         ]
+        heapq.heapify(node_queue)
 
-        node_queue: PriorityQueue[SystemGroup._NodeQueueEntry] = PriorityQueue()
-        for node in starting_nodes:
-            node_queue.put(SystemGroup._NodeQueueEntry(priority=node.order, item=node))
-
-        while not node_queue.empty():
-            entry = node_queue.get()
-            node = entry.item
+        while node_queue:
+            node = heapq.heappop(node_queue).item
             result.append(node.system)
 
-            for dependent_name in SystemGroup._get_outgoing_edges(edges, node):
-                dependent = nodes[dependent_name]
-                edges.remove((node.system.system_name(), dependent_name))
+            for dependent_name in dependents[node.system.system_name()]:
+                in_degrees[dependent_name] -= 1
 
-                if len(SystemGroup._get_incoming_edges(edges, dependent)) == 0:
-                    node_queue.put(
+                if in_degrees[dependent_name] == 0:
+                    heapq.heappush(
+                        node_queue,
                         SystemGroup._NodeQueueEntry(
-                            priority=dependent.order, item=dependent
-                        )
+                            priority=nodes[dependent_name].order,
+                            index=indices[dependent_name],
+                            item=nodes[dependent_name],
+                        ),
                     )
 
-        if edges:
+        if len(result) < len(nodes):
             raise ValueError("System ordering contains a dependency cycle.")
 
         return result
@@ -507,14 +725,20 @@ class LateUpdateSystems(SystemGroup):
 class SystemManager(SystemGroup):
     """Manages system instances for a single world instance."""
 
-    __slots__ = ("_world",)
+    __slots__ = ("_world", "_systems_by_type", "_groups_by_name")
 
     _world: World
     """The world instance associated with the SystemManager."""
+    _systems_by_type: dict[Type[System], System]
+    """System types mapped to their instance in the tree."""
+    _groups_by_name: dict[str, SystemGroup]
+    """System group names mapped to their instance in the tree."""
 
     def __init__(self, world: World) -> None:
         super().__init__()
         self._world = world
+        self._systems_by_type = {}
+        self._groups_by_name = {self.system_name(): self}
 
     def add_system(
         self,
@@ -527,26 +751,24 @@ class SystemManager(SystemGroup):
         system
             The system to add.
         """
+        group = self._groups_by_name.get(system.system_group())
 
-        stack: list[SystemGroup] = [self]
-        success: bool = False
+        if group is None:
+            raise KeyError(f"Could not find system group: {system.system_group()}.")
 
-        while stack:
-            current_sys = stack.pop()
+        group.add_child(system)
+        self._register_system(system)
+        system.on_add(self._world)
 
-            if current_sys.system_name() == system.system_group():
-                current_sys.add_child(system)
-                success = True
-                break
+    def _register_system(self, system: System) -> None:
+        """Add a system and any children it has to the lookup tables."""
+        self._systems_by_type.setdefault(type(system), system)
 
-            for child in current_sys.iter_children():
-                if isinstance(child, SystemGroup):
-                    stack.append(child)
+        if isinstance(system, SystemGroup):
+            self._groups_by_name.setdefault(system.system_name(), system)
 
-        if success:
-            self.sort_children()
-        else:
-            raise KeyError(f"Could not find system group: {system.system_group()}.")
+            for child in system._children:
+                self._register_system(child)
 
     def get_system(self, system_type: Type[_ST]) -> _ST:
         """Attempt to get a System of the given type.
@@ -561,19 +783,15 @@ class SystemManager(SystemGroup):
         _ST or None
             The system instance if one is found.
         """
-        stack: list[tuple[SystemGroup, System]] = [
-            (self, child) for child in self._children
-        ]
-
-        while stack:
-            _, current_sys = stack.pop()
+        system = self._systems_by_type.get(system_type)
 
-            if isinstance(current_sys, system_type):
-                return current_sys
+        if system is not None:
+            return system  # type: ignore
 
-            if isinstance(current_sys, SystemGroup):
-                for child in current_sys.iter_children():
-                    stack.append((current_sys, child))
+        # Fall back to matching subclasses of the given type.
+        for system in self._systems_by_type.values():
+            if isinstance(system, system_type):
+                return system
 
         raise KeyError(f"Could not find system with type: {system_type}.")
 
@@ -611,11 +829,243 @@ class SystemManager(SystemGroup):
                     for child in current_sys.iter_children():
                         stack.append((current_sys, child))
 
+        self._systems_by_type.clear()
+        self._groups_by_name = {self.system_name(): self}
+
+        for child in self._children:
+            self._register_system(child)
+
     def update_systems(self) -> None:
         """Update all systems in the manager."""
         self.on_update(self._world)
 
 
+class ResourceHandle(Generic[_RT]):
+    """A reference to a world resource that stays current as resources change.
+
+    Resolving a handle is a single attribute access instead of a dictionary lookup
+    through the world. Systems and long-lived helper objects can get a handle once
+    and use it in hot loops. Handles are not checked by access verification, so
+    systems that declare their reads and writes must still declare the resource.
+    """
+
+    __slots__ = ("resource_type", "value")
+
+    resource_type: Type[_RT]
+    """The class of the resource."""
+    value: _RT
+    """The resource instance. Unset while the world does not have the resource."""
+
+    def __init__(self, resource_type: Type[_RT]) -> None:
+        self.resource_type = resource_type
+
+
+class CommandBuffer:
+    """Records structural changes to a world and applies them in a batch.
+
+    Creating and destroying entities or adding and removing components while a
+    query is being iterated can invalidate the query. Systems can record these
+    changes instead and the world applies them at the next sync point (after the
+    current system finishes updating). Consecutive commands of the same kind and
+    component type are applied together with a single update to each index.
+    """
+
+    __slots__ = ("_world", "_commands")
+
+    _world: World
+    """The world the commands are applied to."""
+    _commands: list[tuple[Any, ...]]
+    """Recorded commands in the order they were issued."""
+
+    def __init__(self, world: World) -> None:
+        self._world = world
+        self._commands = []
+
+    def __len__(self) -> int:
+        return len(self._commands)
+
+    def spawn(
+        self, components: Optional[list[Component]] = None, name: str = ""
+    ) -> Entity:
+        """Record the creation of a new entity.
+
+        Parameters
+        ----------
+        components
+            A collection of component instances to add to the entity.
+        name
+            A name to give the entity.
+
+        Returns
+        -------
+        Entity
+            A reference to the entity. Its UID is reserved immediately so that it
+            can be used in other commands, but it has no components until the
+            commands are applied.
+        """
+        # pylint: disable=protected-access
+        if self._world._verify_access:
+            self._world._check_access(Entity, write=True)
+
+        entity = self._world._reserve_entity()
+        self._commands.append(("spawn", None, entity, (name, components or [])))
+        return entity
+
+    def destroy(self, entity: Entity) -> None:
+        """Record the removal of an entity from the world."""
+        # pylint: disable=protected-access
+        if self._world._verify_access:
+            self._world._check_access(Entity, write=True)
+
+        self._commands.append(("destroy", None, entity, None))
+
+    def add_component(self, entity: Entity, component: Component) -> None:
+        """Record adding a component to an entity."""
+        # pylint: disable=protected-access
+        if self._world._verify_access:
+            self._world._check_access(type(component), write=True)
+
+        self._commands.append(("add", type(component), entity, component))
+
+    def remove_component(self, entity: Entity, component_type: Type[Component]) -> None:
+        """Record removing a component from an entity."""
+        # pylint: disable=protected-access
+        if self._world._verify_access:
+            self._world._check_access(component_type, write=True)
+
+        self._commands.append(("remove", component_type, entity, None))
+
+    def apply(self) -> None:
+        """Apply all recorded commands in order and clear the buffer."""
+        # pylint: disable=protected-access
+        commands, self._commands = self._commands, []
+        world = self._world
+
+        start = 0
+
+        while start < len(commands):
+            kind, component_type = commands[start][0], commands[start][1]
+            end = start + 1
+
+            while (
+                end < len(commands)
+                and commands[end][0] == kind
+                and commands[end][1] is component_type
+            ):
+                end += 1
+
+            batch = commands[start:end]
+
+            if kind == "spawn":
+                world._spawn_entities(
+                    [(entity, args[0], args[1]) for _, _, entity, args in batch]
+                )
+            elif kind == "destroy":
+                for _, _, entity, _ in batch:
+                    world.destroy(entity)
+            elif kind == "add":
+                world._add_components(
+                    component_type, [(e, component) for _, _, e, component in batch]
+                )
+            else:
+                world._remove_components(component_type, [e for _, _, e, _ in batch])
+
+            start = end
+
+
+class _ComponentObserver:
+    """A listener for components of one type being added to or removed from entities."""
+
+    __slots__ = ("listener", "batched", "changes")
+
+    listener: Callable[..., None]
+    """The function called with each change, or with a list of batched changes."""
+    batched: bool
+    """Are changes collected and delivered together at the end of each step."""
+    changes: list[tuple[Entity, Component]]
+    """Batched changes waiting to be delivered."""
+
+    def __init__(self, listener: Callable[..., None], batched: bool) -> None:
+        self.listener = listener
+        self.batched = batched
+        self.changes = []
+
+    def notify(self, entity: Entity, component: Component) -> None:
+        """Deliver or record a change."""
+        if self.batched:
+            self.changes.append((entity, component))
+        else:
+            self.listener(entity, component)
+
+
+_ARCHIVE_VALUE_TYPES = frozenset(
+    (type(None), bool, int, float, str, bytes, tuple, list, dict, set, frozenset)
+)
+"""Types that are always archived by value."""
+
+
+class _ArchivePickler(pickle.Pickler):
+    """Pickles entity components while keeping references to shared objects.
+
+    Entities, the world, resources, and registered persistent types are stored as
+    references and resolved again when the components are restored.
+    """
+
+    def __init__(self, file: io.BytesIO, world: World) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._world = world
+
+    def persistent_id(self, obj: Any) -> Any:
+        # pylint: disable=protected-access
+        obj_type = type(obj)
+
+        if obj_type in _ARCHIVE_VALUE_TYPES:
+            return None
+
+        if obj_type is Entity:
+            return ("entity", obj.uid)
+
+        if obj is self._world:
+            return ("world", None)
+
+        if self._world._resources.get(obj_type) is obj:
+            return ("resource", obj_type)
+
+        if (persistent_type := self._world._persistent_types.get(obj_type)) is not None:
+            return ("shared", (obj_type, persistent_type[0](obj)))
+
+        return None
+
+
+class _ArchiveUnpickler(pickle.Unpickler):
+    """Restores components pickled by an _ArchivePickler."""
+
+    def __init__(self, file: io.BytesIO, world: World) -> None:
+        super().__init__(file)
+        self._world = world
+
+    def persistent_load(self, pid: Any) -> Any:
+        # pylint: disable=protected-access
+        tag, value = pid
+
+        if tag == "entity":
+            # Archived entities are not restored until their data is accessed.
+            entity = self._world._get_slot_entity(value)
+            return entity if entity is not None else Entity(value, self._world)
+
+        if tag == "world":
+            return self._world
+
+        if tag == "resource":
+            return self._world.get_resource(value)
+
+        if tag == "shared":
+            obj_type, key = value
+            return self._world._persistent_types[obj_type][1](self._world, key)
+
+        raise pickle.UnpicklingError(f"Unsupported persistent ID: {tag}.")
+
+
 _T1 = TypeVar("_T1", bound=Component)
 _T2 = TypeVar("_T2", bound=Component)
 _T3 = TypeVar("_T3", bound=Component)
@@ -631,43 +1081,331 @@ class World:
 
     __slots__ = (
         "_systems",
-        "_next_entity_id",
+        "_tick",
+        "_system_executor",
+        "_verify_access",
+        "_access_state",
+        "_commands",
+        "_added_observers",
+        "_removed_observers",
+        "_batched_observers",
+        "_entity_slots",
+        "_slot_generations",
+        "_free_slots",
         "_components",
-        "_entities",
-        "_uid_to_entity_map",
+        "_active_components",
         "_entity_names",
         "_dead_entities",
         "_resources",
+        "_resource_handles",
+        "_archived_entities",
+        "_persistent_types",
     )
 
-    _next_entity_id: int
-    """Next ID assigned to a spawned entity."""
+    _tick: int
+    """The number of steps the world has completed."""
+    _system_executor: Optional[ThreadPoolExecutor]
+    """Worker threads used to update non-conflicting systems concurrently."""
+    _verify_access: bool
+    """Check that systems only access the types they declare."""
+    _access_state: threading.local
+    """Per-thread state tracking the system that is currently updating."""
+    _commands: CommandBuffer
+    """Structural changes deferred until the next sync point."""
+    _added_observers: dict[Type[Component], list[_ComponentObserver]]
+    """Component types mapped to observers of that type being added."""
+    _removed_observers: dict[Type[Component], list[_ComponentObserver]]
+    """Component types mapped to observers of that type being removed."""
+    _batched_observers: list[_ComponentObserver]
+    """Observers that receive their changes at the end of each step."""
+    _entity_slots: list[Optional[Entity]]
+    """Entities (live or archived) indexed by slot (None if the slot is free)."""
+    _slot_generations: list[int]
+    """The generation of the entity that occupies or will next occupy each slot."""
+    _free_slots: deque[int]
+    """Slots freed by destroyed entities, reused oldest first."""
     _components: dict[Type[Component], set[EntityId]]
     """Entity component data."""
-    _entities: dict[EntityId, dict[Type[Component], Component]]
-    """Entity data."""
-    _uid_to_entity_map: dict[EntityId, Entity]
-    """Map of UIDs to entity instances."""
+    _active_components: dict[Type[Component], set[EntityId]]
+    """Component types mapped to the UIDs of active entities with that component."""
     _entity_names: dict[EntityId, str]
     """Names of entities."""
     _dead_entities: OrderedSet[Entity]
     """Destroyed entities to clean-up at the start of a world step."""
     _resources: dict[Type[Any], Any]
     """Resources shared by the world instance."""
+    _resource_handles: dict[Type[Any], ResourceHandle[Any]]
+    """Resource types mapped to handles that are updated when the resource changes."""
+    _archived_entities: dict[EntityId, bytes]
+    """Compressed component data of entities evicted to cold storage."""
+    _persistent_types: dict[
+        Type[Any], tuple[Callable[[Any], Hashable], Callable[[World, Hashable], Any]]
+    ]
+    """Types archived by key mapped to functions that get and resolve the key."""
 
     def __init__(self) -> None:
         self._resources = {}
+        self._resource_handles = {}
         self._systems = SystemManager(self)
         self._systems.add_system(InitializationSystems())
         self._systems.add_system(EarlyUpdateSystems())
         self._systems.add_system(UpdateSystems())
         self._systems.add_system(LateUpdateSystems())
-        self._next_entity_id = 0
+        self._tick = 0
+        self._system_executor = None
+        self._verify_access = False
+        self._access_state = threading.local()
+        self._commands = CommandBuffer(self)
+        self._added_observers = {}
+        self._removed_observers = {}
+        self._batched_observers = []
+        # Slot 0 is never used so that entity IDs start at 1.
+        self._entity_slots = [None]
+        self._slot_generations = [0]
+        self._free_slots = deque()
         self._components = {}
-        self._entities = {}
-        self._uid_to_entity_map = {}
+        self._active_components = {}
         self._entity_names = {}
         self._dead_entities = OrderedSet([])
+        self._archived_entities = {}
+        self._persistent_types = {}
+
+    @property
+    def tick(self) -> int:
+        """The number of steps the world has completed."""
+        return self._tick
+
+    @property
+    def commands(self) -> CommandBuffer:
+        """Structural changes applied after the current system finishes updating."""
+        return self._commands
+
+    def set_system_workers(self, max_workers: int) -> None:
+        """Set the number of threads used to update systems concurrently.
+
+        Only systems that declare their reads and writes are updated concurrently.
+        All other systems still update one at a time in sorted order.
+
+        Parameters
+        ----------
+        max_workers
+            The maximum number of worker threads. Values less than two update all
+            systems serially on the calling thread.
+        """
+        if self._system_executor is not None:
+            self._system_executor.shutdown()
+            self._system_executor = None
+
+        if max_workers > 1:
+            self._system_executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="minerva-system"
+            )
+
+    def set_access_verification(self, value: bool) -> None:
+        """Toggle checking that systems only access the types they declare.
+
+        When enabled, a RuntimeError is raised if a system with declared reads and
+        writes accesses a component type or resource it did not declare. This is
+        meant for debugging and slows down component access.
+
+        Parameters
+        ----------
+        value
+            Should system access be verified.
+        """
+        self._verify_access = value
+
+    def _has_system_workers(self) -> bool:
+        """Check if systems may be updated concurrently."""
+        return self._system_executor is not None
+
+    def _update_system(self, system: System) -> None:
+        """Update a single system, tracking it for access verification."""
+        if not self._verify_access:
+            system.on_update(self)
+            return
+
+        previous = getattr(self._access_state, "system", None)
+        self._access_state.system = system
+
+        try:
+            system.on_update(self)
+        finally:
+            self._access_state.system = previous
+
+    def _update_systems(self, systems: Sequence[System]) -> None:
+        """Update systems that do not conflict, concurrently when possible."""
+        if len(systems) < 2 or self._system_executor is None:
+            for system in systems:
+                self._update_system(system)
+                self._commands.apply()
+            return
+
+        futures = [
+            self._system_executor.submit(self._update_system, system)
+            for system in systems
+        ]
+
+        for future in futures:
+            future.result()
+
+        self._commands.apply()
+
+    def _check_access(self, access_type: Type[Any], write: bool) -> None:
+        """Raise an error if the updating system did not declare an access."""
+        system: Optional[System] = getattr(self._access_state, "system", None)
+
+        if system is None or not system.declares_access():
+            return
+
+        if access_type is Active:
+            if not write:
+                return
+
+            # Toggling Active changes which queries an entity appears in.
+            access_type = Entity
+
+        allowed = system.writes() if write else system.reads()
+
+        if access_type not in allowed:
+            raise RuntimeError(
+                f"{system.system_name()} {'wrote' if write else 'read'} "
+                f"{access_type.__name__} without declaring it in "
+                f"{'__writes__' if write else '__reads__ or __writes__'}."
+            )
+
+    @overload
+    def observe_added(
+        self,
+        component_type: Type[_CT],
+        listener: Callable[[Entity, _CT], None],
+        batched: Literal[False] = False,
+    ) -> None: ...
+
+    @overload
+    def observe_added(
+        self,
+        component_type: Type[_CT],
+        listener: Callable[[list[tuple[Entity, _CT]]], None],
+        batched: Literal[True],
+    ) -> None: ...
+
+    def observe_added(
+        self,
+        component_type: Type[_CT],
+        listener: Callable[..., None],
+        batched: bool = False,
+    ) -> None:
+        """Listen for components of a given type being added to entities.
+
+        Observe the Active component to listen for entities being activated.
+        Restoring entities from cold storage does not count as adding components.
+
+        Parameters
+        ----------
+        component_type
+            The type of component to observe.
+        listener
+            Called with the entity and the added component. Batched listeners are
+            instead called with a list of (entity, component) tuples.
+        batched
+            Collect changes and deliver them at the end of each step instead of
+            as they happen.
+        """
+        self._add_observer(self._added_observers, component_type, listener, batched)
+
+    @overload
+    def observe_removed(
+        self,
+        component_type: Type[_CT],
+        listener: Callable[[Entity, _CT], None],
+        batched: Literal[False] = False,
+    ) -> None: ...
+
+    @overload
+    def observe_removed(
+        self,
+        component_type: Type[_CT],
+        listener: Callable[[list[tuple[Entity, _CT]]], None],
+        batched: Literal[True],
+    ) -> None: ...
+
+    def observe_removed(
+        self,
+        component_type: Type[_CT],
+        listener: Callable[..., None],
+        batched: bool = False,
+    ) -> None:
+        """Listen for components of a given type being removed from entities.
+
+        Observe the Active component to listen for entities being deactivated. The
+        components of destroyed entities are reported as removed when the entities
+        are cleared at the start of the next step. Archiving entities to cold
+        storage does not count as removing components.
+
+        Parameters
+        ----------
+        component_type
+            The type of component to observe.
+        listener
+            Called with the entity and the removed component. Batched listeners are
+            instead called with a list of (entity, component) tuples.
+        batched
+            Collect changes and deliver them at the end of each step instead of
+            as they happen.
+        """
+        self._add_observer(self._removed_observers, component_type, listener, batched)
+
+    def remove_observer(
+        self, component_type: Type[Component], listener: Callable[..., None]
+    ) -> bool:
+        """Stop a listener from observing a component type.
+
+        Returns
+        -------
+        bool
+            True if the listener was observing the component type, False otherwise.
+        """
+        removed = False
+
+        for observers_by_type in (self._added_observers, self._removed_observers):
+            observers = observers_by_type.get(component_type, [])
+
+            for observer in [o for o in observers if o.listener == listener]:
+                observers.remove(observer)
+                removed = True
+
+                if observer.batched:
+                    self._batched_observers.remove(observer)
+
+            if not observers:
+                observers_by_type.pop(component_type, None)
+
+        return removed
+
+    def dispatch_batched_changes(self) -> None:
+        """Deliver the changes collected for batched observers.
+
+        This is called automatically at the end of each step.
+        """
+        for observer in list(self._batched_observers):
+            if observer.changes:
+                changes, observer.changes = observer.changes, []
+                observer.listener(changes)
+
+    def _add_observer(
+        self,
+        observers_by_type: dict[Type[Component], list[_ComponentObserver]],
+        component_type: Type[Component],
+        listener: Callable[..., None],
+        batched: bool,
+    ) -> None:
+        """Register an observer for a component type."""
+        observer = _ComponentObserver(listener, batched)
+        observers_by_type.setdefault(component_type, []).append(observer)
+
+        if batched:
+            self._batched_observers.append(observer)
 
     def initialize(self) -> None:
         """Run initialization systems only."""
@@ -679,6 +1417,8 @@ class World:
         """Advance the simulation as single tick and call all the systems."""
         self._clear_dead_entities()
         self._systems.update_systems()
+        self.dispatch_batched_changes()
+        self._tick += 1
 
     def add_system(self, system: System) -> None:
         """Add a System instance.
@@ -719,6 +1459,9 @@ class World:
         """
         self._resources[type(resource)] = resource
 
+        if (handle := self._resource_handles.get(type(resource))) is not None:
+            handle.value = resource
+
     def remove_resource(self, resource_type: Type[Any]) -> None:
         """Remove a shared resource to a world.
 
@@ -729,6 +1472,9 @@ class World:
         """
         del self._resources[resource_type]
 
+        if (handle := self._resource_handles.get(resource_type)) is not None:
+            del handle.value
+
     def get_resource(self, resource_type: Type[_RT]) -> _RT:
         """Access a shared resource.
 
@@ -742,8 +1488,38 @@ class World:
         _RT
             The instance of the resource.
         """
+        if self._verify_access:
+            self._check_access(resource_type, write=False)
+
         return self._resources[resource_type]
 
+    def resource_handle(self, resource_type: Type[_RT]) -> ResourceHandle[_RT]:
+        """Get a handle that always refers to the world's resource of a given type.
+
+        Parameters
+        ----------
+        resource_type
+            The class of the resource.
+
+        Returns
+        -------
+        ResourceHandle[_RT]
+            The handle for the resource type, shared by all callers.
+        """
+        if self._verify_access:
+            self._check_access(resource_type, write=False)
+
+        handle = self._resource_handles.get(resource_type)
+
+        if handle is None:
+            handle = ResourceHandle(resource_type)
+            self._resource_handles[resource_type] = handle
+
+            if resource_type in self._resources:
+                handle.value = self._resources[resource_type]
+
+        return handle
+
     def has_resource(self, resource_type: Type[Any]) -> bool:
         """Check if a world has a shared resource.
 
@@ -778,14 +1554,14 @@ class World:
         Entity
             The created entity.
         """
-        self._next_entity_id += 1
+        if self._verify_access:
+            self._check_access(Entity, write=True)
 
-        entity = Entity(uid=self._next_entity_id, world=self)
+        entity = self._reserve_entity()
 
-        if entity.uid not in self._entities:
-            self._entities[entity.uid] = {}
-            self._uid_to_entity_map[entity.uid] = entity
-            self._entity_names[entity.uid] = name
+        entity._components = {}
+        self._entity_slots[entity.slot] = entity
+        self._entity_names[entity.uid] = name
 
         if components:
             for component in components:
@@ -795,13 +1571,173 @@ class World:
 
         return entity
 
+    def _reserve_entity(self) -> Entity:
+        """Allocate the UID for a new entity without adding it to the world."""
+        if self._free_slots:
+            slot = self._free_slots.popleft()
+        else:
+            slot = len(self._entity_slots)
+            self._entity_slots.append(None)
+            self._slot_generations.append(0)
+
+        return Entity(
+            uid=(self._slot_generations[slot] << _SLOT_BITS) | slot, world=self
+        )
+
+    def _get_slot_entity(self, uid: EntityId) -> Optional[Entity]:
+        """Get the live or archived entity with the given UID, if it exists."""
+        slot = uid & _SLOT_MASK
+
+        if slot < len(self._entity_slots):
+            entity = self._entity_slots[slot]
+
+            if entity is not None and entity._uid == uid:
+                return entity
+
+        return None
+
+    def _spawn_entities(
+        self, entities: list[tuple[Entity, str, list[Component]]]
+    ) -> None:
+        """Add reserved entities to the world, batching components by type."""
+        components_by_type: dict[Type[Component], list[tuple[Entity, Component]]] = {}
+
+        for entity, name, components in entities:
+            entity._components = {}
+            self._entity_slots[entity.slot] = entity
+            self._entity_names[entity.uid] = name
+
+            for component in components:
+                components_by_type.setdefault(type(component), []).append(
+                    (entity, component)
+                )
+
+        for component_type, pairs in components_by_type.items():
+            self._add_components(component_type, pairs)
+
+        self._add_components(Active, [(entity, Active()) for entity, _, _ in entities])
+
     def get_entity(self, uid: EntityId) -> Entity:
-        """Get an entity by its UID."""
-        return self._uid_to_entity_map[uid]
+        """Get an entity by its UID.
+
+        Entities in cold storage are restored to the world.
+        """
+        entity = self._get_slot_entity(uid)
+
+        if entity is None:
+            raise KeyError(f"Could not find entity with UID: {uid}.")
+
+        if entity._components is None:
+            self._restore_entity(uid)
+
+        return entity
 
     def entity_exists(self, uid: EntityId) -> bool:
         """Check if an entity exists using its UID."""
-        return uid in self._uid_to_entity_map
+        return self._get_slot_entity(uid) is not None
+
+    def is_archived(self, uid: EntityId) -> bool:
+        """Check if the entity with the given UID is in cold storage."""
+        return uid in self._archived_entities
+
+    def register_persistent_type(
+        self,
+        obj_type: Type[Any],
+        get_key: Callable[[Any], Hashable],
+        resolve: Callable[[World, Hashable], Any],
+    ) -> None:
+        """Archive instances of a type by key instead of by value.
+
+        This is used for objects shared between entities, like library definitions,
+        so that restored entities reference the same instances as everyone else.
+
+        Parameters
+        ----------
+        obj_type
+            The type of the shared objects.
+        get_key
+            A function that returns a picklable key for an instance.
+        resolve
+            A function that returns the instance for a key.
+        """
+        self._persistent_types[obj_type] = (get_key, resolve)
+
+    def archive_entity(self, entity: Entity) -> None:
+        """Evict an inactive entity's components to cold storage.
+
+        The entity's components are serialized and removed from the world. They are
+        transparently restored the next time the entity's components are accessed or
+        the entity is retrieved using `World.get_entity()`. Archived entities are not
+        included in component queries.
+
+        Parameters
+        ----------
+        entity
+            The entity to archive.
+        """
+        uid = entity.uid
+        slot_entity = self._get_slot_entity(uid)
+        components = slot_entity._components if slot_entity is not None else None
+
+        if slot_entity is None or components is None:
+            raise ValueError(f"Entity ({uid}) is invalid.")
+
+        if Active in components:
+            raise ValueError(f"Cannot archive active entity ({uid}).")
+
+        if entity in self._dead_entities:
+            raise ValueError(f"Cannot archive destroyed entity ({uid}).")
+
+        buffer = io.BytesIO()
+        _ArchivePickler(buffer, self).dump(components)
+
+        self._archived_entities[uid] = zlib.compress(buffer.getvalue())
+
+        for component_type in components:
+            self._components[component_type].discard(uid)
+
+            if not self._components[component_type]:
+                del self._components[component_type]
+
+        # The entity keeps its slot so that the same instance is reused when the
+        # entity is restored.
+        slot_entity._components = None
+
+    def restore_archived_entities(self) -> None:
+        """Restore all entities in cold storage to the world."""
+        for uid in list(self._archived_entities):
+            self._restore_entity(uid)
+
+    def _restore_entity(self, uid: EntityId) -> dict[Type[Component], Component]:
+        """Restore an entity from cold storage and return its components."""
+        data = self._archived_entities.pop(uid)
+
+        components: dict[Type[Component], Component] = _ArchiveUnpickler(
+            io.BytesIO(zlib.decompress(data)), self
+        ).load()
+
+        self._entity_slots[uid & _SLOT_MASK]._components = components  # type: ignore
+
+        for component_type in components:
+            if component_type not in self._components:
+                self._components[component_type] = set()
+
+            self._components[component_type].add(uid)
+
+        return components
+
+    def _get_entity_components(self, uid: EntityId) -> dict[Type[Component], Component]:
+        """Get an entity's components, restoring them from cold storage if needed."""
+        entity = self._get_slot_entity(uid)
+
+        if entity is not None:
+            if entity._components is not None:
+                return entity._components
+
+            if uid in self._archived_entities:
+                return self._restore_entity(uid)
+
+        raise ValueError(f"Entity ({uid}) is invalid.")
 
     def get_entity_name(self, entity: Entity) -> str:
         """Get the given entity's name."""
@@ -817,36 +1753,71 @@ class World:
 
     def deactivate(self, entity: Entity) -> None:
         """Remove the Active tag from an entity."""
+        if entity.uid in self._archived_entities:
+            # Archived entities are always inactive.
+            return
+
         self.remove_component(entity, Active)
 
     def destroy(self, entity: Entity) -> None:
         """Remove an entity from the world."""
+        if self._verify_access:
+            self._check_access(Entity, write=True)
+
+        if entity.uid in self._archived_entities:
+            # Restore the components so observers are notified when they are removed.
+            self._restore_entity(entity.uid)
+
         entity.deactivate()
         self._dead_entities.append(entity)
 
     def _clear_dead_entities(self) -> None:
         """Delete entities that were removed from the world."""
         for entity in self._dead_entities:
+            slot_entity = self._get_slot_entity(entity.uid)
+
+            if slot_entity is None:
+                continue
+
+            slot = slot_entity.slot
+            entity_components = slot_entity._components
 
-            for component_type in self._entities[entity.uid]:
+            if entity_components is None:
+                # Drop any components left in cold storage.
+                self._archived_entities.pop(entity.uid, None)
+                entity_components = {}
+
+            for component_type in entity_components:
                 self._components[component_type].discard(entity.uid)
 
                 if not self._components[component_type]:
                     del self._components[component_type]
 
-            del self._entities[entity.uid]
-            del self._uid_to_entity_map[entity.uid]
+                self._discard_active_component(entity.uid, component_type)
+
+            # Free the slot. Bumping the generation invalidates the old UID.
+            slot_entity._components = None
+            self._entity_slots[slot] = None
+            self._slot_generations[slot] += 1
+            self._free_slots.append(slot)
+
+            if self._removed_observers:
+                for component_type, component in entity_components.items():
+                    for observer in self._removed_observers.get(component_type, ()):
+                        observer.notify(entity, component)
 
         self._dead_entities.clear()
 
     def add_component(self, entity: Entity, component: _CT) -> _CT:
         """Add a component to the given entity and return it."""
-        if entity.uid not in self._entities:
-            raise ValueError(f"Entity ({entity.uid}) is invalid.")
+        if self._verify_access:
+            self._check_access(type(component), write=True)
+
+        entity_components = self._get_entity_components(entity.uid)
 
         component_type = type(component)
 
-        if component_type in self._entities[entity.uid]:
+        if component_type in entity_components:
             raise TypeError(
                 "Cannot have multiple components of same type. "
                 f"Attempted to add {component_type}."
@@ -857,10 +1828,20 @@ class World:
 
         self._components[component_type].add(entity.uid)
 
-        self._entities[entity.uid][component_type] = component
+        entity_components[component_type] = component
+
+        if component_type is Active:
+            for active_type in entity_components:
+                self._add_active_component(entity.uid, active_type)
+        elif Active in entity_components:
+            self._add_active_component(entity.uid, component_type)
 
         component.entity = entity
 
+        if (observers := self._added_observers.get(component_type)) is not None:
+            for observer in observers:
+                observer.notify(entity, component)
+
         return component
 
     def remove_component(self, entity: Entity, component_type: Type[Component]) -> bool:
@@ -871,39 +1852,169 @@ class World:
         bool
             Returns True if component is removed, False otherwise.
         """
-        if entity.uid not in self._entities:
-            raise ValueError(f"Entity ({entity.uid}) is invalid.")
+        if self._verify_access:
+            self._check_access(component_type, write=True)
 
-        if component_type in self._entities[entity.uid]:
+        entity_components = self._get_entity_components(entity.uid)
+
+        if component_type in entity_components:
             self._components[component_type].remove(entity.uid)
 
             if not self._components[component_type]:
                 del self._components[component_type]
 
-            del self._entities[entity.uid][component_type]
+            if component_type is Active:
+                for active_type in entity_components:
+                    self._discard_active_component(entity.uid, active_type)
+            elif Active in entity_components:
+                self._discard_active_component(entity.uid, component_type)
+
+            component = entity_components.pop(component_type)
+
+            if (observers := self._removed_observers.get(component_type)) is not None:
+                for observer in observers:
+                    observer.notify(entity, component)
 
             return True
 
         return False
 
-    def get_component(self, entity: Entity, component_type: Type[_CT]) -> _CT:
-        """Get a component associated with the given entity."""
-        if entity.uid not in self._entities:
-            raise ValueError(f"Entity ({entity.uid}) is invalid.")
+    def _add_components(
+        self, component_type: Type[Component], pairs: list[tuple[Entity, Component]]
+    ) -> None:
+        """Add components of one type to many entities with one index update."""
+        if component_type is Active:
+            for entity, component in pairs:
+                self.add_component(entity, component)
+            return
 
-        if component_type in self._entities[entity.uid]:
-            return self._entities[entity.uid][component_type]
-        else:
+        uids: set[EntityId] = set()
+        active_uids: list[EntityId] = []
+        targets: list[dict[Type[Component], Component]] = []
+
+        for entity, _ in pairs:
+            entity_components = self._get_entity_components(entity.uid)
+
+            if component_type in entity_components or entity.uid in uids:
+                raise TypeError(
+                    "Cannot have multiple components of same type. "
+                    f"Attempted to add {component_type}."
+                )
+
+            uids.add(entity.uid)
+            targets.append(entity_components)
+
+            if Active in entity_components:
+                active_uids.append(entity.uid)
+
+        for (entity, component), entity_components in zip(pairs, targets):
+            entity_components[component_type] = component
+            component.entity = entity
+
+        self._components.setdefault(component_type, set()).update(uids)
+
+        if active_uids:
+            self._active_components.setdefault(component_type, set()).update(
+                active_uids
+            )
+
+        if (observers := self._added_observers.get(component_type)) is not None:
+            for observer in observers:
+                for entity, component in pairs:
+                    observer.notify(entity, component)
+
+    def _remove_components(
+        self, component_type: Type[Component], entities: list[Entity]
+    ) -> None:
+        """Remove components of one type from many entities with one index update."""
+        if component_type is Active:
+            for entity in entities:
+                self.remove_component(entity, component_type)
+            return
+
+        removed: list[EntityId] = []
+        removed_pairs: list[tuple[Entity, Component]] = []
+
+        for entity in entities:
+            entity_components = self._get_entity_components(entity.uid)
+
+            if (component := entity_components.pop(component_type, None)) is not None:
+                removed.append(entity.uid)
+                removed_pairs.append((entity, component))
+
+        if not removed:
+            return
+
+        uids = self._components[component_type]
+        uids.difference_update(removed)
+
+        if not uids:
+            del self._components[component_type]
+
+        if (active_uids := self._active_components.get(component_type)) is not None:
+            active_uids.difference_update(removed)
+
+            if not active_uids:
+                del self._active_components[component_type]
+
+        if (observers := self._removed_observers.get(component_type)) is not None:
+            for observer in observers:
+                for entity, component in removed_pairs:
+                    observer.notify(entity, component)
+
+    def _add_active_component(
+        self, uid: EntityId, component_type: Type[Component]
+    ) -> None:
+        """Index a component type of an active entity."""
+        if component_type not in self._active_components:
+            self._active_components[component_type] = set()
+
+        self._active_components[component_type].add(uid)
+
+    def _discard_active_component(
+        self, uid: EntityId, component_type: Type[Component]
+    ) -> None:
+        """Remove a component type of an entity from the active index."""
+        active_uids = self._active_components.get(component_type)
+
+        if active_uids is None:
+            return
+
+        active_uids.discard(uid)
+
+        if not active_uids:
+            del self._active_components[component_type]
+
+    def get_component(
+        self, entity: Union[Entity, EntityId], component_type: Type[_CT]
+    ) -> _CT:
+        """Get a component associated with the given entity or entity UID."""
+        if self._verify_access:
+            self._check_access(component_type, write=False)
+
+        uid = entity.uid if isinstance(entity, Entity) else operator.index(entity)
+        entity_components = self._get_entity_components(uid)
+
+        component = entity_components.get(component_type)
+
+        if component is None:
             raise KeyError(
                 f"Could not find Component with type: {component_type.__name__}."
             )
 
-    def has_component(self, entity: Entity, component_type: Type[Component]) -> bool:
-        """Check if this entity has a component."""
-        if entity.uid not in self._entities:
-            raise ValueError(f"Entity ({entity.uid}) is invalid.")
+        return component  # type: ignore
+
+    def has_component(
+        self, entity: Union[Entity, EntityId], component_type: Type[Component]
+    ) -> bool:
+        """Check if the given entity or entity UID has a component."""
+        if self._verify_access:
+            self._check_access(component_type, write=False)
+
+        uid = entity.uid if isinstance(entity, Entity) else operator.index(entity)
+        entity_components = self._get_entity_components(uid)
 
-        return component_type in self._entities[entity.uid]
+        return component_type in entity_components
 
     @overload
     def query_components(
@@ -1023,13 +2134,43 @@ class World:
         Returns
         -------
         A generator that yields components and their entity.
+
+        Notes
+        -----
+        Including Active in the component types acts as a flag. Instead of
+        intersecting with every active entity in the world, the query only looks at
+        active entities with the other requested components.
+
+        Entities in cold storage (see `World.archive_entity()`) are never included,
+        even when Active is not requested. Call `World.restore_archived_entities()`
+        first to query every inactive entity, including archived ones.
         """
+        if self._verify_access:
+            for component_type in component_types:
+                self._check_access(component_type, write=False)
+
         try:
+            if Active in component_types and len(component_types) > 1:
+                uid_sets = [
+                    self._active_components[ct]
+                    for ct in component_types
+                    if ct is not Active
+                ]
+            else:
+                uid_sets = [self._components[ct] for ct in component_types]
+
+            uid_sets.sort(key=len)
+
+            entity_slots = self._entity_slots
+
             for entity_uid in sorted(  # type: ignore
-                set.intersection(*[self._components[ct] for ct in component_types])  # type: ignore
+                uid_sets[0].intersection(*uid_sets[1:])
             ):
+                entity_components = entity_slots[  # type: ignore
+                    entity_uid & _SLOT_MASK
+                ]._components
                 yield entity_uid, tuple(  # type: ignore
-                    self._entities[entity_uid][ct] for ct in component_types
+                    entity_components[ct] for ct in component_types
                 )
         except KeyError:
             pass
@@ -0,0 +1,259 @@
+"""Streaming History Export.
+
+The simulation database is normally exported once, at the end of a run. A
+HistoryStream lets downstream tools consume history while the simulation is still
+running. After every tick, rows committed to the tracked tables since the previous
+flush are written to a binary output (file, named pipe, Unix socket, stdout, etc.)
+as either newline-delimited JSON or length-prefixed JSON records.
+
+Each record has the form:
+{"table": "<table name>", "op": "insert" | "update", "row": {<column>: <value>}}.
+
+New rows are tracked using a per-table high-water mark on SQLite's rowid, so a row
+is only inserted once. Rows that are updated after they were sent (for example,
+setting a marriage's end date) are recorded by TEMP triggers and re-sent in full as
+"update" records during the next flush. Deleted rows are not reported.
+
+"""
+
+from __future__ import annotations
+
+import json
+import socket
+import sqlite3
+import struct
+import sys
+from typing import BinaryIO, Iterable, Optional
+
+DEFAULT_STREAM_TABLES: tuple[str, ...] = (
+    "life_events",
+    "marriages",
+    "wars",
+    "rulers",
+    "family_heads",
+)
+"""Tables streamed when no others are specified."""
+
+RECORD_FORMATS: tuple[str, ...] = ("ndjson", "length_prefixed")
+"""Supported output record formats."""
+
+
+class HistoryStream:
+    """Shared singleton that streams newly committed database rows to an output."""
+
+    __slots__ = (
+        "_output",
+        "_socket",
+        "_record_format",
+        "_tables",
+        "_high_water_marks",
+        "_tracked_db",
+    )
+
+    _output: BinaryIO
+    """The binary stream records are written to."""
+    _socket: Optional[socket.socket]
+    """The socket backing the output (if any)."""
+    _record_format: str
+    """The format used to frame each record."""
+    _tables: tuple[str, ...]
+    """The names of the tables to stream."""
+    _high_water_marks: dict[str, int]
+    """Table names mapped to the largest rowid already sent."""
+    _tracked_db: Optional[sqlite3.Connection]
+    """The connection with triggers installed to record updated rows."""
+
+    def __init__(
+        self,
+        output: BinaryIO,
+        record_format: str = "ndjson",
+        tables: Iterable[str] = DEFAULT_STREAM_TABLES,
+        sock: Optional[socket.socket] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        output
+            A writable binary stream.
+        record_format
+            Either 'ndjson' (one JSON object per line) or 'length_prefixed' (each
+            JSON object is preceded by its byte length as a 4-byte big-endian int).
+        tables
+            The names of the database tables to stream.
+        sock
+            A socket backing the output that should be closed with the stream.
+        """
+        if record_format not in RECORD_FORMATS:
+            raise ValueError(f"Unsupported history stream format: {record_format}.")
+
+        self._output = output
+        self._socket = sock
+        self._record_format = record_format
+        self._tables = tuple(tables)
+        self._high_water_marks = {table: 0 for table in self._tables}
+        self._tracked_db = None
+
+    @property
+    def tables(self) -> tuple[str, ...]:
+        """The names of the tables to stream."""
+        return self._tables
+
+    @property
+    def high_water_marks(self) -> dict[str, int]:
+        """Table names mapped to the largest rowid already sent."""
+        return dict(self._high_water_marks)
+
+    def flush(self, db: sqlite3.Connection) -> int:
+        """Write all rows committed since the previous flush.
+
+        Parameters
+        ----------
+        db
+            The connection to the simulation database.
+
+        Returns
+        -------
+        int
+            The number of records written.
+        """
+        if db is not self._tracked_db:
+            self._track_updates(db)
+
+        chunks: list[bytes] = []
+
+        for table in self._tables:
+            # Rows past the high-water mark are sent as inserts with their latest
+            # values, so only updates to previously sent rows are re-sent.
+            cursor = db.execute(
+                f"""
+                SELECT rowid, * FROM {table}
+                WHERE rowid <= ? AND rowid IN (
+                    SELECT row_id FROM temp._minerva_stream_updates
+                    WHERE table_name=?
+                )
+                ORDER BY rowid;
+                """,
+                (self._high_water_marks[table], table),
+            )
+
+            column_names = [c[0] for c in cursor.description[1:]]
+
+            for _, *values in cursor:
+                chunks.append(
+                    self._encode(
+                        {
+                            "table": table,
+                            "op": "update",
+                            "row": dict(zip(column_names, values)),
+                        }
+                    )
+                )
+
+            cursor = db.execute(
+                f"SELECT rowid, * FROM {table} WHERE rowid > ? ORDER BY rowid;",
+                (self._high_water_marks[table],),
+            )
+
+            column_names = [c[0] for c in cursor.description[1:]]
+
+            for rowid, *values in cursor:
+                chunks.append(
+                    self._encode(
+                        {
+                            "table": table,
+                            "op": "insert",
+                            "row": dict(zip(column_names, values)),
+                        }
+                    )
+                )
+                self._high_water_marks[table] = rowid
+
+        db.execute("DELETE FROM temp._minerva_stream_updates;")
+        db.commit()
+
+        if chunks:
+            self._output.write(b"".join(chunks))
+            self._output.flush()
+
+        return len(chunks)
+
+    def close(self) -> None:
+        """Close the output (and socket) used by this stream."""
+        if self._output is not sys.stdout.buffer:
+            self._output.close()
+
+        if self._socket is not None:
+            self._socket.close()
+
+    def _track_updates(self, db: sqlite3.Connection) -> None:
+        """Install TEMP triggers that record the rowids of updated rows.
+
+        TEMP objects are not copied to exported databases.
+        """
+        db.execute(
+            """
+            CREATE TEMP TABLE IF NOT EXISTS _minerva_stream_updates (
+                table_name TEXT,
+                row_id INT,
+                PRIMARY KEY (table_name, row_id)
+            ) WITHOUT ROWID;
+            """
+        )
+
+        for table in self._tables:
+            db.execute(
+                f"""
+                CREATE TEMP TRIGGER IF NOT EXISTS _minerva_{table}_stream_update
+                AFTER UPDATE ON main.{table}
+                BEGIN
+                    INSERT OR IGNORE INTO _minerva_stream_updates (table_name, row_id)
+                    VALUES ('{table}', NEW.rowid);
+                END;
+                """
+            )
+
+        self._tracked_db = db
+
+    def _encode(self, record: dict[str, object]) -> bytes:
+        """Serialize a record using the stream's format."""
+        payload = json.dumps(record, separators=(",", ":")).encode("utf-8")
+
+        if self._record_format == "ndjson":
+            return payload + b"\n"
+
+        return struct.pack(">I", len(payload)) + payload
+
+
+def open_history_stream(
+    target: str,
+    record_format: str = "ndjson",
+    tables: Iterable[str] = DEFAULT_STREAM_TABLES,
+) -> HistoryStream:
+    """Create a history stream that writes to the given target.
+
+    Parameters
+    ----------
+    target
+        Where to send records. Use '-' for stdout, 'unix:<path>' to connect to a
+        Unix domain socket, or a path to a file or named pipe.
+    record_format
+        Either 'ndjson' or 'length_prefixed'.
+    tables
+        The names of the database tables to stream.
+
+    Returns
+    -------
+    HistoryStream
+        The new history stream.
+    """
+    if target == "-":
+        return HistoryStream(sys.stdout.buffer, record_format, tables)
+
+    if target.startswith("unix:"):
+        # pylint: disable-next=no-member
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(target[len("unix:") :])
+        return HistoryStream(sock.makefile("wb"), record_format, tables, sock=sock)
+
+    # pylint: disable-next=consider-using-with
+    return HistoryStream(open(target, "wb"), record_format, tables)
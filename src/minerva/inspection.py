@@ -50,11 +50,7 @@ from minerva.characters.metric_data import CharacterMetrics
 from minerva.characters.succession_helpers import get_current_ruler
 from minerva.characters.war_data import Alliance, War
 from minerva.ecs import Active
-from minerva.life_events.base_types import (
-    get_life_event_ids,
-    get_life_event_timestamp,
-    get_life_event_description,
-)
+from minerva.life_events.base_types import get_life_event_history
 from minerva.simulation import Simulation
 from minerva.traits.base_types import TraitManager
 from minerva.world_map.components import PopulationHappiness, Territory
@@ -521,11 +517,8 @@ class SimulationInspector:
         renderable_objs.append(scheme_panel)
 
         life_event_table = rich.table.Table("Timestamp", "Description", highlight=True)
-        for event_id in get_life_event_ids(character):
-            life_event_table.add_row(
-                str(get_life_event_timestamp(self.sim.world, event_id)),
-                get_life_event_description(self.sim.world, event_id),
-            )
+        for _, timestamp, description in get_life_event_history(character):
+            life_event_table.add_row(str(timestamp), description)
 
         life_event_panel = rich.panel.Panel(
             life_event_table,
@@ -797,6 +790,9 @@ class SimulationInspector:
         table.add_column("Start Date")
         table.add_column("End Date")
 
+        # Past dynasties may have been moved to cold storage.
+        self.sim.world.restore_archived_entities()
+
         results = sorted(
             self.sim.world.query_components((Dynasty,)), key=lambda e: e[0]
         )
@@ -852,6 +848,9 @@ class SimulationInspector:
         table.add_column("Sex")
         table.add_column("Family")
 
+        if inactive_ok:
+            self.sim.world.restore_archived_entities()
+
         for _, (character,) in self.sim.world.query_components((Character,)):
             if not inactive_ok and not character.entity.has_component(Active):
                 continue
@@ -877,6 +876,9 @@ class SimulationInspector:
         table.add_column("Family Head")
         table.add_column("Home Base")
 
+        if inactive_ok:
+            self.sim.world.restore_archived_entities()
+
         for _, (family,) in self.sim.world.query_components((Family,)):
             if not inactive_ok and not family.entity.has_component(Active):
                 continue
@@ -898,6 +900,7 @@ class SimulationInspector:
         """Print all active alliances."""
 
         if inactive_ok:
+            self.sim.world.restore_archived_entities()
             alliances = [
                 (uid, f) for uid, (f,) in self.sim.world.query_components((Alliance,))
             ]
@@ -928,6 +931,7 @@ class SimulationInspector:
         """Print all active wars."""
 
         if inactive_ok:
+            self.sim.world.restore_archived_entities()
             wars = [(uid, f) for uid, (f,) in self.sim.world.query_components((War,))]
         else:
             wars = [
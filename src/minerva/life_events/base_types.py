@@ -8,16 +8,125 @@ they were emitted.
 
 from __future__ import annotations
 
+import json
 import logging
+import re
 from abc import ABC
-from typing import ClassVar, Optional
+from typing import Any, ClassVar, Iterable, Mapping, Optional
 
+from minerva.config import Config
 from minerva.datetime import SimDate
 from minerva.ecs import Entity, World
 from minerva.sim_db import SimDB
 
 _logger = logging.getLogger(__name__)
 
+SimDB.register_query(
+    "life_event_timestamp",
+    """
+    SELECT
+        timestamp
+    FROM life_events
+    WHERE life_events.event_id=?;
+    """,
+    ("life_events",),
+)
+
+SimDB.register_query(
+    "life_event_ids_by_subject",
+    """
+    SELECT event_id FROM life_events WHERE subject_id=? ORDER BY event_id;
+    """,
+    ("life_events",),
+)
+
+# Rendering queries return one row per (event, argument) pair. Arguments are only
+# joined for events without a materialized description. Batch queries receive their
+# event IDs as a single JSON array parameter, so the same statement is reused
+# regardless of how many IDs are requested.
+_LIFE_EVENT_RENDER_SQL = """
+    SELECT
+        life_events.event_id,
+        life_events.timestamp,
+        life_events.description,
+        life_event_types.description,
+        life_event_args.name,
+        life_event_args.value
+    FROM life_events
+    JOIN life_event_types ON life_events.event_type=life_event_types.name
+    LEFT JOIN life_event_args
+        ON life_events.event_id=life_event_args.event_id
+        AND life_events.description IS NULL
+"""
+
+SimDB.register_query(
+    "life_event_render",
+    _LIFE_EVENT_RENDER_SQL + "WHERE life_events.event_id=?;",
+    ("life_events", "life_event_types", "life_event_args"),
+)
+
+SimDB.register_query(
+    "life_event_render_batch",
+    _LIFE_EVENT_RENDER_SQL
+    + "WHERE life_events.event_id IN (SELECT value FROM json_each(?));",
+    ("life_events", "life_event_types", "life_event_args"),
+)
+
+SimDB.register_query(
+    "life_event_render_by_subject",
+    _LIFE_EVENT_RENDER_SQL
+    + "WHERE life_events.subject_id=? ORDER BY life_events.event_id;",
+    ("life_events", "life_event_types", "life_event_args"),
+)
+
+_TEMPLATE_ARG_PATTERN = re.compile(r"\{(\w+)\}")
+"""Matches argument placeholders within description templates."""
+
+
+class DescriptionTemplate:
+    """A life event description template that has been pre-parsed for rendering.
+
+    Rendering substitutes every '{arg_name}' placeholder with the value of the
+    matching event argument in a single pass. Placeholders without a matching
+    argument are left as-is.
+    """
+
+    __slots__ = ("_parts",)
+
+    _parts: tuple[str, ...]
+    """Alternating literal text and argument names (at odd indices)."""
+
+    def __init__(self, template: str) -> None:
+        self._parts = tuple(_TEMPLATE_ARG_PATTERN.split(template))
+
+    def render(self, event_args: Mapping[str, str]) -> str:
+        """Generate a description using the given event arguments."""
+        parts = self._parts
+        output: list[str] = [parts[0]]
+
+        for i in range(1, len(parts), 2):
+            arg_name = parts[i]
+            value = event_args.get(arg_name)
+            output.append("{" + arg_name + "}" if value is None else value)
+            output.append(parts[i + 1])
+
+        return "".join(output)
+
+
+_compiled_templates: dict[str, DescriptionTemplate] = {}
+"""Cache of parsed description templates keyed by template text."""
+
+
+def compile_description_template(template: str) -> DescriptionTemplate:
+    """Get the parsed version of a description template."""
+    if (compiled := _compiled_templates.get(template)) is not None:
+        return compiled
+
+    compiled = DescriptionTemplate(template)
+    _compiled_templates[template] = compiled
+
+    return compiled
+
 
 class LifeEventType:
     """Configuration data about a type of life event.
@@ -32,7 +141,7 @@ class LifeEventType:
     of the database.
     """
 
-    __slots__ = ("name", "display_name", "description")
+    __slots__ = ("name", "display_name", "description", "template")
 
     name: str
     """A unique text name for this life event."""
@@ -40,6 +149,8 @@ class LifeEventType:
     """The name of the event when displayed in a GUI."""
     description: str
     """A text template used to generate a textual description of this event type."""
+    template: DescriptionTemplate
+    """The pre-parsed description template."""
 
     def __init__(
         self,
@@ -50,10 +161,57 @@ class LifeEventType:
         self.name = name
         self.display_name = display_name
         self.description = description
+        self.template = compile_description_template(description)
+
+
+class LifeEventTypeLibrary:
+    """Collection of all registered life event types."""
+
+    __slots__ = ("_types", "_is_shared")
+
+    _types: dict[str, LifeEventType]
+    """Life event type names mapped to their definitions."""
+    _is_shared: bool
+    """Is the types dict shared with a copy of this library."""
+
+    def __init__(self) -> None:
+        self._types = {}
+        self._is_shared = False
+
+    def add_type(self, life_event_type: LifeEventType) -> None:
+        """Add a life event type to the library."""
+        self._detach()
+        self._types[life_event_type.name] = life_event_type
+
+    def get_type(self, name: str) -> LifeEventType:
+        """Get a life event type using its name."""
+        try:
+            return self._types[name]
+        except KeyError as err:
+            raise ValueError(f"Unknown life event type: {name}") from err
+
+    def copy(self) -> LifeEventTypeLibrary:
+        """Create a copy-on-write copy of the library.
+
+        The copy shares types with this library until either one adds to them.
+        """
+        library = LifeEventTypeLibrary()
+        library._types = self._types
+        library._is_shared = True
+        self._is_shared = True
+        return library
+
+    def _detach(self) -> None:
+        """Stop sharing types with copies of this library before modifying them."""
+        if self._is_shared:
+            self._types = dict(self._types)
+            self._is_shared = False
 
 
 def register_life_event_type(world: World, life_event_type: LifeEventType) -> None:
     """Registers a life event type with the simulation's database."""
+    world.get_resource(LifeEventTypeLibrary).add_type(life_event_type)
+
     db = world.get_resource(SimDB).db
     cursor = db.cursor()
 
@@ -111,19 +269,30 @@ class LifeEvent(ABC):
     def log_event(self) -> None:
         """Dispatches the event to the proper listeners."""
 
-        db = self.world.get_resource(SimDB).db
+        sim_db = self.world.get_resource(SimDB)
+        db = sim_db.db
         cur = db.cursor()
 
+        config = self.world.get_resource(Config)
+        materialize = config.materialize_life_event_descriptions
+        log_description = _logger.isEnabledFor(logging.INFO)
+
+        description: Optional[str] = None
+        if materialize or log_description:
+            description = self.render_description()
+
         cur.execute(
             """
-            INSERT INTO life_events (event_id, subject_id, event_type, timestamp)
-            VALUES (?, ?, ?, ?);
+            INSERT INTO life_events
+                (event_id, subject_id, event_type, timestamp, description)
+            VALUES (?, ?, ?, ?, ?);
             """,
             (
                 self.event_id,
                 self.subject.uid,
                 self.event_type,
                 self.timestamp.to_iso_str(),
+                description if materialize else None,
             ),
         )
 
@@ -137,10 +306,16 @@ class LifeEvent(ABC):
 
         db.commit()
 
-        _logger.info(
-            "[%s]: %s",
-            str(self.timestamp),
-            get_life_event_description(self.world, self.event_id),
+        if log_description:
+            _logger.info("[%s]: %s", str(self.timestamp), description)
+
+    def render_description(self) -> str:
+        """Generate the description of this event from its type's template."""
+
+        return (
+            self.world.get_resource(LifeEventTypeLibrary)
+            .get_type(self.event_type)
+            .template.render(self.event_args)
         )
 
     def __repr__(self) -> str:
@@ -159,76 +334,116 @@ class LifeEvent(ABC):
 def get_life_event_timestamp(world: World, event_id: int) -> SimDate:
     """Get the timestamp for the life event with the given event ID."""
 
-    db = world.get_resource(SimDB).db
-    cursor = db.cursor()
+    db = world.get_resource(SimDB)
 
-    # First get the event information
-    timestamp: str = cursor.execute(
-        """
-        SELECT
-            timestamp
-        FROM life_events
-        WHERE life_events.event_id=?;
-        """,
-        (event_id,),
-    ).fetchone()[0]
+    result = db.query("life_event_timestamp", (event_id,))
+
+    if not result:
+        raise ValueError(f"Cannot find timestamp for: {event_id}")
+
+    timestamp: str = result[0][0]
 
     return SimDate.from_iso_str(timestamp)
 
 
+def _render_life_event_rows(
+    rows: Iterable[tuple[Any, ...]],
+) -> dict[int, tuple[SimDate, str]]:
+    """Build descriptions from the rows returned by the life_event_render queries."""
+
+    events: dict[int, tuple[str, Optional[str], str]] = {}
+    event_args: dict[int, dict[str, str]] = {}
+
+    for event_id, timestamp, description, template, name, value in rows:
+        if event_id not in events:
+            events[event_id] = (timestamp, description, template)
+
+        if name is not None:
+            event_args.setdefault(event_id, {})[name] = value
+
+    output: dict[int, tuple[SimDate, str]] = {}
+
+    for event_id, (timestamp, description, template) in events.items():
+        if description is None:
+            description = compile_description_template(template).render(
+                event_args.get(event_id, {})
+            )
+
+        output[event_id] = (SimDate.from_iso_str(timestamp), description)
+
+    return output
+
+
 def get_life_event_description(world: World, event_id: int) -> str:
     """Get the description for the life event with the given event ID."""
 
-    db = world.get_resource(SimDB).db
-    cursor = db.cursor()
-
-    # First get the event information
-    result: Optional[tuple[str,]] = cursor.execute(
-        """
-        SELECT
-            life_event_types.description
-        FROM life_events
-        JOIN life_event_types ON life_events.event_type=life_event_types.name
-        WHERE life_events.event_id=?;
-        """,
-        (event_id,),
-    ).fetchone()
+    rows = world.get_resource(SimDB).query("life_event_render", (event_id,))
 
-    if result is None:
+    if not rows:
         raise ValueError(f"Cannot find description template for: {event_id}")
 
-    description_template = result[0]
+    return _render_life_event_rows(rows)[event_id][1]
 
-    event_args: list[tuple[str, str]] = cursor.execute(
-        """
-        SELECT
-            name,
-            value
-        FROM life_event_args
-        WHERE event_id=?;
-        """,
-        (event_id,),
-    ).fetchall()
 
-    final_description = description_template
-    for k, v in event_args:
-        final_description = final_description.replace("{" + k + "}", v)
+def get_life_event_descriptions(
+    world: World, event_ids: Iterable[int]
+) -> dict[int, tuple[SimDate, str]]:
+    """Get the timestamps and descriptions for many life events in one query.
 
-    return final_description
+    Parameters
+    ----------
+    world
+        The simulation's world.
+    event_ids
+        The IDs of the life events to look up.
+
+    Returns
+    -------
+    dict[int, tuple[SimDate, str]]
+        Event IDs mapped to their timestamp and description. The mapping follows
+        the order of the given IDs. IDs without a matching event are skipped.
+    """
+
+    event_ids = list(event_ids)
+
+    if not event_ids:
+        return {}
+
+    rows = world.get_resource(SimDB).query(
+        "life_event_render_batch", (json.dumps(event_ids),)
+    )
+
+    rendered = _render_life_event_rows(rows)
+
+    return {i: rendered[i] for i in event_ids if i in rendered}
+
+
+def get_life_event_history(entity: Entity) -> list[tuple[int, SimDate, str]]:
+    """Get the ID, timestamp, and description of every life event about an entity.
+
+    The whole history is fetched and rendered in a single pass.
+
+    Returns
+    -------
+    list[tuple[int, SimDate, str]]
+        Life events in the order they were logged.
+    """
+
+    rows = entity.world.get_resource(SimDB).query(
+        "life_event_render_by_subject", (entity.uid,)
+    )
+
+    return [
+        (event_id, timestamp, description)
+        for event_id, (timestamp, description) in _render_life_event_rows(rows).items()
+    ]
 
 
 def get_life_event_ids(entity: Entity) -> list[int]:
     """Get the IDs for all life events related"""
 
-    world = entity.world
-    db = world.get_resource(SimDB).db
-    cursor = db.cursor()
+    db = entity.world.get_resource(SimDB)
 
-    result: list[tuple[int,]] = cursor.execute(
-        """
-        SELECT event_id FROM life_events WHERE subject_id=?;
-        """,
-        (entity.uid,),
-    ).fetchall()
+    result: list[tuple[int,]] = db.query("life_event_ids_by_subject", (entity.uid,))
 
     return [r[0] for r in result]
@@ -5,6 +5,8 @@ characters, families, alliance, territories, and more.
 
 """
 
+from __future__ import annotations
+
 import json
 import pathlib
 from typing import Optional, Union
@@ -19,15 +21,18 @@ from minerva.pcg.base_types import NameFactory
 class Tracery:
     """A class that wraps a tracery grammar instance."""
 
-    __slots__ = ("_grammar",)
+    __slots__ = ("_grammar", "_rules")
 
     _grammar: tracery.Grammar
     """The grammar instance."""
+    _rules: list[tuple[str, list[str]]]
+    """Rules in the order they were added to the grammar."""
 
     def __init__(self, rng_seed: Optional[Union[str, int]] = None) -> None:
         self._grammar = tracery.Grammar(
             dict[str, str](), modifiers=tracery_modifiers.base_english
         )
+        self._rules = []
         if rng_seed is not None:
             self._grammar.rng.seed(rng_seed)
 
@@ -51,6 +56,29 @@ class Tracery:
         """
         for rule_name, expansion in rules.items():
             self._grammar.push_rules(rule_name, expansion)
+            self._rules.append((rule_name, expansion))
+
+    def copy(self, rng_seed: Optional[Union[str, int]] = None) -> Tracery:
+        """Create a new grammar instance with the same rules.
+
+        Parameters
+        ----------
+        rng_seed
+            The seed for the new instance's RNG.
+
+        Returns
+        -------
+        Tracery
+            A grammar that can be modified independently of this one.
+        """
+        tracery_copy = Tracery(rng_seed)
+
+        for rule_name, expansion in self._rules:
+            tracery_copy._grammar.push_rules(rule_name, expansion)
+
+        tracery_copy._rules = list(self._rules)
+
+        return tracery_copy
 
     def generate(self, start_string: str) -> str:
         """Return a string generated using the grammar rules.
@@ -6,16 +6,20 @@ import random
 from itertools import product
 from typing import Any, Generator
 
+import numpy as np
+import numpy.typing as npt
+
 from minerva.config import Config
 from minerva.ecs import Entity, World
 from minerva.pcg.territory_pcg import spawn_territory
 from minerva.world_map.components import (
-    CartesianGrid,
+    ArrayGrid,
     CompassDir,
     Territory,
     TerritoryInfo,
     WorldMap,
 )
+from minerva.world_map.territory_index import TerritoryIndex
 
 TERRITORY_GENERATION_DEBUG_COLORS = [
     "#e90000",  # red
@@ -48,9 +52,11 @@ TERRITORY_GENERATION_DEBUG_COLORS = [
 class TerritoryGenerator:
     """Subdivides a rectangular world map into various territories.
 
-    This generator uses an iterative fill algorithm that starts territories
-    as 3x3 squares and fills the space outward until it reaches the border
-    of another territory or the edge of the map.
+    This generator uses a multi-source breadth-first flood fill that starts
+    territories at evenly spaced centroids and fills the space outward until it
+    reaches the border of another territory or the edge of the map. Each step of the
+    fill expands every territory's frontier by one cell using vectorized array
+    operations.
 
     """
 
@@ -64,12 +70,13 @@ class TerritoryGenerator:
         "is_complete",
     )
 
-    territory_grid: CartesianGrid[int]
-    borders: CartesianGrid[CompassDir]
+    territory_grid: ArrayGrid[int]
+    borders: ArrayGrid[CompassDir]
     n_territories: int
     territories: list[TerritoryInfo]
     rng: random.Random
-    frontier: list[tuple[int, int]]
+    frontier: tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]]
+    """The (y, x) coordinates of cells claimed during the previous fill step."""
 
     def __init__(
         self,
@@ -80,13 +87,13 @@ class TerritoryGenerator:
         if n_territories <= 1:
             raise ValueError("n_territories must be greater than 1")
 
-        self.territory_grid = CartesianGrid(size, lambda: -1)
-        self.borders = CartesianGrid(size, lambda: CompassDir.NONE)
+        self.territory_grid = ArrayGrid(size, -1, np.int64)
+        self.borders = ArrayGrid(size, CompassDir.NONE, np.uint8, CompassDir)
         self.n_territories = n_territories
         self.territories: list[TerritoryInfo] = []
         self.rng: random.Random = random.Random(seed)
         self.is_complete: bool = False
-        self.frontier = []
+        self.frontier = (np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp))
 
     def generate_territories(self) -> None:
         """Generates the territory information and borders in a single calls."""
@@ -108,28 +115,36 @@ class TerritoryGenerator:
         self.is_complete = True
 
     def _fill_regions(self) -> Generator[Any, Any, None]:
-        """Pop a single position from the frontier and fill the adjacent free space."""
+        """Expand every territory's frontier by one cell per step."""
 
-        while self.frontier:
+        grid = self.territory_grid.array
+        height, width = grid.shape
 
-            target_coord = self.frontier.pop(0)
-            target_territory_id = self.territory_grid.get(target_coord)
-            empty_neighbors = self._get_unclaimed_neighbors(target_coord)
+        while self.frontier[0].size:
+            frontier_ys, frontier_xs = self.frontier
+            claimed_ys: list[npt.NDArray[np.intp]] = []
+            claimed_xs: list[npt.NDArray[np.intp]] = []
 
-            for neighbor_coord in empty_neighbors:
-                self.territory_grid.set(neighbor_coord, target_territory_id)
-                self.frontier.append(neighbor_coord)
+            # Directions are visited in the same order as CartesianGrid.get_neighbors,
+            # so a cell reachable from multiple territories in the same step goes to
+            # the territory that reaches it from the north, then east, and so on.
+            for dx, dy in ((0, -1), (1, 0), (0, 1), (-1, 0)):
+                ys = frontier_ys + dy
+                xs = frontier_xs + dx
+                in_bounds = (ys >= 0) & (ys < height) & (xs >= 0) & (xs < width)
+                source_ys, source_xs = frontier_ys[in_bounds], frontier_xs[in_bounds]
+                ys, xs = ys[in_bounds], xs[in_bounds]
 
-            yield
+                unclaimed = grid[ys, xs] == -1
+                ys, xs = ys[unclaimed], xs[unclaimed]
 
-    def _get_unclaimed_neighbors(self, coord: tuple[int, int]) -> list[tuple[int, int]]:
-        empty_neighbors: list[tuple[int, int]] = []
+                grid[ys, xs] = grid[source_ys[unclaimed], source_xs[unclaimed]]
+                claimed_ys.append(ys)
+                claimed_xs.append(xs)
 
-        for neighbor_coord in self.territory_grid.get_neighbors(coord):
-            if self.territory_grid.get(neighbor_coord) == -1:
-                empty_neighbors.append(neighbor_coord)
+            self.frontier = (np.concatenate(claimed_ys), np.concatenate(claimed_xs))
 
-        return empty_neighbors
+            yield
 
     def _generate_centroids(self) -> None:
         """Generate starting castle positions to fill territories."""
@@ -151,12 +166,18 @@ class TerritoryGenerator:
         r = h % 3
         h_final = h - r
 
-        xs = list(range(int(w_final / 3)))
-        ys = list(range(int(h_final / 3)))
+        n_xs = int(w_final / 3)
+        n_ys = int(h_final / 3)
 
-        centroid_pos: list[tuple[int, int]] = self.rng.sample(
-            list(product(xs, ys)), k=self.n_territories
-        )
+        # Sampling bin indices selects the same bins as sampling the product of the
+        # bin coordinates without building the full list of coordinate pairs.
+        centroid_pos: list[tuple[int, int]] = [
+            divmod(i, n_ys)
+            for i in self.rng.sample(range(n_xs * n_ys), k=self.n_territories)
+        ]
+
+        frontier_ys: list[int] = []
+        frontier_xs: list[int] = []
 
         for i in range(self.n_territories):
 
@@ -180,95 +201,74 @@ class TerritoryGenerator:
             )
 
             self.territory_grid.set((x, y), i)
-            self.frontier.append((x, y))
+            frontier_xs.append(x)
+            frontier_ys.append(y)
 
-    def _determine_borders(self) -> None:
-        for (x, y), territory_id in self.territory_grid.enumerate():
-            wall_flags = CompassDir.NONE
-
-            # North
-            if (
-                self.territory_grid.in_bounds((x, y - 1))
-                and self.territory_grid.get((x, y - 1)) != territory_id
-            ):
-                wall_flags |= CompassDir.NORTH
-                self.territories[territory_id].neighbors.append(
-                    self.territory_grid.get((x, y - 1))
-                )
-
-            # East
-            if (
-                self.territory_grid.in_bounds((x + 1, y))
-                and self.territory_grid.get((x + 1, y)) != territory_id
-            ):
-                wall_flags |= CompassDir.EAST
-                self.territories[territory_id].neighbors.append(
-                    self.territory_grid.get((x + 1, y))
-                )
-
-            # South
-            if (
-                self.territory_grid.in_bounds((x, y + 1))
-                and self.territory_grid.get((x, y + 1)) != territory_id
-            ):
-                wall_flags |= CompassDir.SOUTH
-                self.territories[territory_id].neighbors.append(
-                    self.territory_grid.get((x, y + 1))
-                )
+        self.frontier = (
+            np.array(frontier_ys, dtype=np.intp),
+            np.array(frontier_xs, dtype=np.intp),
+        )
 
-            # West
-            if (
-                self.territory_grid.in_bounds((x - 1, y))
-                and self.territory_grid.get((x - 1, y)) != territory_id
-            ):
-                wall_flags |= CompassDir.WEST
-                self.territories[territory_id].neighbors.append(
-                    self.territory_grid.get((x - 1, y))
-                )
+    def _determine_borders(self) -> None:
+        grid = self.territory_grid.array
+        borders = np.zeros(grid.shape, dtype=np.uint8)
+
+        # Compare every cell against the cell shifted one step in each direction.
+        # Cells on the edge of the map never have walls facing outward.
+        vertical = grid[1:, :] != grid[:-1, :]
+        horizontal = grid[:, 1:] != grid[:, :-1]
+
+        borders[1:, :] |= vertical * np.uint8(CompassDir.NORTH)
+        borders[:-1, :] |= vertical * np.uint8(CompassDir.SOUTH)
+        borders[:, 1:] |= horizontal * np.uint8(CompassDir.WEST)
+        borders[:, :-1] |= horizontal * np.uint8(CompassDir.EAST)
+
+        self.borders.array = borders
+
+        # Collect unique pairs of territories that share a wall.
+        pairs = np.concatenate(
+            (
+                np.stack((grid[1:, :][vertical], grid[:-1, :][vertical]), axis=1),
+                np.stack((grid[:, 1:][horizontal], grid[:, :-1][horizontal]), axis=1),
+            )
+        )
+        pairs = np.unique(np.concatenate((pairs, pairs[:, ::-1])), axis=0)
 
-            self.borders.set((x, y), wall_flags)
+        for territory_id, neighbor_id in pairs.tolist():
+            self.territories[territory_id].neighbors.append(neighbor_id)
 
 
 def generate_world_map(world: World) -> None:
     """Divide the world map into territories and instantiate territories."""
 
     config = world.get_resource(Config)
-
     world_map = WorldMap(config.world_size)
-
     world.add_resource(world_map)
-
     territory_generator = TerritoryGenerator(
         config.world_size,
         config.n_territories,
     )
-
     territory_generator.generate_territories()
-
-    world_map.territory_grid = territory_generator.territory_grid.copy()
     world_map.territories = []
     world_map.borders = territory_generator.borders.copy()
-
     territory_id_to_entity: dict[int, Entity] = {}
-    territories: dict[int, Entity] = {}
-
+    territory_uids = np.empty(len(territory_generator.territories), dtype=np.int64)
     for territory_info in territory_generator.territories:
         territory = spawn_territory(world)
         territory_id_to_entity[territory_info.uid] = territory
-        territories[territory_info.uid] = territory
+        territory_uids[territory_info.uid] = territory.uid
         world_map.territories.append(territory)
-
         territory_component = territory.get_component(Territory)
         territory_component.castle_position = territory_info.castle_pos
-
-        # Convert the territory IDs to the UIDs of the territory objects
-        for coord, territory_id in world_map.territory_grid.enumerate():
-            if territory_id == territory.uid:
-                world_map.territory_grid.set(coord, territory.uid)
-
+    # Convert the territory IDs to the UIDs of the territory objects in one pass
+    world_map.territory_grid.array = territory_uids[
+        territory_generator.territory_grid.array
+    ]
+    territory_index = world.get_resource(TerritoryIndex)
     # Generate a the neighbor links
     for territory_info in territory_generator.territories:
         territory = territory_id_to_entity[territory_info.uid]
         territory_component = territory.get_component(Territory)
         for neighbor in territory_info.neighbors:
             territory_component.neighbors.append(territory_id_to_entity[neighbor])
+        territory_index.set_neighbors(territory, territory_component.neighbors)
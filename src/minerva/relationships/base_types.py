@@ -90,6 +90,8 @@ class RelationshipManager(Component):
 class Opinion(StatComponent):
     """Tracks a character's opinion of another."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         calculation_strategy: IStatCalculationStrategy,
@@ -101,6 +103,8 @@ class Opinion(StatComponent):
 class Attraction(StatComponent):
     """Tracks a character's romantic attraction to another."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         calculation_strategy: IStatCalculationStrategy,
@@ -244,15 +248,19 @@ class SocialRule:
 class SocialRuleLibrary:
     """Collection of all social rules that modify relationships."""
 
-    __slots__ = ("_rules",)
+    __slots__ = ("_rules", "_is_shared")
 
     _rules: dict[str, SocialRule]
+    _is_shared: bool
+    """Is the rules dict shared with a copy of this library."""
 
     def __init__(self) -> None:
         self._rules = {}
+        self._is_shared = False
 
     def add_rule(self, rule: SocialRule) -> None:
         """Add a social rule to the library."""
+        self._detach()
         self._rules[rule.rule_id] = rule
 
     def get_rule_by_id(self, rule_id: str) -> SocialRule:
@@ -262,3 +270,20 @@ class SocialRuleLibrary:
     def iter_rules(self) -> Iterable[SocialRule]:
         """Get an iterator to the collection of rules."""
         return iter(self._rules.values())
+
+    def copy(self) -> SocialRuleLibrary:
+        """Create a copy-on-write copy of the library.
+
+        The copy shares rules with this library until either one adds to them.
+        """
+        library = SocialRuleLibrary()
+        library._rules = self._rules
+        library._is_shared = True
+        self._is_shared = True
+        return library
+
+    def _detach(self) -> None:
+        """Stop sharing rules with copies of this library before modifying them."""
+        if self._is_shared:
+            self._rules = dict(self._rules)
+            self._is_shared = False
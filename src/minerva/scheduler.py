@@ -0,0 +1,165 @@
+"""Wake scheduler for date-driven systems.
+
+Some conditions only become true at a predictable point in time. Pregnancies come
+to term on their due date, characters die once their age reaches their lifespan,
+and revolts reach the point of no return a fixed number of months after they
+start. Rather than checking every entity each month, systems can ask the
+WakeScheduler to wake an entity at a given month (SimDate.total_months) and only
+process the entities that are due.
+
+Wake-ups are hints, not guarantees. The state of an entity may change between
+scheduling and waking (e.g., a trait shortens a character's lifespan or a revolt is
+quelled), so systems re-check their condition for each woken entity and reschedule
+the ones that are not ready yet. Scheduling an entity early is always safe.
+
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import Type
+
+from minerva.datetime import SimDate
+from minerva.ecs import Active, Component, Entity, World
+
+
+class WakeScheduler:
+    """Shared singleton that tracks when entities need to be processed.
+
+    Wake-ups are grouped into channels, keyed by the component type of the data
+    they are about (e.g., Pregnancy or Lifespan), so that each system only pops the
+    entities it is responsible for.
+    """
+
+    __slots__ = ("_months", "_buckets")
+
+    _months: dict[Type[Component], list[int]]
+    """Channels mapped to min-heaps of months with scheduled wake-ups."""
+    _buckets: dict[Type[Component], dict[int, dict[Entity, None]]]
+    """Channels mapped to months and the entities to wake during them."""
+
+    def __init__(self) -> None:
+        self._months = {}
+        self._buckets = {}
+
+    def schedule(self, channel: Type[Component], entity: Entity, month: int) -> None:
+        """Wake an entity during the given month.
+
+        Parameters
+        ----------
+        channel
+            The component type the wake-up is for.
+        entity
+            The entity to wake.
+        month
+            The month to wake the entity, as a SimDate.total_months value. Months
+            in the past are woken the next time the channel is polled.
+        """
+        buckets = self._buckets.setdefault(channel, {})
+
+        if (bucket := buckets.get(month)) is None:
+            bucket = {}
+            buckets[month] = bucket
+            heapq.heappush(self._months.setdefault(channel, []), month)
+
+        bucket[entity] = None
+
+    def pop_due(self, channel: Type[Component], month: int) -> list[Entity]:
+        """Remove and return the entities due on or before the given month.
+
+        Parameters
+        ----------
+        channel
+            The component type the wake-ups are for.
+        month
+            The current month, as a SimDate.total_months value.
+
+        Returns
+        -------
+        list[Entity]
+            The due entities, without duplicates, ordered by UID.
+        """
+        months = self._months.get(channel)
+
+        if not months or months[0] > month:
+            return []
+
+        buckets = self._buckets[channel]
+        due: dict[Entity, None] = {}
+
+        while months and months[0] <= month:
+            due.update(buckets.pop(heapq.heappop(months)))
+
+        return sorted(due, key=lambda entity: entity.uid)
+
+    def pending_count(self, channel: Type[Component]) -> int:
+        """Get the number of wake-ups scheduled for a channel."""
+        return sum(len(bucket) for bucket in self._buckets.get(channel, {}).values())
+
+    def clear(self) -> None:
+        """Remove all scheduled wake-ups."""
+        self._months.clear()
+        self._buckets.clear()
+
+
+def schedule_wake(
+    channel: Type[Component], entity: Entity, months_from_now: int = 0
+) -> None:
+    """Wake an entity a number of months after the current date.
+
+    This does nothing if the entity's world does not have a WakeScheduler.
+
+    Parameters
+    ----------
+    channel
+        The component type the wake-up is for.
+    entity
+        The entity to wake.
+    months_from_now
+        The number of months from the current date to wake the entity.
+    """
+    world = entity.world
+
+    if not world.has_resource(WakeScheduler):
+        return
+
+    world.get_resource(WakeScheduler).schedule(
+        channel,
+        entity,
+        world.get_resource(SimDate).total_months + max(0, months_from_now),
+    )
+
+
+def pop_due_entities(world: World, channel: Type[Component]) -> list[Entity]:
+    """Get the active entities with the channel's component that are due this month.
+
+    Wake-ups for entities that were destroyed, archived, deactivated, or no longer
+    have the channel's component are dropped.
+
+    Parameters
+    ----------
+    world
+        The world instance.
+    channel
+        The component type the wake-ups are for.
+
+    Returns
+    -------
+    list[Entity]
+        The due entities, ordered by UID.
+    """
+    if not world.has_resource(WakeScheduler):
+        return []
+
+    due = world.get_resource(WakeScheduler).pop_due(
+        channel, world.get_resource(SimDate).total_months
+    )
+
+    return [
+        entity
+        for entity in due
+        if entity.is_valid
+        and not world.is_archived(entity.uid)
+        and entity.has_component(Active)
+        and entity.has_component(channel)
+    ]
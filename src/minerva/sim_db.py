@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import re
 import sqlite3
+from collections import OrderedDict
+from typing import Any, Callable, ClassVar, Iterable, Optional
 
 
 DB_CONFIG = """
@@ -55,6 +58,8 @@ CREATE TABLE relations (
     FOREIGN KEY (target_id) REFERENCES characters(uid)
 ) STRICT;
 
+CREATE INDEX relations_character_idx ON relations (character_id, relation_type);
+
 CREATE TABLE character_traits (
     character_id INT NOT NULL,
     trait_id TEXT NOT NULL,
@@ -139,7 +144,8 @@ CREATE TABLE life_events (
     event_id INT NOT NULL PRIMARY KEY,
     subject_id INT NOT NULL,
     event_type TEXT,
-    timestamp TEXT
+    timestamp TEXT,
+    description TEXT
 ) STRICT;
 
 CREATE TABLE life_event_args (
@@ -149,6 +155,8 @@ CREATE TABLE life_event_args (
     PRIMARY KEY (event_id, name)
 ) STRICT;
 
+CREATE INDEX life_events_subject_idx ON life_events (subject_id);
+
 CREATE TABLE rulers (
     character_id INT NOT NULL,
     dynasty_id INT NOT NULL,
@@ -242,16 +250,317 @@ CREATE TABLE scheme_targets (
 """
 
 
+_WRITE_STATEMENT_PATTERN = re.compile(
+    r"^\s*(?:INSERT|REPLACE|UPDATE|DELETE)\b(?:\s+OR\s+\w+)?(?:\s+(?:INTO|FROM))?"
+    r"\s+(?:main\.)?[\"`\[]?(\w+)",
+    re.IGNORECASE,
+)
+"""Matches INSERT, REPLACE, UPDATE, and DELETE statements and their table name."""
+
+
+class _WriteTrackingCursor(sqlite3.Cursor):
+    """A cursor that reports executed statements to its connection."""
+
+    def execute(self, sql: str, parameters: Any = (), /) -> sqlite3.Cursor:
+        cursor = super().execute(sql, parameters)
+
+        if (listener := self.connection.write_listener) is not None:  # type: ignore
+            listener(sql)
+
+        return cursor
+
+    def executemany(self, sql: str, seq_of_parameters: Any, /) -> sqlite3.Cursor:
+        cursor = super().executemany(sql, seq_of_parameters)
+
+        if (listener := self.connection.write_listener) is not None:  # type: ignore
+            listener(sql)
+
+        return cursor
+
+
+class _WriteTrackingConnection(sqlite3.Connection):
+    """A connection that reports every statement executed through it.
+
+    The listener is called once per statement rather than once per row, so
+    executemany() calls are only reported once. Statements run using
+    executescript() are not reported.
+    """
+
+    write_listener: Optional[Callable[[str], None]]
+    """Called with the SQL text of each executed statement."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.write_listener = None
+
+    def cursor(self, factory: Any = _WriteTrackingCursor) -> sqlite3.Cursor:
+        return super().cursor(factory)
+
+    def execute(self, sql: str, parameters: Any = (), /) -> sqlite3.Cursor:
+        cursor = super().execute(sql, parameters)
+
+        if (listener := self.write_listener) is not None:
+            listener(sql)
+
+        return cursor
+
+    def executemany(self, sql: str, seq_of_parameters: Any, /) -> sqlite3.Cursor:
+        cursor = super().executemany(sql, seq_of_parameters)
+
+        if (listener := self.write_listener) is not None:
+            listener(sql)
+
+        return cursor
+
+
+class PreparedQuery:
+    """A named, read-only SQL statement registered with the simulation database."""
+
+    __slots__ = ("name", "sql", "tables")
+
+    name: str
+    """A unique name for the query."""
+    sql: str
+    """The SQL statement to execute."""
+    tables: tuple[str, ...]
+    """Names of the tables read by the statement."""
+
+    def __init__(self, name: str, sql: str, tables: Iterable[str]) -> None:
+        self.name = name
+        self.sql = sql
+        self.tables = tuple(tables)
+
+
 class SimDB:
-    """A simulation database."""
+    """A simulation database.
+
+    Besides the raw connection, the database exposes a small read-optimized query
+    layer. Queries are registered once by name using `SimDB.register_query()` and
+    executed with `SimDB.query()`. Since the SQL text of each query never changes,
+    SQLite reuses the compiled statement from the connection's statement cache.
+    Results are stored in an LRU cache and invalidated whenever one of the tables a
+    query reads from is written to.
+
+    Table writes are detected per statement by the connection rather than per row
+    by SQLite triggers, so tracking a table does not slow down bulk writes. Only
+    statements executed through `SimDB.db` (or its cursors) are detected.
+    """
+
+    __slots__ = (
+        "db",
+        "_table_versions",
+        "_tracked_tables",
+        "_statement_tables",
+        "_query_cache",
+        "_entity_versions",
+        "_tracking_entities",
+    )
+
+    _prepared_queries: ClassVar[dict[str, PreparedQuery]] = {}
+    """Named queries available to all database instances."""
+    _cache_size: ClassVar[int] = 512
+    """The max number of query results to keep cached."""
+    _statement_cache_size: ClassVar[int] = 256
+    """The number of compiled statements SQLite keeps per connection."""
+    _entity_columns: ClassVar[dict[str, tuple[str, ...]]] = {
+        "characters": ("uid", "family"),
+        "relations": ("character_id",),
+        "character_traits": ("character_id",),
+        "families": ("uid",),
+        "territories": ("uid",),
+    }
+    """Tables mapped to columns referencing entities whose data they describe."""
 
     db: sqlite3.Connection
     """Connection to the SQLite instance."""
+    _table_versions: dict[str, int]
+    """Table names mapped to the number of statements that wrote to them."""
+    _tracked_tables: set[str]
+    """Tables whose version is incremented on write."""
+    _statement_tables: dict[str, str]
+    """SQL statements mapped to the table they write ("" for reads)."""
+    _query_cache: OrderedDict[
+        tuple[str, tuple[Any, ...]], tuple[tuple[int, ...], list[tuple[Any, ...]]]
+    ]
+    """(query name, params) mapped to table versions and cached results."""
+    _entity_versions: dict[int, int]
+    """Entity UIDs mapped to the number of rows written that reference them."""
+    _tracking_entities: bool
+    """Have triggers been installed to track entity versions."""
 
-    def __init__(self, db_path: str = ":memory:") -> None:
-        self.db = sqlite3.connect(db_path)
+    def __init__(
+        self, db_path: str = ":memory:", template: Optional[SimDB] = None
+    ) -> None:
+        """
+        Parameters
+        ----------
+        db_path
+            The path to the database file or ":memory:".
+        template
+            An optional database to copy the schema and rows of. This is faster than
+            building the schema from scratch.
+        """
+        # The connection may be handed off to a background simulation thread.
+        # Callers are responsible for serializing access across threads.
+        self.db = sqlite3.connect(
+            db_path,
+            cached_statements=SimDB._statement_cache_size,
+            check_same_thread=False,
+            factory=_WriteTrackingConnection,
+        )
+        self._table_versions = {}
+        self._tracked_tables = set()
+        self._statement_tables = {}
+        self._query_cache = OrderedDict()
+        self._entity_versions = {}
+        self._tracking_entities = False
 
         # Initialize the database.
-        cur = self.db.cursor()
-        cur.executescript(DB_CONFIG)
-        self.db.commit()
+        if template is not None:
+            template.db.backup(self.db)
+        else:
+            cur = self.db.cursor()
+            cur.executescript(DB_CONFIG)
+            self.db.commit()
+
+        self.db.create_function(
+            "_minerva_entity_written", 1, self._on_entity_written, deterministic=False
+        )
+
+    @classmethod
+    def register_query(cls, name: str, sql: str, tables: Iterable[str]) -> None:
+        """Register a named read-only query.
+
+        Parameters
+        ----------
+        name
+            A unique name for the query.
+        sql
+            The SQL statement to execute. Use '?' placeholders for parameters.
+        tables
+            The names of all tables the statement reads from. Cached results are
+            invalidated when any of these tables is written to.
+        """
+        cls._prepared_queries[name] = PreparedQuery(name, sql, tables)
+
+    def query(
+        self, name: str, params: tuple[Any, ...] = (), use_cache: bool = True
+    ) -> list[tuple[Any, ...]]:
+        """Execute a named query and return all result rows.
+
+        Parameters
+        ----------
+        name
+            The name of a query registered with `SimDB.register_query()`.
+        params
+            Parameters bound to the query's placeholders.
+        use_cache
+            Should results be read from and saved to the result cache.
+
+        Returns
+        -------
+        list[tuple[Any, ...]]
+            The result rows. Cached results are shared, so callers must not modify
+            the returned list.
+        """
+        try:
+            prepared_query = SimDB._prepared_queries[name]
+        except KeyError as err:
+            raise KeyError(f"No query registered with name: {name}.") from err
+
+        if not use_cache:
+            return self.db.execute(prepared_query.sql, params).fetchall()
+
+        for table in prepared_query.tables:
+            if table not in self._tracked_tables:
+                self._track_table(table)
+
+        versions = tuple(self._table_versions[t] for t in prepared_query.tables)
+        key = (name, params)
+
+        if (entry := self._query_cache.get(key)) is not None and entry[0] == versions:
+            self._query_cache.move_to_end(key)
+            return entry[1]
+
+        result = self.db.execute(prepared_query.sql, params).fetchall()
+
+        self._query_cache[key] = (versions, result)
+        self._query_cache.move_to_end(key)
+
+        if len(self._query_cache) > SimDB._cache_size:
+            self._query_cache.popitem(last=False)
+
+        return result
+
+    def get_table_version(self, table: str) -> int:
+        """Get the number of statements that wrote to a table since it was tracked."""
+        if table not in self._tracked_tables:
+            self._track_table(table)
+
+        return self._table_versions[table]
+
+    def get_entity_version(self, uid: int) -> int:
+        """Get a counter that increases whenever rows describing an entity change.
+
+        Versions are tracked for the characters, relations, character_traits,
+        families, and territories tables. A family's version also changes when a
+        character joins or leaves it. Tracking starts the first time this method is
+        called, so versions are only comparable with other values it returned.
+        """
+        if not self._tracking_entities:
+            self._track_entities()
+
+        return self._entity_versions.get(uid, 0)
+
+    def clear_query_cache(self) -> None:
+        """Remove all cached query results."""
+        self._query_cache.clear()
+
+    def _track_table(self, table: str) -> None:
+        """Start incrementing a table's version when statements write to it."""
+        self._tracked_tables.add(table)
+        self._table_versions.setdefault(table, 0)
+        self.db.write_listener = self._on_statement_executed  # type: ignore
+
+    def _on_statement_executed(self, sql: str) -> None:
+        """Callback invoked by the connection after each executed statement."""
+        table = self._statement_tables.get(sql)
+
+        if table is None:
+            match = _WRITE_STATEMENT_PATTERN.match(sql)
+            table = match.group(1).lower() if match else ""
+            self._statement_tables[sql] = table
+
+        if table in self._tracked_tables:
+            self._table_versions[table] += 1
+
+    def _track_entities(self) -> None:
+        """Install triggers that increment entity versions when their rows change."""
+        for table, columns in SimDB._entity_columns.items():
+            for operation, rows in (
+                ("INSERT", ("NEW",)),
+                ("UPDATE", ("NEW", "OLD")),
+                ("DELETE", ("OLD",)),
+            ):
+                calls = ", ".join(
+                    f"_minerva_entity_written({row}.{column})"
+                    for row in rows
+                    for column in columns
+                )
+                self.db.execute(
+                    f"""
+                    CREATE TEMP TRIGGER IF NOT EXISTS
+                        _minerva_{table}_{operation.lower()}_entity_version
+                    AFTER {operation} ON main.{table}
+                    BEGIN
+                        SELECT {calls};
+                    END;
+                    """
+                )
+
+        self._tracking_entities = True
+
+    def _on_entity_written(self, uid: Optional[int]) -> None:
+        """Callback invoked by SQLite triggers when rows describing an entity change."""
+        if uid is not None:
+            self._entity_versions[uid] = self._entity_versions.get(uid, 0) + 1
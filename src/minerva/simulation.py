@@ -6,7 +6,8 @@ import logging
 import pathlib
 import random
 import sqlite3
-from typing import Optional
+import time
+from typing import Callable, Optional
 
 import minerva.actions.behaviors as behaviors
 import minerva.systems
@@ -57,12 +58,18 @@ from minerva.characters.components import (
     Species,
     SpeciesLibrary,
 )
+from minerva.characters.genealogy import GenealogyIndex
 from minerva.characters.succession_helpers import SuccessionChartCache
 from minerva.characters.war_data import WarRole
 from minerva.config import Config
 from minerva.datetime import SimDate
 from minerva.ecs import Entity, World
-from minerva.life_events.base_types import LifeEventType, register_life_event_type
+from minerva.history_stream import HistoryStream, open_history_stream
+from minerva.life_events.base_types import (
+    LifeEventType,
+    LifeEventTypeLibrary,
+    register_life_event_type,
+)
 from minerva.pcg.base_types import PCGFactories
 from minerva.pcg.character import (
     DefaultBabyFactory,
@@ -73,9 +80,11 @@ from minerva.pcg.territory_pcg import DefaultTerritoryFactory
 from minerva.pcg.text_gen import Tracery, TraceryNameFactory
 from minerva.relationships import social_rules
 from minerva.relationships.base_types import SocialRuleLibrary
+from minerva.scheduler import WakeScheduler
 from minerva.sim_db import SimDB
 from minerva.simulation_events import SimulationEvents
-from minerva.traits.base_types import TraitLibrary
+from minerva.traits.base_types import Trait, TraitLibrary
+from minerva.world_map.territory_index import TerritoryIndex
 
 
 class Simulation:
@@ -90,7 +99,11 @@ class Simulation:
     _world: World
     """The simulation's ECS instance."""
 
-    def __init__(self, config: Optional[Config] = None) -> None:
+    def __init__(
+        self,
+        config: Optional[Config] = None,
+        template: Optional[SimulationTemplate] = None,
+    ) -> None:
         """
         Parameters
         ----------
@@ -98,6 +111,9 @@ class Simulation:
             Configuration parameters for the simulation, by default None.
             Simulation will use a default configuration if no config is
             provided.
+        template
+            Pre-built content to clone instead of initializing the built-in
+            actions, behaviors, social rules, species, and life event types.
         """
         self._config = config if config is not None else Config()
         self._world = World()
@@ -106,18 +122,28 @@ class Simulation:
         # Seed the global rng for third-party packages
         random.seed(self._config.seed)
 
-        self.initialize_resources()
+        self.initialize_resources(template)
         self.initialize_systems()
         self.initialize_logging()
         self.initialize_database()
-        self.initialize_actions()
-        self.initialize_behaviors()
-        self.initialize_social_rules()
-        self.initialize_species_types()
-        self.initialize_life_event_types()
 
-    def initialize_resources(self) -> None:
-        """Initialize built-in resources."""
+        if template is None:
+            self.initialize_actions()
+            self.initialize_behaviors()
+            self.initialize_social_rules()
+            self.initialize_species_types()
+            self.initialize_life_event_types()
+
+    def initialize_resources(
+        self, template: Optional[SimulationTemplate] = None
+    ) -> None:
+        """Initialize built-in resources.
+
+        Parameters
+        ----------
+        template
+            A template to copy content libraries and the database from.
+        """
 
         self._world.add_resource(self._date)
         self._world.add_resource(self._config)
@@ -138,16 +164,65 @@ class Simulation:
                 ),
             )
         )
-        self._world.add_resource(SpeciesLibrary())
-        self._world.add_resource(TraitLibrary())
-        self._world.add_resource(SocialRuleLibrary())
         self._world.add_resource(SuccessionChartCache())
-        self._world.add_resource(AIBehaviorLibrary())
+        self._world.add_resource(GenealogyIndex(self._config.genealogy_max_depth))
+        self._world.add_resource(TerritoryIndex())
         self._world.add_resource(DynastyTracker())
-        self._world.add_resource(AIActionLibrary())
-        self._world.add_resource(Tracery(self.config.seed))
         self._world.add_resource(SimulationEvents())
-        self._world.add_resource(SimDB(self._config.db_path))
+        self._world.add_resource(WakeScheduler())
+
+        if template is None:
+            self._world.add_resource(SpeciesLibrary())
+            self._world.add_resource(TraitLibrary())
+            self._world.add_resource(SocialRuleLibrary())
+            self._world.add_resource(AIBehaviorLibrary())
+            self._world.add_resource(AIActionLibrary())
+            self._world.add_resource(LifeEventTypeLibrary())
+            self._world.add_resource(Tracery(self.config.seed))
+            self._world.add_resource(SimDB(self._config.db_path))
+        else:
+            template_world = template.world
+            self._world.add_resource(template_world.get_resource(SpeciesLibrary).copy())
+            self._world.add_resource(template_world.get_resource(TraitLibrary).copy())
+            self._world.add_resource(
+                template_world.get_resource(SocialRuleLibrary).copy()
+            )
+            self._world.add_resource(
+                template_world.get_resource(AIBehaviorLibrary).copy()
+            )
+            self._world.add_resource(
+                template_world.get_resource(AIActionLibrary).copy()
+            )
+            self._world.add_resource(
+                template_world.get_resource(LifeEventTypeLibrary).copy()
+            )
+            self._world.add_resource(
+                template_world.get_resource(Tracery).copy(self.config.seed)
+            )
+            self._world.add_resource(
+                SimDB(self._config.db_path, template=template_world.get_resource(SimDB))
+            )
+
+        # Shared definitions are archived by ID so that entities restored from cold
+        # storage reference the same instances as the rest of the simulation.
+        self._world.register_persistent_type(
+            Species,
+            lambda species: species.definition_id,
+            lambda world, key: world.get_resource(SpeciesLibrary).get_species(key),
+        )
+        self._world.register_persistent_type(
+            Trait,
+            lambda trait: trait.trait_id,
+            lambda world, key: world.get_resource(TraitLibrary).get_trait(key),
+        )
+
+        if self._config.history_stream_target:
+            self._world.add_resource(
+                open_history_stream(
+                    self._config.history_stream_target,
+                    self._config.history_stream_format,
+                )
+            )
 
     def initialize_systems(self) -> None:
         """Initialize built-in systems."""
@@ -155,6 +230,12 @@ class Simulation:
         self.world.add_system(
             minerva.systems.TimeSystem(),
         )
+        self.world.add_system(
+            minerva.systems.HistoryStreamSystem(),
+        )
+        self.world.add_system(
+            minerva.systems.EntityArchivalSystem(),
+        )
         self.world.add_system(
             minerva.systems.CharacterAgingSystem(),
         )
@@ -238,6 +319,9 @@ class Simulation:
         )
         self.world.add_system(minerva.systems.MapGenerationSystem())
 
+        self.world.set_system_workers(self._config.system_worker_threads)
+        self.world.set_access_verification(self._config.verify_system_access)
+
     def initialize_actions(self) -> None:
         """Initialize actions."""
         action_library = self.world.get_resource(AIActionLibrary)
@@ -1345,7 +1429,139 @@ class Simulation:
         """Advance the simulation by one timestep."""
         self._world.step()
 
+    def run(
+        self,
+        months: Optional[int] = None,
+        until: Optional[SimDate] = None,
+        time_budget_s: Optional[float] = None,
+        stop_when: Optional[Callable[[Simulation], bool]] = None,
+        on_tick: Optional[Callable[[Simulation], None]] = None,
+        tick_interval: int = 1,
+    ) -> int:
+        """Advance the simulation until a stopping condition is met.
+
+        At least one stopping condition (months, until, time_budget_s, or
+        stop_when) is required. The simulation stops as soon as any of them is met.
+
+        Parameters
+        ----------
+        months
+            The maximum number of timesteps to run.
+        until
+            Stop once the simulation reaches this date.
+        time_budget_s
+            Stop once this many seconds of wall-clock time have elapsed. The budget
+            is checked between timesteps, so the last timestep may overrun it.
+        stop_when
+            Called after every timestep. The simulation stops once it returns True
+            (e.g., when a dynasty ends).
+        on_tick
+            Called every tick_interval timesteps. Use this for progress reporting
+            or to save checkpoints.
+        tick_interval
+            The number of timesteps between calls to on_tick.
+
+        Returns
+        -------
+        int
+            The number of timesteps that were run.
+        """
+        if months is None and until is None and time_budget_s is None:
+            if stop_when is None:
+                raise ValueError("Simulation.run() requires a stopping condition.")
+
+        if months is not None and months < 0:
+            raise ValueError("months must be greater than or equal to 0.")
+
+        if tick_interval < 1:
+            raise ValueError("tick_interval must be greater than or equal to 1.")
+
+        step = self._world.step
+        current_date = self._date
+        max_steps = months if months is not None else -1
+        deadline = (
+            time.perf_counter() + time_budget_s if time_budget_s is not None else None
+        )
+        steps = 0
+
+        while steps != max_steps:
+            if until is not None and current_date >= until:
+                break
+
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+
+            step()
+            steps += 1
+
+            if on_tick is not None and steps % tick_interval == 0:
+                on_tick(self)
+
+            if stop_when is not None and stop_when(self):
+                break
+
+        return steps
+
+    def close(self) -> None:
+        """Flush and close the history stream, if the simulation has one.
+
+        Call this when the simulation is shut down so that file and socket stream
+        targets are released. The database stays open so the simulation can still
+        be inspected and exported.
+        """
+        if not self._world.has_resource(HistoryStream):
+            return
+
+        stream = self._world.get_resource(HistoryStream)
+        stream.flush(self._world.get_resource(SimDB).db)
+        stream.close()
+        self._world.remove_resource(HistoryStream)
+
     def export_db(self, export_path: str) -> None:
         """Export db to file on disk."""
         out = sqlite3.Connection(export_path)
         self.world.get_resource(SimDB).db.backup(out)
+
+
+class SimulationTemplate:
+    """Pre-built simulation content that new simulations are cloned from.
+
+    Building the action, behavior, social rule, species, trait, and life event
+    type definitions, loading Tracery files, and creating the database schema
+    is the same work for every simulation. A template does this work once.
+    Simulations created from it receive copy-on-write copies of the content
+    libraries, a copy of the Tracery rules, and a backup of the template's
+    pre-populated database.
+
+    Custom content (e.g., traits or Tracery files) should be loaded into the
+    template's world before creating simulations. The template's world should
+    never be stepped.
+    """
+
+    __slots__ = ("_simulation",)
+
+    _simulation: Simulation
+    """The simulation that holds the template's content."""
+
+    def __init__(self) -> None:
+        self._simulation = Simulation(Config(logging_enabled=False))
+
+    @property
+    def world(self) -> World:
+        """The ECS instance holding the template's content."""
+        return self._simulation.world
+
+    def create_simulation(self, config: Optional[Config] = None) -> Simulation:
+        """Create a new simulation using the template's content.
+
+        Parameters
+        ----------
+        config
+            Configuration parameters for the new simulation.
+
+        Returns
+        -------
+        Simulation
+            The new simulation.
+        """
+        return Simulation(config, template=self)
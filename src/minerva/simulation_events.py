@@ -3,7 +3,7 @@
 """
 
 from minerva.ecs import Entity
-from minerva.viz.game_events import EventEmitter
+from minerva.event_emitter import EventEmitter
 from minerva.world_map.components import WorldMap
 
 
@@ -2,6 +2,7 @@
 """Minerva Base Systems."""
 
 import logging
+import pickle
 import random
 from typing import Callable, ClassVar, Optional
 
@@ -41,6 +42,7 @@ from minerva.characters.components import (
     Sex,
     SexualOrientation,
 )
+from minerva.characters.genealogy import GenealogyIndex
 from minerva.characters.helpers import (
     assign_family_member_to_roles,
     get_advisor_candidates,
@@ -65,7 +67,11 @@ from minerva.characters.helpers import (
     remove_heir,
 )
 from minerva.characters.metric_data import CharacterMetrics
-from minerva.characters.stat_helpers import StatLevel, get_luck_level
+from minerva.characters.stat_helpers import (
+    StatLevel,
+    get_luck_level,
+    schedule_lifespan_check,
+)
 from minerva.characters.succession_helpers import (
     SuccessionChartCache,
     end_current_dynasty,
@@ -89,8 +95,19 @@ from minerva.characters.war_helpers import (
 )
 from minerva.config import Config
 from minerva.datetime import MONTHS_PER_YEAR, SimDate
-from minerva.ecs import Active, Entity, System, SystemGroup, World
+from minerva.ecs import (
+    Active,
+    Component,
+    Entity,
+    EntityId,
+    ResourceHandle,
+    System,
+    SystemGroup,
+    World,
+)
+from minerva.history_stream import HistoryStream
 from minerva.life_events.aging import LifeStageChangeEvent
+from minerva.life_events.base_types import LifeEventTypeLibrary
 from minerva.life_events.events import (
     AllianceFoundedEvent,
     AllianceSchemeFailedEvent,
@@ -111,9 +128,10 @@ from minerva.life_events.events import (
 from minerva.life_events.succession import BecameFamilyHeadEvent
 from minerva.pcg.base_types import FamilyGenOptions
 from minerva.pcg.character import spawn_baby_from, spawn_family
-from minerva.pcg.world_map import generate_world_map
 from minerva.relationships.base_types import Attraction, Opinion
 from minerva.relationships.helpers import get_relationship
+from minerva.scheduler import WakeScheduler, pop_due_entities
+from minerva.sim_db import SimDB
 from minerva.simulation_events import SimulationEvents
 from minerva.world_map.components import (
     InRevolt,
@@ -137,6 +155,203 @@ class TimeSystem(System):
         current_date.increment_month()
 
 
+class HistoryStreamSystem(System):
+    """Streams database rows committed during the tick to the history stream."""
+
+    __system_group__ = "LateUpdateSystems"
+    __update_order__ = ("last", "after:TimeSystem")
+
+    def on_update(self, world: World) -> None:
+        if not world.has_resource(HistoryStream):
+            return
+
+        world.get_resource(HistoryStream).flush(world.get_resource(SimDB).db)
+
+
+class EntityArchivalSystem(System):
+    """Periodically evicts inactive entities to cold storage.
+
+    Entities are archived once they have been inactive for a full archival interval
+    and nothing live references them. Live references are the direct attributes of
+    active entities' components and of resources, and the items of container
+    attributes (lists, sets, dicts, etc.). A reference to either the entity or one
+    of its components prevents archival. Archived entities are still restored
+    transparently if they are accessed through a deeper reference.
+    """
+
+    __system_group__ = "LateUpdateSystems"
+
+    __slots__ = ("_candidates",)
+
+    _candidates: set[EntityId]
+    """UIDs of entities that were inactive during the previous pass."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._candidates = set()
+
+    def on_update(self, world: World) -> None:
+        interval = world.get_resource(Config).entity_archive_interval
+
+        if interval <= 0:
+            return
+
+        if world.get_resource(SimDate).total_months % interval != 0:
+            return
+
+        inactive: set[EntityId] = set()
+        referenced: Optional[set[EntityId]] = None
+
+        # pylint: disable=protected-access
+        for entity in list(world._entity_slots):
+            if entity is None or (components := entity._components) is None:
+                continue
+
+            if Active in components:
+                continue
+
+            uid = entity.uid
+            inactive.add(uid)
+
+            if uid not in self._candidates:
+                continue
+
+            if referenced is None:
+                # Only scan for references when there is something to archive.
+                referenced = _get_live_references(world)
+
+            if uid in referenced:
+                continue
+
+            try:
+                world.archive_entity(entity)
+            except (ValueError, pickle.PicklingError, TypeError, AttributeError):
+                _logger.debug("Could not archive entity (%d).", uid)
+                continue
+
+            inactive.discard(uid)
+
+        self._candidates = inactive
+
+
+_IGNORED, _ENTITY, _COMPONENT, _MAPPING, _COLLECTION = range(5)
+"""How attribute values of a given type are checked for entity references."""
+
+_reference_kinds: dict[type, int] = {}
+"""Cache of attribute value types mapped to how they are checked."""
+
+_attribute_getters: dict[type, Callable[[object], tuple[object, ...]]] = {}
+"""Cache of types mapped to functions that get all of their slot attributes."""
+
+
+def _get_reference_kind(value_type: type) -> int:
+    """Get how attribute values of the given type are checked for references."""
+    if (kind := _reference_kinds.get(value_type)) is not None:
+        return kind
+
+    if issubclass(value_type, Entity):
+        kind = _ENTITY
+    elif issubclass(value_type, Component):
+        kind = _COMPONENT
+    elif issubclass(value_type, (str, bytes)):
+        kind = _IGNORED
+    elif issubclass(value_type, dict):
+        kind = _MAPPING
+    elif issubclass(value_type, (list, tuple, set, frozenset, OrderedSet)):
+        kind = _COLLECTION
+    else:
+        kind = _IGNORED
+
+    _reference_kinds[value_type] = kind
+    return kind
+
+
+def _get_attribute_getter(obj_type: type) -> Callable[[object], tuple[object, ...]]:
+    """Get a function that returns the values of a type's slot attributes."""
+    if (getter := _attribute_getters.get(obj_type)) is not None:
+        return getter
+
+    names: list[str] = []
+
+    for cls in obj_type.__mro__:
+        slots = cls.__dict__.get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name not in ("__dict__", "__weakref__"):
+                names.append(name)
+
+    def get_attributes(obj: object) -> tuple[object, ...]:
+        # Unassigned slots read as None, which is ignored.
+        return tuple(getattr(obj, name, None) for name in names)
+
+    _attribute_getters[obj_type] = get_attributes
+    return get_attributes
+
+
+def _add_object_references(obj: object, referenced: set[EntityId]) -> None:
+    """Record the entities referenced by an object's attributes.
+
+    Attributes and the items of container attributes are checked for entity handles
+    and components. Other objects are not searched.
+    """
+    kinds = _reference_kinds
+    values: list[object] = list(_get_attribute_getter(type(obj))(obj))
+
+    if (obj_dict := getattr(obj, "__dict__", None)) is not None:
+        values.extend(obj_dict.values())
+
+    items: list[object] = []
+
+    for value in values:
+        kind = kinds.get(type(value))
+
+        if kind is None:
+            kind = _get_reference_kind(type(value))
+
+        if kind == _IGNORED:
+            continue
+
+        if kind == _MAPPING:
+            items.extend(value.keys())  # type: ignore
+            items.extend(value.values())  # type: ignore
+        elif kind == _COLLECTION:
+            items.extend(value)  # type: ignore
+        else:
+            items.append(value)
+
+    for item in items:
+        kind = kinds.get(type(item))
+
+        if kind is None:
+            kind = _get_reference_kind(type(item))
+
+        if kind == _ENTITY:
+            referenced.add(item.uid)  # type: ignore
+        elif kind == _COMPONENT:
+            if (entity := getattr(item, "_entity", None)) is not None:
+                referenced.add(entity.uid)
+
+
+def _get_live_references(world: World) -> set[EntityId]:
+    """Get the UIDs of entities referenced by active entities and resources."""
+    # pylint: disable=protected-access
+    referenced: set[EntityId] = set()
+
+    for entity in world._entity_slots:
+        if entity is None or (components := entity._components) is None:
+            continue
+
+        if Active not in components:
+            continue
+
+        for component in components.values():
+            _add_object_references(component, referenced)
+
+    for resource in world._resources.values():
+        _add_object_references(resource, referenced)
+
+    return referenced
+
+
 class CharacterAgingSystem(System):
     """Age characters over time."""
 
@@ -232,22 +447,39 @@ class CharacterAgingSystem(System):
 
 
 class CharacterLifespanSystem(System):
-    """Kills of characters who have reached their lifespan."""
+    """Kills of characters who have reached their lifespan.
+
+    Characters are only checked when the WakeScheduler says they might be due.
+    """
 
     __system_group__ = "EarlyUpdateSystems"
 
+    def on_add(self, world: World) -> None:
+        world.observe_added(Lifespan, self._on_lifespan_added)
+
+    def on_destroy(self, world: World) -> None:
+        world.remove_observer(Lifespan, self._on_lifespan_added)
+
+    @staticmethod
+    def _on_lifespan_added(entity: Entity, _: Lifespan) -> None:
+        schedule_lifespan_check(entity)
+
     def on_update(self, world: World) -> None:
-        for _, (character, life_span, _) in world.query_components(
-            (Character, Lifespan, Active)
-        ):
-            if character.age >= life_span.value:
-                DieAction(character.entity, cause_of_death="old age").execute()
+        for entity in pop_due_entities(world, Lifespan):
+            character = entity.get_component(Character)
+
+            if character.age >= entity.get_component(Lifespan).value:
+                DieAction(entity, cause_of_death="old age").execute()
+            else:
+                schedule_lifespan_check(entity)
 
 
 class SuccessionDepthChartUpdateSystem(System):
     """Updates the succession depth chart for all family heads."""
 
     __system_group__ = "EarlyUpdateSystems"
+    __tick_interval__ = MONTHS_PER_YEAR
+    __stagger_entities__ = True
 
     def on_update(self, world: World) -> None:
         chart_cache = world.get_resource(SuccessionChartCache)
@@ -255,6 +487,9 @@ class SuccessionDepthChartUpdateSystem(System):
         for _, (character, _, _) in world.query_components(
             (Character, HeadOfFamily, Active)
         ):
+            if not self.is_entity_scheduled(world, character.entity):
+                continue
+
             chart_cache.get_chart_for(character.entity, recalculate=True)
 
 
@@ -472,10 +707,15 @@ class FamilyRoleSystem(System):
     """Automatically assign family members to empty family roles."""
 
     __system_group__ = "LateUpdateSystems"
+    __tick_interval__ = MONTHS_PER_YEAR
+    __stagger_entities__ = True
 
     def on_update(self, world: World) -> None:
         config = world.get_resource(Config)
         for _, (family_component, _) in world.query_components((Family, Active)):
+            if not self.is_entity_scheduled(world, family_component.entity):
+                continue
+
             # Fill advisor positions
             if len(family_component.advisors) < config.max_advisors_per_family:
                 candidates = get_advisor_candidates(family_component.entity)
@@ -522,6 +762,8 @@ class TerritoryRevoltSystem(System):
     """
 
     __system_group__ = "UpdateSystems"
+    __reads__ = (SimDate, Config, Territory, PopulationHappiness, LifeEventTypeLibrary)
+    __writes__ = (InRevolt, SimDB)
 
     def on_update(self, world: World) -> None:
         current_date = world.get_resource(SimDate)
@@ -542,7 +784,9 @@ class TerritoryRevoltSystem(System):
             if territory.controlling_family is None:
                 continue
 
-            territory.entity.add_component(InRevolt(start_date=current_date))
+            world.commands.add_component(
+                territory.entity, InRevolt(start_date=current_date)
+            )
 
             RevoltEvent(
                 subject=territory.controlling_family,
@@ -551,25 +795,56 @@ class TerritoryRevoltSystem(System):
 
 
 class RevoltUpdateSystem(System):
-    """Updates existing revolts."""
+    """Updates existing revolts.
+
+    Revolts are only checked when the WakeScheduler says they might be due.
+    """
 
     __system_group__ = "UpdateSystems"
 
+    _scheduler: ResourceHandle[WakeScheduler]
+    """The world's wake scheduler."""
+    _config: ResourceHandle[Config]
+    """The world's simulation config."""
+
+    def on_add(self, world: World) -> None:
+        self._scheduler = world.resource_handle(WakeScheduler)
+        self._config = world.resource_handle(Config)
+        world.observe_added(InRevolt, self._on_revolt_started)
+
+    def on_destroy(self, world: World) -> None:
+        world.remove_observer(InRevolt, self._on_revolt_started)
+
+    def _on_revolt_started(self, entity: Entity, in_revolt: InRevolt) -> None:
+        self._scheduler.value.schedule(
+            InRevolt,
+            entity,
+            in_revolt.start_date.total_months
+            + self._config.value.months_to_quell_revolt,
+        )
+
     def on_update(self, world: World) -> None:
         current_date = world.get_resource(SimDate)
-        config = world.get_resource(Config)
+        config = self._config.value
+        scheduler = self._scheduler.value
 
-        for _, (territory, happiness, in_revolt, _) in world.query_components(
-            (Territory, PopulationHappiness, InRevolt, Active)
-        ):
+        for entity in pop_due_entities(world, InRevolt):
+            territory = entity.get_component(Territory)
+            happiness = entity.get_component(PopulationHappiness)
+            in_revolt = entity.get_component(InRevolt)
             elapsed_months = (current_date - in_revolt.start_date).total_months
 
             # Ignore territories that have not reached the point of no return
             if elapsed_months < config.months_to_quell_revolt:
+                scheduler.schedule(
+                    InRevolt,
+                    entity,
+                    in_revolt.start_date.total_months + config.months_to_quell_revolt,
+                )
                 continue
 
             if territory.controlling_family is None:
-                territory.entity.remove_component(InRevolt)
+                world.commands.remove_component(territory.entity, InRevolt)
                 happiness.base_value = config.base_territory_happiness
                 continue
 
@@ -580,7 +855,7 @@ class RevoltUpdateSystem(System):
                 character_component = family_head.get_component(Character)
                 character_component.influence_points -= 500
 
-            territory.entity.remove_component(InRevolt)
+            world.commands.remove_component(territory.entity, InRevolt)
             happiness.base_value = config.base_territory_happiness
 
             if controlling_family_component.head:
@@ -714,9 +989,13 @@ class InfluencePointGainSystem(System):
     """Increases the influence points for characters."""
 
     __system_group__ = "EarlyUpdateSystems"
+    __reads__ = (Config, SimDate, Ruler, HeadOfFamily, Diplomacy)
+    __writes__ = (Character,)
 
     def on_update(self, world: World) -> None:
         config = world.get_resource(Config)
+        current_date = world.get_resource(SimDate)
+        log_debug = _logger.isEnabledFor(logging.DEBUG)
 
         for _, (character, _) in world.query_components((Character, Active)):
             influence_gain: int = 1
@@ -739,18 +1018,21 @@ class InfluencePointGainSystem(System):
 
             character.influence_points = max(0, character.influence_points)
 
-            _logger.debug(
-                "[%s]: %s has %d influence points",
-                world.get_resource(SimDate).to_iso_str(),
-                character.entity.name_with_uid,
-                character.influence_points,
-            )
+            if log_debug:
+                _logger.debug(
+                    "[%s]: %s has %d influence points",
+                    current_date.to_iso_str(),
+                    character.entity.name_with_uid,
+                    character.influence_points,
+                )
 
 
 class TerritoryInfluencePointBoostSystem(System):
     """The head of a family that controls a territory gets a influence point increase."""
 
     __system_group__ = "EarlyUpdateSystems"
+    __reads__ = (Territory, Family)
+    __writes__ = (Character,)
 
     def on_update(self, world: World) -> None:
         for _, (territory, _) in world.query_components((Territory, Active)):
@@ -774,6 +1056,8 @@ class PlaceholderMarriageSystem(System):
 
     def on_update(self, world: World) -> None:
         rng = world.get_resource(random.Random)
+        config = world.get_resource(Config)
+        genealogy = world.get_resource(GenealogyIndex)
         chance_get_married = 1.0 / 12.0
         for _, (character, _) in world.query_components((Character, Active)):
             if character.spouse:
@@ -807,14 +1091,9 @@ class PlaceholderMarriageSystem(System):
                         or c.sexual_orientation == SexualOrientation.BISEXUAL
                         or c.sexual_orientation == SexualOrientation.ASEXUAL
                     )
-                    and c.entity not in character.siblings
-                    and c.entity != character.mother
-                    and c.entity != character.father
-                    and c.entity != character.biological_father
-                    and c.entity not in character.children
-                    and c.entity not in character.grandchildren
-                    and c.entity not in character.grandparents
-                    and len(c.grandparents.intersection(character.grandparents)) < 2
+                    and not genealogy.are_related(
+                        character.entity, c.entity, config.max_marriage_kinship_degree
+                    )
                     and c != character
                 ]
 
@@ -835,14 +1114,9 @@ class PlaceholderMarriageSystem(System):
                         or c.sexual_orientation == SexualOrientation.BISEXUAL
                         or c.sexual_orientation == SexualOrientation.ASEXUAL
                     )
-                    and c.entity not in character.siblings
-                    and c.entity != character.mother
-                    and c.entity != character.father
-                    and c.entity != character.biological_father
-                    and c.entity not in character.children
-                    and c.entity not in character.grandchildren
-                    and c.entity not in character.grandparents
-                    and len(c.grandparents.intersection(character.grandparents)) < 2
+                    and not genealogy.are_related(
+                        character.entity, c.entity, config.max_marriage_kinship_degree
+                    )
                     and c != character
                 ]
 
@@ -863,14 +1137,9 @@ class PlaceholderMarriageSystem(System):
                         or c.sexual_orientation == SexualOrientation.BISEXUAL
                         or c.sexual_orientation == SexualOrientation.ASEXUAL
                     )
-                    and c.entity not in character.siblings
-                    and c.entity != character.mother
-                    and c.entity != character.father
-                    and c.entity != character.biological_father
-                    and c.entity not in character.children
-                    and c.entity not in character.grandchildren
-                    and c.entity not in character.grandparents
-                    and len(c.grandparents.intersection(character.grandparents)) < 2
+                    and not genealogy.are_related(
+                        character.entity, c.entity, config.max_marriage_kinship_degree
+                    )
                     and c != character
                 ]
 
@@ -891,14 +1160,9 @@ class PlaceholderMarriageSystem(System):
                         or c.sexual_orientation == SexualOrientation.BISEXUAL
                         or c.sexual_orientation == SexualOrientation.ASEXUAL
                     )
-                    and c.entity not in character.siblings
-                    and c.entity != character.mother
-                    and c.entity != character.father
-                    and c.entity != character.biological_father
-                    and c.entity not in character.children
-                    and c.entity not in character.grandchildren
-                    and c.entity not in character.grandparents
-                    and len(c.grandparents.intersection(character.grandparents)) < 2
+                    and not genealogy.are_related(
+                        character.entity, c.entity, config.max_marriage_kinship_degree
+                    )
                     and c != character
                 ]
 
@@ -918,11 +1182,9 @@ class PlaceholderMarriageSystem(System):
                         c.sexual_orientation == SexualOrientation.HOMOSEXUAL
                         or c.sexual_orientation == SexualOrientation.BISEXUAL
                     )
-                    and c.entity not in character.siblings
-                    and c.entity != character.mother
-                    and c.entity != character.father
-                    and c.entity != character.biological_father
-                    and c.entity not in character.children
+                    and not genealogy.are_related(
+                        character.entity, c.entity, config.max_marriage_kinship_degree
+                    )
                     and c != character
                 ]
 
@@ -942,11 +1204,9 @@ class PlaceholderMarriageSystem(System):
                         c.sexual_orientation == SexualOrientation.HOMOSEXUAL
                         or c.sexual_orientation == SexualOrientation.BISEXUAL
                     )
-                    and c.entity not in character.siblings
-                    and c.entity != character.mother
-                    and c.entity != character.father
-                    and c.entity != character.biological_father
-                    and c.entity not in character.children
+                    and not genealogy.are_related(
+                        character.entity, c.entity, config.max_marriage_kinship_degree
+                    )
                     and c != character
                 ]
 
@@ -965,11 +1225,9 @@ class PlaceholderMarriageSystem(System):
                         c.sexual_orientation == SexualOrientation.ASEXUAL
                         or c.sexual_orientation == SexualOrientation.BISEXUAL
                     )
-                    and c.entity not in character.siblings
-                    and c.entity != character.mother
-                    and c.entity != character.father
-                    and c.entity != character.biological_father
-                    and c.entity not in character.children
+                    and not genealogy.are_related(
+                        character.entity, c.entity, config.max_marriage_kinship_degree
+                    )
                     and c != character
                 ]
 
@@ -1093,15 +1351,37 @@ class PregnancyPlaceHolderSystem(System):
 
 
 class ChildBirthSystem(System):
-    """Spawns new children when pregnant characters reach their due dates."""
+    """Spawns new children when pregnant characters reach their due dates.
+
+    Pregnancies are only checked when the WakeScheduler says they might be due.
+    """
+
+    _scheduler: ResourceHandle[WakeScheduler]
+    """The world's wake scheduler."""
+
+    def on_add(self, world: World) -> None:
+        self._scheduler = world.resource_handle(WakeScheduler)
+        world.observe_added(Pregnancy, self._on_pregnancy_added)
+
+    def on_destroy(self, world: World) -> None:
+        world.remove_observer(Pregnancy, self._on_pregnancy_added)
+
+    def _on_pregnancy_added(self, entity: Entity, pregnancy: Pregnancy) -> None:
+        self._scheduler.value.schedule(
+            Pregnancy, entity, pregnancy.due_date.total_months
+        )
 
     def on_update(self, world: World) -> None:
         current_date = world.get_resource(SimDate)
+        scheduler = self._scheduler.value
+
+        for entity in pop_due_entities(world, Pregnancy):
+            character = entity.get_component(Character)
+            pregnancy = entity.get_component(Pregnancy)
+            fertility = entity.get_component(Fertility)
 
-        for _, (character, pregnancy, fertility, _) in world.query_components(
-            (Character, Pregnancy, Fertility, Active)
-        ):
             if pregnancy.due_date > current_date:
+                scheduler.schedule(Pregnancy, entity, pregnancy.due_date.total_months)
                 continue
 
             father = pregnancy.actual_father
@@ -1172,6 +1452,8 @@ class ActionCooldownSystem(System):
     """Update all active schemes."""
 
     __system_group__ = "EarlyUpdateSystems"
+    __reads__ = ()
+    __writes__ = (AIBrain,)
 
     def on_update(self, world: World) -> None:
         for _, (brain, _) in world.query_components((AIBrain, Active)):
@@ -1703,6 +1985,7 @@ class FamilyRefillSystem(System):
     """Spawns new families in territories that have too few families."""
 
     __system_group__ = "UpdateSystems"
+    __tick_interval__ = MONTHS_PER_YEAR
 
     def on_update(self, world: World) -> None:
         current_date = world.get_resource(SimDate)
@@ -1724,6 +2007,8 @@ class HeirDeclarationSystem(System):
     """Family heads missing an heir will try to name an heir."""
 
     __system_group__ = "UpdateSystems"
+    __tick_interval__ = MONTHS_PER_YEAR
+    __stagger_entities__ = True
 
     @staticmethod
     def get_oldest_child(character: Character) -> Optional[Entity]:
@@ -1753,6 +2038,9 @@ class HeirDeclarationSystem(System):
         for _, (character, _, _) in world.query_components(
             (Character, HeadOfFamily, Active)
         ):
+            if not self.is_entity_scheduled(world, character.entity):
+                continue
+
             if character.heir is not None:
                 continue
 
@@ -1773,10 +2061,16 @@ class HeirDeclarationSystem(System):
 class OrphanIdentificationSystem(System):
     """Identifies orphans in a family."""
 
+    __tick_interval__ = MONTHS_PER_YEAR
+    __stagger_entities__ = True
+
     def on_update(self, world: World) -> None:
         current_date = world.get_resource(SimDate)
 
         for _, (character, _) in world.query_components((Character, Active)):
+            if not self.is_entity_scheduled(world, character.entity):
+                continue
+
             mother = character.mother
             father = character.father
 
@@ -1795,6 +2089,9 @@ class OrphanIdentificationSystem(System):
 class OrphanAdoptionSystem(System):
     """Identify family heads without children."""
 
+    __tick_interval__ = MONTHS_PER_YEAR
+    __stagger_entities__ = True
+
     @staticmethod
     def is_orphan(character: Character) -> bool:
         """Check if a character is an orphan."""
@@ -1831,6 +2128,9 @@ class OrphanAdoptionSystem(System):
         for _, (character, _, _) in world.query_components(
             (Character, HeadOfFamily, Active)
         ):
+            if not self.is_entity_scheduled(world, character.entity):
+                continue
+
             if character.life_stage < LifeStage.ADULT:
                 continue
 
@@ -1843,7 +2143,7 @@ class OrphanAdoptionSystem(System):
             if orphans:
 
                 chosen_orphan = rng.choice(orphans)
-                character.children.add(chosen_orphan)
+                set_relation_child(character.entity, chosen_orphan)
                 _logger.info(
                     "[%s]: %s adopted %s.",
                     current_date.to_iso_str(),
@@ -1963,6 +2263,11 @@ class MapGenerationSystem(System):
     __system_group__ = "InitializationSystems"
 
     def on_update(self, world: World) -> None:
+        # Map generation pulls in NumPy, so it is imported on first use to keep
+        # `import minerva.simulation` light.
+        # pylint: disable-next=import-outside-toplevel
+        from minerva.pcg.world_map import generate_world_map
+
         generate_world_map(world)
         _logger.info("Generating map and territories.")
         world.get_resource(SimulationEvents).map_generated.emit(
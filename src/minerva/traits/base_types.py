@@ -125,12 +125,16 @@ class TraitLibrary:
 
     traits: dict[str, Trait]
     """Trait instances."""
+    _is_shared: bool
+    """Is the traits dict shared with a copy of this library."""
 
     def __init__(self) -> None:
         self.traits = {}
+        self._is_shared = False
 
     def add_trait(self, trait: Trait) -> None:
         """Add trait to the library."""
+        self._detach()
         self.traits[trait.trait_id] = trait
 
     def get_trait(self, trait_id: str) -> Trait:
@@ -143,3 +147,20 @@ class TraitLibrary:
         return get_with_tags(
             options=[(d, d.tags) for d in self.traits.values()], tags=tags
         )
+
+    def copy(self) -> TraitLibrary:
+        """Create a copy-on-write copy of the library.
+
+        The copy shares traits with this library until either one adds to them.
+        """
+        library = TraitLibrary()
+        library.traits = self.traits
+        library._is_shared = True
+        self._is_shared = True
+        return library
+
+    def _detach(self) -> None:
+        """Stop sharing traits with copies of this library before modifying them."""
+        if self._is_shared:
+            self.traits = dict(self.traits)
+            self._is_shared = False
@@ -21,6 +21,7 @@ from minerva.characters.components import (
     Stewardship,
     Vengefulness,
 )
+from minerva.characters.stat_helpers import schedule_lifespan_check
 from minerva.ecs import Entity
 from minerva.relationships.base_types import RelationshipManager, RelationshipModifier
 from minerva.stats.base_types import StatModifier
@@ -40,9 +41,11 @@ class AddLifespanModifier(TraitEffect):
 
     def apply(self, target: Entity) -> None:
         target.get_component(Lifespan).add_modifier(self.modifier)
+        schedule_lifespan_check(target)
 
     def remove(self, target: Entity) -> None:
         target.get_component(Lifespan).remove_modifier(self.modifier)
+        schedule_lifespan_check(target)
 
 
 class AddFertilityModifier(TraitEffect):
@@ -0,0 +1,108 @@
+"""Sprite Atlas.
+
+Many sprites in the visualization share identical images (every grass tile, every
+border tile with the same colors and walls, every banner for the same family). The
+SpriteAtlas renders each unique image once, packs it into a large shared page
+surface, and hands out subsurfaces of that page. Subsequent requests for the same
+key return the cached subsurface without any drawing.
+
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Hashable
+
+import pygame
+from pygame import SRCALPHA
+from pygame.surface import Surface
+
+from minerva.viz.constants import TILE_SIZE
+
+
+class SpriteAtlas:
+    """Packs fixed-size tile images into shared pages and caches them by key."""
+
+    __slots__ = ("_tile_size", "_tiles_per_row", "_pages", "_regions")
+
+    _tile_size: int
+    """The width and height of every tile in the atlas."""
+    _tiles_per_row: int
+    """The number of tiles along each side of a page."""
+    _pages: list[Surface]
+    """Surfaces containing the packed tile images."""
+    _regions: dict[Hashable, Surface]
+    """Keys mapped to subsurfaces of the pages."""
+
+    def __init__(self, tile_size: int = TILE_SIZE, tiles_per_row: int = 32) -> None:
+        self._tile_size = tile_size
+        self._tiles_per_row = tiles_per_row
+        self._pages = []
+        self._regions = {}
+
+    def __len__(self) -> int:
+        return len(self._regions)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._regions
+
+    @property
+    def page_count(self) -> int:
+        """The number of pages allocated by the atlas."""
+        return len(self._pages)
+
+    def get(self, key: Hashable, render: Callable[[], Surface]) -> Surface:
+        """Get the image for a key, rendering and packing it if necessary.
+
+        Parameters
+        ----------
+        key
+            A hashable description of the image (e.g. its colors and shape).
+        render
+            A function that draws the image. Only called when the key is not cached.
+
+        Returns
+        -------
+        Surface
+            A subsurface of an atlas page. Callers must not draw onto it.
+        """
+        if (region := self._regions.get(key)) is not None:
+            return region
+
+        image = render()
+
+        if image.get_size() != (self._tile_size, self._tile_size):
+            raise ValueError(
+                f"Atlas images must be {self._tile_size}x{self._tile_size} pixels."
+            )
+
+        page_index, slot = divmod(len(self._regions), self._tiles_per_row**2)
+
+        if page_index == len(self._pages):
+            page_size = self._tiles_per_row * self._tile_size
+            self._pages.append(Surface((page_size, page_size), SRCALPHA))
+
+        rect = pygame.Rect(
+            (slot % self._tiles_per_row) * self._tile_size,
+            (slot // self._tiles_per_row) * self._tile_size,
+            self._tile_size,
+            self._tile_size,
+        )
+
+        # Pages start fully transparent, so taking the per-channel max copies the
+        # image (including its alpha) exactly instead of blending it.
+        page = self._pages[page_index]
+        page.blit(image, rect, special_flags=pygame.BLEND_RGBA_MAX)
+
+        region = page.subsurface(rect)
+        self._regions[key] = region
+
+        return region
+
+    def clear(self) -> None:
+        """Remove all cached images."""
+        self._pages.clear()
+        self._regions.clear()
+
+
+sprite_atlas = SpriteAtlas()
+"""The atlas shared by the visualization's sprites."""
@@ -16,6 +16,8 @@ from pygame.color import Color
 from pygame.sprite import Sprite
 from pygame.surface import Surface
 
+from minerva.viz.atlas import sprite_atlas
+
 
 class FamilyBannerFactory:
     """Creates instances of 32x32 family banners."""
@@ -29,6 +31,21 @@ class FamilyBannerFactory:
     BANNER_CENTER_SIZE: ClassVar[int] = 16
     TILE_SIZE: ClassVar[int] = 32
 
+    def get_banner_image(
+        self,
+        color_primary: str,
+        color_secondary: str,
+        color_tertiary: str,
+        shape: str,
+    ) -> Surface:
+        """Get the shared banner image for a color and shape combination."""
+        return sprite_atlas.get(
+            ("banner", color_primary, color_secondary, color_tertiary, shape),
+            lambda: self.create_banner_image(
+                color_primary, color_secondary, color_tertiary, shape
+            ),
+        )
+
     def create_banner_image(
         self,
         color_primary: str,
@@ -179,6 +196,6 @@ class FamilyBannerSprite(Sprite):
         shape: str,
     ) -> Surface:
 
-        return FamilyBannerFactory().create_banner_image(
+        return FamilyBannerFactory().get_banner_image(
             color_primary, color_secondary, color_tertiary, shape
         )
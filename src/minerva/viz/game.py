@@ -3,53 +3,141 @@
 from __future__ import annotations
 
 import pathlib
+import threading
+from typing import Any, ClassVar, Optional
 
 import pygame
-import pygame.gfxdraw
 import pygame_gui
 import pygame_gui.elements.ui_panel
 import pygame_gui.ui_manager
 
-from minerva.characters.components import Dynasty, DynastyTracker
 from minerva.simulation import Simulation
-from minerva.simulation_events import SimulationEvents
 from minerva.viz.camera import Camera
 from minerva.viz.constants import TILE_SIZE
 from minerva.viz.game_events import event_wiki_shown
-from minerva.viz.tile_sprites import (
-    BorderSprite,
-    CastleSprite,
-    CrownSprite,
-    LabelSprite,
-    TerrainType,
-    get_terrain_tile,
+from minerva.viz.map_layer import DEFAULT_BORDER_COLORS, StaticMapLayer
+from minerva.viz.snapshots import (
+    RenderSnapshot,
+    SimulationWorker,
+    SnapshotBuffer,
+    build_render_snapshot,
 )
+from minerva.viz.tile_sprites import CastleSprite, CrownSprite, LabelSprite
 from minerva.viz.utils import draw_text
-from minerva.viz.wiki import WikiWindow
-from minerva.world_map.components import CompassDir, Territory, WorldMap
+from minerva.viz.wiki import WikiPageCache, WikiWindow
+from minerva.world_map.components import WorldMap
 
 
 class YSortCameraGroup(pygame.sprite.Group):  # type: ignore
-    """This sprite group functions as a camera and sorts sprites by y-coordinate."""
+    """This sprite group functions as a camera and sorts sprites by y-coordinate.
+
+    Sprites are bucketed into a coarse grid of chunks based on their rects. Each
+    frame, only sprites in chunks that intersect the viewport are sorted and drawn.
+    Sprites that move after being added must be passed to `refresh_sprite()`.
+
+    """
+
+    CHUNK_SIZE: ClassVar[int] = 16 * TILE_SIZE
+    """The width and height of each spatial chunk in pixels."""
 
     def __init__(
         self, display_surface: pygame.surface.Surface, speed: int = 10
     ) -> None:
+        self._chunks: dict[tuple[int, int], dict[pygame.sprite.Sprite, None]] = {}
+        self._sprite_chunks: dict[pygame.sprite.Sprite, list[tuple[int, int]]] = {}
         super().__init__()  # type: ignore
         self.display_surface = display_surface
         self.offset = pygame.math.Vector2(64, 64)
         self.speed = speed
 
+    @property
+    def viewport(self) -> pygame.Rect:
+        """The region of the world (in pixels) visible on the display surface."""
+        return pygame.Rect(
+            -int(self.offset.x),
+            -int(self.offset.y),
+            self.display_surface.get_width(),
+            self.display_surface.get_height(),
+        )
+
+    def add_internal(self, sprite: Any, layer: Any = None) -> None:
+        super().add_internal(sprite, layer)  # type: ignore
+        self._insert_into_chunks(sprite)
+
+    def remove_internal(self, sprite: Any) -> None:
+        super().remove_internal(sprite)  # type: ignore
+        self._remove_from_chunks(sprite)
+
+    def refresh_sprite(self, sprite: pygame.sprite.Sprite) -> None:
+        """Update the chunks of a sprite after its rect has changed."""
+        self._remove_from_chunks(sprite)
+        self._insert_into_chunks(sprite)
+
+    def get_visible_sprites(self) -> list[pygame.sprite.Sprite]:
+        """Get the sprites in chunks that intersect the viewport."""
+        viewport = self.viewport
+        min_cx, min_cy, max_cx, max_cy = self._get_chunk_range(viewport)
+
+        visible: dict[pygame.sprite.Sprite, None] = {}
+
+        for cy in range(min_cy, max_cy + 1):
+            for cx in range(min_cx, max_cx + 1):
+                if chunk := self._chunks.get((cx, cy)):
+                    visible.update(chunk)
+
+        return list(visible)
+
     def custom_draw(self):
         """Draw the sprites in this group."""
-        for sprite in sorted(self.sprites(), key=lambda s: s.rect.centery):  # type: ignore
-            offset_pos = sprite.rect.topleft + self.offset  # type: ignore
-            self.display_surface.blit(sprite.image, offset_pos)  # type: ignore
+        self.display_surface.blits(
+            [
+                (sprite.image, sprite.rect.topleft + self.offset)  # type: ignore
+                for sprite in sorted(
+                    self.get_visible_sprites(),
+                    key=lambda s: s.rect.centery,  # type: ignore
+                )
+            ],
+            doreturn=False,
+        )
 
     def update(self, delta: pygame.math.Vector2) -> None:
         """Update the position of the camera."""
         self.offset += delta * self.speed
 
+    def _get_chunk_range(self, rect: pygame.Rect) -> tuple[int, int, int, int]:
+        """Get the min and max (inclusive) chunk coordinates overlapping a rect."""
+        return (
+            rect.left // self.CHUNK_SIZE,
+            rect.top // self.CHUNK_SIZE,
+            (rect.right - 1) // self.CHUNK_SIZE,
+            (rect.bottom - 1) // self.CHUNK_SIZE,
+        )
+
+    def _insert_into_chunks(self, sprite: pygame.sprite.Sprite) -> None:
+        """Add a sprite to every chunk its rect overlaps."""
+        assert sprite.rect
+        min_cx, min_cy, max_cx, max_cy = self._get_chunk_range(pygame.Rect(sprite.rect))
+
+        chunks = [
+            (cx, cy)
+            for cy in range(min_cy, max_cy + 1)
+            for cx in range(min_cx, max_cx + 1)
+        ]
+
+        for chunk in chunks:
+            self._chunks.setdefault(chunk, {})[sprite] = None
+
+        self._sprite_chunks[sprite] = chunks
+
+    def _remove_from_chunks(self, sprite: pygame.sprite.Sprite) -> None:
+        """Remove a sprite from the chunks it was added to."""
+        for chunk in self._sprite_chunks.pop(sprite, ()):
+            sprites = self._chunks[chunk]
+            sprites.pop(sprite, None)
+
+            if not sprites:
+                del self._chunks[chunk]
+
 
 class Game:
     """An instance of a Minerva Game."""
@@ -88,7 +176,23 @@ class Game:
         )
         self.pause_button.disable()
         self.sim_running = False
-        self.sim_update_cooldown = 1.0 / simulation.config.sim_update_frequency
+        self.sim_update_interval = 1.0 / simulation.config.sim_update_frequency
+        self.sim_update_cooldown = self.sim_update_interval
+        self.sim_tick = 0
+        self.snapshots = SnapshotBuffer()
+        self.sim_worker: Optional[SimulationWorker] = (
+            SimulationWorker(
+                simulation,
+                self.snapshots,
+                simulation.config.sim_update_frequency,
+            )
+            if simulation.config.sim_worker_thread
+            else None
+        )
+        self.sim_lock: threading.RLock = (
+            self.sim_worker.lock if self.sim_worker else threading.RLock()
+        )
+        self._last_snapshot_tick = -1
         self.arrow_key_states = {
             "left": False,
             "right": False,
@@ -105,30 +209,74 @@ class Game:
                 {"name": "noto_sans", "point_size": 14, "style": "bold"},
             ]
         )
-        self.wiki_window = WikiWindow(self.ui_manager, self.simulation)
+        self.wiki_page_cache = WikiPageCache()
+        self.wiki_window = WikiWindow(
+            self.ui_manager, self.simulation, self.sim_lock, self.wiki_page_cache
+        )
         self.wiki_window.kill()
         self.visible_sprites = YSortCameraGroup(self.display)
-        self.terrain_tiles = YSortCameraGroup(self.display)
+        self.map_layer: Optional[StaticMapLayer] = None
         self._castle_sprites: list[CastleSprite] = []
+        self._crown_sprites: dict[int, CrownSprite] = {}
 
         self.register_game_event_listeners()
-        self.register_simulation_event_listeners()
 
     def register_game_event_listeners(self):
         """Register callbacks for game events."""
         event_wiki_shown.add_listener(self._on_show_wiki)
 
-    def register_simulation_event_listeners(self):
-        """Register callbacks for simulation events."""
-        sim_events = self.simulation.world.get_resource(SimulationEvents)
+    def _apply_snapshot(self, snapshot: RenderSnapshot) -> None:
+        """Update sprites using the latest simulation snapshot."""
+        if snapshot.map_generated and self.map_layer is None:
+            # The map is static once generated, so the layer is only built once.
+            with self.sim_lock:
+                world_map = self.simulation.world.get_resource(WorldMap)
+                self.map_layer = StaticMapLayer(
+                    world_map.territory_grid.array.copy(),
+                    world_map.borders.array.copy(),
+                )
+                self._create_castle_sprites(world_map)
+
+        if self.map_layer is not None:
+            # Only territories whose colors changed are marked for redrawing.
+            for territory in snapshot.territories:
+                if territory.banner:
+                    self.map_layer.set_territory_colors(
+                        territory.uid,
+                        territory.banner.color_primary,
+                        territory.banner.color_secondary,
+                    )
+                else:
+                    self.map_layer.set_territory_colors(
+                        territory.uid, *DEFAULT_BORDER_COLORS
+                    )
+
+        castle_sprites = {
+            sprite.territory.uid: sprite for sprite in self._castle_sprites
+        }
+
+        for territory in snapshot.territories:
+            crown_sprite = self._crown_sprites.get(territory.uid)
+
+            if territory.is_royal and crown_sprite is None:
+                crown_sprite = CrownSprite(castle_sprites[territory.uid])
+                self._crown_sprites[territory.uid] = crown_sprite
+                self.visible_sprites.add(crown_sprite)  # type: ignore
 
-        sim_events.map_generated.add_listener(self._on_map_generated)
+            elif not territory.is_royal and crown_sprite is not None:
+                crown_sprite.kill()
+                del self._crown_sprites[territory.uid]
 
-    def _on_map_generated(self, world_map: WorldMap) -> None:
-        """Callback for when the map is generated."""
-        self._create_terrain_sprites(world_map)
-        self._create_border_sprites(world_map)
-        self._create_castle_sprites(world_map)
+        self._last_snapshot_tick = snapshot.tick
+
+    def _step_simulation(self) -> None:
+        """Step the simulation on the render thread and publish a snapshot."""
+        # Wiki pages are generated on another thread and read the simulation.
+        with self.sim_lock:
+            self.simulation.step()
+            self.sim_tick += 1
+            snapshot = build_render_snapshot(self.simulation, self.sim_tick)
+        self.snapshots.publish(snapshot)
 
     def on_play_simulation(self) -> None:
         """."""
@@ -136,6 +284,8 @@ class Game:
         self.play_button.disable()
         self.pause_button.enable()
         self.sim_running = True
+        if self.sim_worker:
+            self.sim_worker.play()
 
     def on_pause_simulation(self) -> None:
         """."""
@@ -143,15 +293,23 @@ class Game:
         self.play_button.enable()
         self.pause_button.disable()
         self.sim_running = False
+        if self.sim_worker:
+            self.sim_worker.pause()
 
     def run(self) -> None:
         """Run the game."""
         self.is_running = True
-        while self.is_running:
-            time_delta = self.clock.tick(self.fps) / 1000.0
-            self.handle_events()
-            self.update(time_delta)
-            self.draw()
+        if self.sim_worker:
+            self.sim_worker.start()
+        try:
+            while self.is_running:
+                time_delta = self.clock.tick(self.fps) / 1000.0
+                self.handle_events()
+                self.update(time_delta)
+                self.draw()
+        finally:
+            if self.sim_worker:
+                self.sim_worker.stop()
         pygame.quit()  # pylint: disable=no-member
 
     def update(self, delta_time: float) -> None:
@@ -170,15 +328,35 @@ class Game:
             camera_delta += pygame.Vector2(-1, 0)
         self.camera.update(camera_delta)
         self.visible_sprites.update(camera_delta)
-        self.terrain_tiles.update(camera_delta)
 
         # Update the simulation
-        self.sim_update_cooldown -= delta_time
-        if self.sim_update_cooldown <= 0 and self.sim_running:
-            self.simulation.step()
+        if self.sim_worker:
+            if self.sim_worker.error:
+                raise RuntimeError("Simulation worker stopped.") from (
+                    self.sim_worker.error
+                )
+        else:
+            self.sim_update_cooldown -= delta_time
+            if self.sim_update_cooldown <= 0 and self.sim_running:
+                self.sim_update_cooldown = self.sim_update_interval
+                self._step_simulation()
+
+        # Only update render state when a new snapshot has been published
+        snapshot = self.snapshots.read()
+        if snapshot and snapshot.tick != self._last_snapshot_tick:
+            self._apply_snapshot(snapshot)
 
     def draw_debug(self) -> None:
         """Draw debug information"""
+        if snapshot := self.snapshots.read():
+            draw_text(
+                self.display,
+                f"Date: {snapshot.date}",
+                12,
+                self.window_height - 24,
+                self.font,
+            )
+
         draw_text(
             self.display,
             f"FPS: {round(self.clock.get_fps())}",
@@ -191,9 +369,8 @@ class Game:
         """Draw the active game mode"""
         self.display.fill(self.background_color)
 
-        self.terrain_tiles.custom_draw()
-
-        self._draw_world_grid_lines(color="#ffffff")
+        if self.map_layer:
+            self.map_layer.draw(self.display, self.visible_sprites.offset)
 
         self.visible_sprites.custom_draw()
 
@@ -205,44 +382,7 @@ class Game:
         self.screen.blit(self.display, (0, 0))
         pygame.display.update()
 
-    def _draw_world_grid_lines(self, color: str = "#000000") -> None:
-        # Draw the ground
-        # world_grid = self.simulation.world.get_resource(WorldGrid)
-        if not self.simulation.world.has_resource(WorldMap):
-            return
-
-        world_map = self.simulation.world.get_resource(WorldMap)
-        n_cols, n_rows = world_map.territory_grid.get_size()
-
-        for y in range(n_rows + 1):
-            for x in range(n_cols + 1):
-                x1 = x * TILE_SIZE
-                x2 = n_cols * TILE_SIZE
-                y1 = y * TILE_SIZE
-                y2 = n_rows * TILE_SIZE
-                pygame.gfxdraw.hline(
-                    self.display,
-                    x1 + int(self.camera.scroll.x),
-                    x2 + int(self.camera.scroll.x),
-                    y1 + int(self.camera.scroll.y),
-                    pygame.color.Color(color),
-                )
-                pygame.gfxdraw.vline(
-                    self.display,
-                    x1 + int(self.camera.scroll.x),
-                    y1 + int(self.camera.scroll.y),
-                    y2 + int(self.camera.scroll.y),
-                    pygame.color.Color(color),
-                )
-
     def _create_castle_sprites(self, world_map: WorldMap) -> None:
-        dynasty_tracker = self.simulation.world.get_resource(DynastyTracker)
-        royal_family = (
-            dynasty_tracker.current_dynasty.get_component(Dynasty).family
-            if dynasty_tracker.current_dynasty
-            else None
-        )
-
         for territory in world_map.territories:
             castle_sprite = CastleSprite(territory)
             castle_label = LabelSprite(
@@ -251,50 +391,10 @@ class Game:
                 parent=castle_sprite,
             )
 
-            territory_component = territory.get_component(Territory)
-            if territory_component.controlling_family:
-
-                if territory_component.controlling_family == royal_family:
-                    crown_sprite = CrownSprite(castle_sprite)
-                    self.visible_sprites.add(crown_sprite)  # type: ignore
-
-                # family_component = (
-                #     territory_component.controlling_family.get_component(Family)
-                # )
-                # if family_component.clan:
-                #     clan_component = family_component.clan.get_component(Clan)
-                #     flag_sprite.set_primary_color(
-                #         pygame.color.Color(clan_component.color_primary)
-                #     )
-                #     flag_sprite.set_secondary_color(
-                #         pygame.color.Color(clan_component.color_secondary)
-                #     )
-
             self.visible_sprites.add(castle_sprite)  # type: ignore
             self.visible_sprites.add(castle_label)  # type: ignore
             self._castle_sprites.append(castle_sprite)
 
-    def _create_border_sprites(self, world_map: WorldMap) -> None:
-        for (x, y), wall_flags in world_map.borders.enumerate():
-
-            if wall_flags == CompassDir.NONE:
-                continue
-
-            sprite = BorderSprite(
-                (x * TILE_SIZE, y * TILE_SIZE),
-                pygame.color.Color("blue"),
-                pygame.color.Color("yellow"),
-                wall_flags,
-            )
-
-            self.visible_sprites.add(sprite)  # type: ignore
-
-    def _create_terrain_sprites(self, world_map: WorldMap) -> None:
-        for (x, y), _ in world_map.territory_grid.enumerate():
-            x1 = x * TILE_SIZE
-            y1 = y * TILE_SIZE
-            self.terrain_tiles.add(get_terrain_tile(TerrainType.GRASS, (x1, y1)))  # type: ignore
-
     def handle_events(self):
         """Active mode handles PyGame events"""
         for event in pygame.event.get():
@@ -316,7 +416,10 @@ class Game:
                 and not self.wiki_window.alive()
             ):
                 self.wiki_window = WikiWindow(
-                    manager=self.ui_manager, sim=self.simulation
+                    manager=self.ui_manager,
+                    sim=self.simulation,
+                    sim_lock=self.sim_lock,
+                    page_cache=self.wiki_page_cache,
                 )
 
             if event.type == pygame.constants.KEYDOWN:
@@ -363,6 +466,11 @@ class Game:
     def _on_show_wiki(self, uid: int):
 
         if not self.wiki_window.alive():
-            self.wiki_window = WikiWindow(manager=self.ui_manager, sim=self.simulation)
+            self.wiki_window = WikiWindow(
+                manager=self.ui_manager,
+                sim=self.simulation,
+                sim_lock=self.sim_lock,
+                page_cache=self.wiki_page_cache,
+            )
 
         self.wiki_window.go_to_page(f"/entity?uid={uid}")
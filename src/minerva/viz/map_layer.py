@@ -0,0 +1,325 @@
+"""Pre-rendered Static Map Layer.
+
+Terrain, grid lines, and territory borders rarely change once the world map is
+generated. Instead of drawing one sprite per tile every frame, the StaticMapLayer
+renders the map into chunk surfaces once and blits only the chunks that overlap
+the viewport. Chunks are rendered lazily the first time they become visible and
+are cached separately for each zoom level.
+
+When a territory changes hands, only the cells belonging to that territory are
+redrawn (the next time their chunks are visible), and scaled copies of the
+affected chunks are discarded.
+
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Optional
+
+import numpy as np
+import numpy.typing as npt
+import pygame
+from pygame import SRCALPHA
+from pygame.surface import Surface
+
+from minerva.viz.constants import TILE_SIZE
+from minerva.viz.tile_sprites import (
+    TerrainType,
+    get_border_image,
+    get_terrain_image,
+    get_terrain_image_path,
+)
+from minerva.world_map.components import CompassDir
+
+DEFAULT_BORDER_COLORS: tuple[str, str] = ("blue", "yellow")
+"""Border colors used for territories without a controlling family."""
+
+
+class StaticMapLayer:
+    """A chunked, cached rendering of the terrain, grid lines, and borders."""
+
+    __slots__ = (
+        "_territory_grid",
+        "_borders",
+        "_chunk_size",
+        "_grid_line_color",
+        "_territory_colors",
+        "_territory_chunks",
+        "_chunks",
+        "_scaled_chunks",
+        "_pending",
+    )
+
+    _territory_grid: npt.NDArray[Any]
+    """Territory UIDs indexed by [y, x]."""
+    _borders: npt.NDArray[Any]
+    """Border wall flags indexed by [y, x]."""
+    _chunk_size: int
+    """The width and height of each chunk in tiles."""
+    _grid_line_color: pygame.color.Color
+    """The color of the lines between tiles."""
+    _territory_colors: dict[int, tuple[pygame.color.Color, pygame.color.Color]]
+    """Territory UIDs mapped to their primary and secondary border colors."""
+    _territory_chunks: dict[int, list[tuple[int, int]]]
+    """Territory UIDs mapped to the chunks containing their cells."""
+    _chunks: dict[tuple[int, int], Surface]
+    """Rendered chunks at the base zoom level."""
+    _scaled_chunks: dict[float, dict[tuple[int, int], Surface]]
+    """Zoom levels mapped to scaled copies of rendered chunks."""
+    _pending: dict[tuple[int, int], set[int]]
+    """Rendered chunks mapped to territories that need to be redrawn within them."""
+
+    def __init__(
+        self,
+        territory_grid: npt.NDArray[Any],
+        borders: npt.NDArray[Any],
+        chunk_size: int = 16,
+        grid_line_color: str = "#ffffff",
+    ) -> None:
+        """
+        Parameters
+        ----------
+        territory_grid
+            A (height, width) array of territory UIDs. It is stored as int64 since
+            generational UIDs do not fit in 32 bits.
+        borders
+            A (height, width) array of border wall flags.
+        chunk_size
+            The width and height of each chunk in tiles.
+        grid_line_color
+            The color of the lines between tiles.
+        """
+        if territory_grid.shape != borders.shape:
+            raise ValueError("territory_grid and borders must have the same shape.")
+
+        self._territory_grid = territory_grid.astype(np.int64, copy=False)
+        self._borders = borders
+        self._chunk_size = chunk_size
+        self._grid_line_color = pygame.color.Color(grid_line_color)
+        self._territory_colors = {}
+        self._territory_chunks = self._index_territory_chunks()
+        self._chunks = {}
+        self._scaled_chunks = {}
+        self._pending = {}
+
+    @property
+    def size(self) -> tuple[int, int]:
+        """The width and height of the map in pixels."""
+        height, width = self._territory_grid.shape
+        return width * TILE_SIZE, height * TILE_SIZE
+
+    def set_territory_colors(
+        self, territory_uid: int, primary_color: str, secondary_color: str
+    ) -> None:
+        """Set the border colors of a territory, marking it dirty if they changed."""
+        colors = (
+            pygame.color.Color(primary_color),
+            pygame.color.Color(secondary_color),
+        )
+
+        if self._territory_colors.get(territory_uid) == colors:
+            return
+
+        self._territory_colors[territory_uid] = colors
+
+        for chunk in self._territory_chunks.get(territory_uid, ()):
+            if chunk in self._chunks:
+                self._pending.setdefault(chunk, set()).add(territory_uid)
+
+            for scaled_chunks in self._scaled_chunks.values():
+                scaled_chunks.pop(chunk, None)
+
+    def draw(
+        self, surface: Surface, offset: pygame.math.Vector2, zoom: float = 1.0
+    ) -> None:
+        """Draw the chunks that overlap the surface.
+
+        Parameters
+        ----------
+        surface
+            The surface to draw to.
+        offset
+            The screen position of the map's top-left corner.
+        zoom
+            The scale of the map relative to TILE_SIZE.
+        """
+        chunk_pixels = self._chunk_size * TILE_SIZE * zoom
+        height, width = self._territory_grid.shape
+        n_chunk_cols = -(-width // self._chunk_size)
+        n_chunk_rows = -(-height // self._chunk_size)
+
+        min_cx = max(0, int(-offset.x // chunk_pixels))
+        min_cy = max(0, int(-offset.y // chunk_pixels))
+        max_cx = min(
+            n_chunk_cols, math.ceil((surface.get_width() - offset.x) / chunk_pixels)
+        )
+        max_cy = min(
+            n_chunk_rows, math.ceil((surface.get_height() - offset.y) / chunk_pixels)
+        )
+
+        blits: list[tuple[Surface, tuple[int, int]]] = []
+
+        for cy in range(min_cy, max_cy):
+            for cx in range(min_cx, max_cx):
+                blits.append(
+                    (
+                        self._get_chunk((cx, cy), zoom),
+                        (
+                            int(offset.x + cx * chunk_pixels),
+                            int(offset.y + cy * chunk_pixels),
+                        ),
+                    )
+                )
+
+        surface.blits(blits, doreturn=False)
+
+        # Close off the right and bottom edges of the grid.
+        map_width = int(width * TILE_SIZE * zoom)
+        map_height = int(height * TILE_SIZE * zoom)
+        pygame.draw.line(
+            surface,
+            self._grid_line_color,
+            (int(offset.x) + map_width, int(offset.y)),
+            (int(offset.x) + map_width, int(offset.y) + map_height),
+        )
+        pygame.draw.line(
+            surface,
+            self._grid_line_color,
+            (int(offset.x), int(offset.y) + map_height),
+            (int(offset.x) + map_width, int(offset.y) + map_height),
+        )
+
+    def get_cached_chunk_count(self, zoom: Optional[float] = None) -> int:
+        """Get the number of rendered chunks cached for a zoom level."""
+        if zoom is None or zoom == 1.0:
+            return len(self._chunks)
+
+        return len(self._scaled_chunks.get(zoom, {}))
+
+    def _index_territory_chunks(self) -> dict[int, list[tuple[int, int]]]:
+        """Find the chunks that contain cells of each territory."""
+        territory_chunks: dict[int, list[tuple[int, int]]] = {}
+        height, width = self._territory_grid.shape
+
+        for cy in range(0, height, self._chunk_size):
+            for cx in range(0, width, self._chunk_size):
+                chunk = (cx // self._chunk_size, cy // self._chunk_size)
+                cells = self._territory_grid[
+                    cy : cy + self._chunk_size, cx : cx + self._chunk_size
+                ]
+
+                for territory_uid in np.unique(cells).tolist():
+                    territory_chunks.setdefault(territory_uid, []).append(chunk)
+
+        return territory_chunks
+
+    def _get_chunk(self, chunk: tuple[int, int], zoom: float) -> Surface:
+        """Get the surface for a chunk, rendering or updating it as needed."""
+        base = self._chunks.get(chunk)
+
+        if base is None:
+            base = self._render_chunk(chunk)
+            self._chunks[chunk] = base
+
+        elif territories := self._pending.pop(chunk, None):
+            self._redraw_territories(chunk, base, territories)
+
+        if zoom == 1.0:
+            return base
+
+        scaled_chunks = self._scaled_chunks.setdefault(zoom, {})
+
+        if (scaled := scaled_chunks.get(chunk)) is None:
+            scaled = pygame.transform.scale_by(base, zoom)
+            scaled_chunks[chunk] = scaled
+
+        return scaled
+
+    def _chunk_bounds(self, chunk: tuple[int, int]) -> tuple[slice, slice]:
+        """Get the (y, x) slices of the grid covered by a chunk."""
+        x0 = chunk[0] * self._chunk_size
+        y0 = chunk[1] * self._chunk_size
+
+        return slice(y0, y0 + self._chunk_size), slice(x0, x0 + self._chunk_size)
+
+    def _render_chunk(self, chunk: tuple[int, int]) -> Surface:
+        """Render every cell in a chunk."""
+        rows, cols = self._chunk_bounds(chunk)
+        n_rows, n_cols = self._territory_grid[rows, cols].shape
+        surface = Surface((n_cols * TILE_SIZE, n_rows * TILE_SIZE), SRCALPHA)
+
+        self._draw_cells(
+            chunk, surface, np.ones((n_rows, n_cols), dtype=bool).nonzero()
+        )
+
+        return surface
+
+    def _redraw_territories(
+        self, chunk: tuple[int, int], surface: Surface, territories: set[int]
+    ) -> None:
+        """Redraw only the cells in a chunk that belong to the given territories."""
+        rows, cols = self._chunk_bounds(chunk)
+        mask = np.isin(self._territory_grid[rows, cols], list(territories))
+
+        self._draw_cells(chunk, surface, mask.nonzero())
+
+    def _draw_cells(
+        self,
+        chunk: tuple[int, int],
+        surface: Surface,
+        cells: tuple[npt.NDArray[np.intp], ...],
+    ) -> None:
+        """Draw the terrain, grid lines, and borders of cells within a chunk."""
+        rows, cols = self._chunk_bounds(chunk)
+        territory_grid = self._territory_grid[rows, cols]
+        borders = self._borders[rows, cols]
+        terrain = get_terrain_image(get_terrain_image_path(TerrainType.GRASS))
+        default_colors = (
+            pygame.color.Color(DEFAULT_BORDER_COLORS[0]),
+            pygame.color.Color(DEFAULT_BORDER_COLORS[1]),
+        )
+
+        blits: list[tuple[Surface, tuple[int, int]]] = []
+        lines: list[tuple[int, int]] = []
+
+        for y, x in zip(*(c.tolist() for c in cells)):
+            position = (x * TILE_SIZE, y * TILE_SIZE)
+            surface.fill((0, 0, 0, 0), (position, (TILE_SIZE, TILE_SIZE)))
+            blits.append((terrain, position))
+            lines.append(position)
+
+        surface.blits(blits, doreturn=False)
+
+        # Grid lines sit on the top and left edges of each cell so that redrawing
+        # one cell never paints over its neighbors.
+        for x, y in lines:
+            pygame.draw.line(
+                surface, self._grid_line_color, (x, y), (x + TILE_SIZE - 1, y)
+            )
+            pygame.draw.line(
+                surface, self._grid_line_color, (x, y), (x, y + TILE_SIZE - 1)
+            )
+
+        blits.clear()
+
+        for y, x in zip(*(c.tolist() for c in cells)):
+            wall_flags = int(borders[y, x])
+
+            if wall_flags == CompassDir.NONE:
+                continue
+
+            primary_color, secondary_color = self._territory_colors.get(
+                int(territory_grid[y, x]), default_colors
+            )
+
+            blits.append(
+                (
+                    get_border_image(
+                        primary_color, secondary_color, CompassDir(wall_flags)
+                    ),
+                    (x * TILE_SIZE, y * TILE_SIZE),
+                )
+            )
+
+        surface.blits(blits, doreturn=False)
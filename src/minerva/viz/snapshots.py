@@ -0,0 +1,349 @@
+"""Render Snapshots and Background Simulation Updates.
+
+The visualization should not render directly from the live simulation when the
+simulation runs on a separate thread. Instead, after every tick, the simulation
+thread captures the state the renderer needs (territory owners, family banners,
+the current ruler) as an immutable RenderSnapshot and publishes it to a
+SnapshotBuffer. The renderer reads the most recently published snapshot each
+frame without acquiring any locks.
+
+This module does not depend on PyGame, so snapshots can be produced and consumed
+by other frontends as well.
+
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import threading
+import time
+from typing import Optional
+
+from minerva.characters.components import Dynasty, DynastyTracker, Family
+from minerva.ecs import Entity, World
+from minerva.simulation import Simulation
+from minerva.world_map.components import Territory, WorldMap
+
+_logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(frozen=True)
+class FamilyBannerSnapshot:
+    """The colors and symbol of a family's banner."""
+
+    __slots__ = ("color_primary", "color_secondary", "color_tertiary", "symbol")
+
+    color_primary: str
+    """The primary color of the banner."""
+    color_secondary: str
+    """The secondary color of the banner."""
+    color_tertiary: str
+    """The tertiary color of the banner."""
+    symbol: str
+    """The name of the symbol displayed on the banner."""
+
+
+@dataclasses.dataclass(frozen=True)
+class TerritorySnapshot:
+    """The render state of a single territory."""
+
+    __slots__ = (
+        "uid",
+        "name",
+        "castle_position",
+        "controlling_family",
+        "controlling_family_name",
+        "banner",
+        "is_royal",
+    )
+
+    uid: int
+    """The UID of the territory entity."""
+    name: str
+    """The name of the territory."""
+    castle_position: tuple[int, int]
+    """The grid position of the territory's castle."""
+    controlling_family: Optional[int]
+    """The UID of the family controlling the territory (if any)."""
+    controlling_family_name: str
+    """The name of the family controlling the territory (if any)."""
+    banner: Optional[FamilyBannerSnapshot]
+    """The banner of the family controlling the territory (if any)."""
+    is_royal: bool
+    """Is the territory controlled by the royal family."""
+
+
+@dataclasses.dataclass(frozen=True)
+class RenderSnapshot:
+    """An immutable copy of the simulation state needed to draw a single frame."""
+
+    __slots__ = (
+        "tick",
+        "date",
+        "map_generated",
+        "territories",
+        "ruler",
+        "ruler_name",
+        "dynasty",
+    )
+
+    tick: int
+    """The number of simulation steps completed when the snapshot was taken."""
+    date: str
+    """The simulation date when the snapshot was taken."""
+    map_generated: bool
+    """Has the world map been generated."""
+    territories: tuple[TerritorySnapshot, ...]
+    """The render state of every territory on the map."""
+    ruler: Optional[int]
+    """The UID of the current ruler (if any)."""
+    ruler_name: str
+    """The name of the current ruler (if any)."""
+    dynasty: Optional[int]
+    """The UID of the current dynasty (if any)."""
+
+
+def build_render_snapshot(simulation: Simulation, tick: int) -> RenderSnapshot:
+    """Capture the render state of a simulation.
+
+    Parameters
+    ----------
+    simulation
+        The simulation to capture.
+    tick
+        The number of simulation steps completed so far.
+
+    Returns
+    -------
+    RenderSnapshot
+        The new snapshot.
+    """
+    world = simulation.world
+
+    ruler = None
+    dynasty = None
+    royal_family = None
+
+    dynasty_tracker = world.get_resource(DynastyTracker)
+    if dynasty_tracker.current_dynasty is not None:
+        dynasty = dynasty_tracker.current_dynasty
+        dynasty_component = dynasty.get_component(Dynasty)
+        royal_family = dynasty_component.family
+        ruler = dynasty_component.current_ruler
+
+    return RenderSnapshot(
+        tick=tick,
+        date=str(simulation.date),
+        map_generated=world.has_resource(WorldMap),
+        territories=_snapshot_territories(world, royal_family),
+        ruler=ruler.uid if ruler is not None else None,
+        ruler_name=ruler.name if ruler is not None else "",
+        dynasty=dynasty.uid if dynasty is not None else None,
+    )
+
+
+def _snapshot_territories(
+    world: World, royal_family: Optional[Entity]
+) -> tuple[TerritorySnapshot, ...]:
+    """Capture the render state of all territories on the map."""
+    if not world.has_resource(WorldMap):
+        return ()
+
+    territories: list[TerritorySnapshot] = []
+
+    for territory in world.get_resource(WorldMap).territories:
+        territory_component = territory.get_component(Territory)
+        family = territory_component.controlling_family
+        banner = None
+
+        if family is not None:
+            family_component = family.get_component(Family)
+            banner = FamilyBannerSnapshot(
+                color_primary=family_component.color_primary,
+                color_secondary=family_component.color_secondary,
+                color_tertiary=family_component.color_tertiary,
+                symbol=family_component.banner_symbol,
+            )
+
+        territories.append(
+            TerritorySnapshot(
+                uid=territory.uid,
+                name=territory.name,
+                castle_position=territory_component.castle_position,
+                controlling_family=family.uid if family is not None else None,
+                controlling_family_name=family.name if family is not None else "",
+                banner=banner,
+                is_royal=family is not None and family == royal_family,
+            )
+        )
+
+    return tuple(territories)
+
+
+class SnapshotBuffer:
+    """A double buffer of render snapshots.
+
+    A single writer publishes snapshots into the back slot and then swaps it to the
+    front. Readers always see a complete snapshot. Since snapshots are immutable and
+    swapping the front index is a single assignment, readers never need to lock.
+
+    """
+
+    __slots__ = ("_slots", "_front")
+
+    _slots: list[Optional[RenderSnapshot]]
+    """The front and back snapshots."""
+    _front: int
+    """The index of the slot readers should use."""
+
+    def __init__(self) -> None:
+        self._slots = [None, None]
+        self._front = 0
+
+    def publish(self, snapshot: RenderSnapshot) -> None:
+        """Publish a new snapshot for readers."""
+        back = 1 - self._front
+        self._slots[back] = snapshot
+        self._front = back
+
+    def read(self) -> Optional[RenderSnapshot]:
+        """Get the most recently published snapshot (if any)."""
+        return self._slots[self._front]
+
+
+class SimulationWorker:
+    """Steps a simulation on a background thread at a fixed rate.
+
+    After every step the worker publishes a new render snapshot. Code on other
+    threads that needs to read the live simulation (for example, to generate wiki
+    pages) must hold the worker's lock while doing so.
+
+    """
+
+    __slots__ = (
+        "_simulation",
+        "_buffer",
+        "_step_interval",
+        "_tick",
+        "_thread",
+        "_playing",
+        "_stopped",
+        "_error",
+        "lock",
+    )
+
+    _simulation: Simulation
+    """The simulation to step."""
+    _buffer: SnapshotBuffer
+    """The buffer snapshots are published to."""
+    _step_interval: float
+    """The number of seconds between simulation steps."""
+    _tick: int
+    """The number of simulation steps completed."""
+    _thread: Optional[threading.Thread]
+    """The worker thread."""
+    _playing: threading.Event
+    """Set while the simulation should advance."""
+    _stopped: threading.Event
+    """Set when the worker thread should exit."""
+    _error: Optional[BaseException]
+    """The exception that stopped the worker (if any)."""
+    lock: threading.RLock
+    """Held while the simulation is being stepped."""
+
+    def __init__(
+        self,
+        simulation: Simulation,
+        buffer: SnapshotBuffer,
+        steps_per_second: float,
+    ) -> None:
+        if steps_per_second <= 0:
+            raise ValueError("steps_per_second must be greater than 0.")
+
+        self._simulation = simulation
+        self._buffer = buffer
+        self._step_interval = 1.0 / steps_per_second
+        self._tick = 0
+        self._thread = None
+        self._playing = threading.Event()
+        self._stopped = threading.Event()
+        self._error = None
+        self.lock = threading.RLock()
+
+    @property
+    def is_playing(self) -> bool:
+        """Is the simulation currently advancing."""
+        return self._playing.is_set()
+
+    @property
+    def is_alive(self) -> bool:
+        """Is the worker thread running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def error(self) -> Optional[BaseException]:
+        """The exception that stopped the worker (if any)."""
+        return self._error
+
+    def start(self) -> None:
+        """Start the worker thread (paused) and publish an initial snapshot."""
+        if self._thread is not None:
+            raise RuntimeError("Simulation worker has already been started.")
+
+        with self.lock:
+            self._buffer.publish(build_render_snapshot(self._simulation, self._tick))
+
+        self._thread = threading.Thread(
+            target=self._run, name="minerva-simulation", daemon=True
+        )
+        self._thread.start()
+
+    def play(self) -> None:
+        """Resume advancing the simulation."""
+        self._playing.set()
+
+    def pause(self) -> None:
+        """Stop advancing the simulation after the current step."""
+        self._playing.clear()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the worker thread and wait for it to exit."""
+        self._stopped.set()
+        self._playing.set()  # Wake the thread if it is paused.
+
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        """The worker thread's main loop."""
+        next_step = time.perf_counter()
+
+        while not self._stopped.is_set():
+            if not self._playing.is_set():
+                self._playing.wait()
+                next_step = time.perf_counter()
+                continue
+
+            try:
+                with self.lock:
+                    self._simulation.step()
+                    self._tick += 1
+                    snapshot = build_render_snapshot(self._simulation, self._tick)
+            except Exception as ex:  # pylint: disable=broad-exception-caught
+                _logger.exception("Simulation worker stopped due to an error.")
+                self._error = ex
+                self._playing.clear()
+                return
+
+            self._buffer.publish(snapshot)
+
+            # Schedule against a fixed timeline so the step rate does not drift.
+            # When a step runs long, skip ahead instead of trying to catch up.
+            next_step += self._step_interval
+            delay = next_step - time.perf_counter()
+
+            if delay > 0:
+                self._stopped.wait(delay)
+            else:
+                next_step = time.perf_counter()
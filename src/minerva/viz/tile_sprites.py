@@ -9,6 +9,7 @@ import pygame.gfxdraw
 from pygame.sprite import Sprite
 
 from minerva.ecs import Entity
+from minerva.viz.atlas import sprite_atlas
 from minerva.viz.constants import (
     TERRITORY_BORDER_PADDING,
     TERRITORY_BORDER_THICKNESS,
@@ -115,83 +116,104 @@ class BorderSprite(Sprite):
 
     def redraw_image(self) -> None:
         """Re-render the sprite image."""
-        self.image = pygame.surface.Surface((TILE_SIZE, TILE_SIZE)).convert_alpha()
-        self.image.set_colorkey((0, 0, 0))  # Some section will be transparent.
+        self.image = get_border_image(
+            self.primary_color, self.secondary_color, self.border_flags
+        )
         self.rect = self.image.get_rect()
         self.rect.topleft = (self.position[0], self.position[1])
 
-        # Draw the primary color as a box
-        pygame.gfxdraw.box(
-            self.image,
-            (
-                TERRITORY_BORDER_PADDING,
-                TERRITORY_BORDER_PADDING,
-                TILE_SIZE - (2 * TERRITORY_BORDER_PADDING),
-                TILE_SIZE - (2 * TERRITORY_BORDER_PADDING),
-            ),
-            self.primary_color,
-        )
 
-        # Draw the secondary vertical and horizontal boxes
-        pygame.gfxdraw.box(
-            self.image,
-            (
-                TERRITORY_BORDER_PADDING,
-                TERRITORY_BORDER_PADDING + 11,
-                TILE_SIZE - (2 * TERRITORY_BORDER_PADDING),
-                TILE_SIZE // 3,
-            ),
-            self.secondary_color,
-        )
-
-        pygame.gfxdraw.box(
-            self.image,
-            (
-                TERRITORY_BORDER_PADDING + 11,
-                TERRITORY_BORDER_PADDING,
-                TILE_SIZE // 3,
-                TILE_SIZE - (2 * TERRITORY_BORDER_PADDING),
-            ),
-            self.secondary_color,
-        )
-
-        top_offset: int = (
+def get_border_image(
+    primary_color: pygame.color.Color,
+    secondary_color: pygame.color.Color,
+    border_flags: CompassDir,
+) -> pygame.Surface:
+    """Get the shared image for a border tile with the given colors and walls."""
+    return sprite_atlas.get(
+        ("border", tuple(primary_color), tuple(secondary_color), int(border_flags)),
+        lambda: render_border_image(primary_color, secondary_color, border_flags),
+    )
+
+
+def render_border_image(
+    primary_color: pygame.color.Color,
+    secondary_color: pygame.color.Color,
+    border_flags: CompassDir,
+) -> pygame.Surface:
+    """Draw a new border tile image."""
+    image = pygame.surface.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
+
+    # Draw the primary color as a box
+    pygame.gfxdraw.box(
+        image,
+        (
+            TERRITORY_BORDER_PADDING,
+            TERRITORY_BORDER_PADDING,
+            TILE_SIZE - (2 * TERRITORY_BORDER_PADDING),
+            TILE_SIZE - (2 * TERRITORY_BORDER_PADDING),
+        ),
+        primary_color,
+    )
+
+    # Draw the secondary vertical and horizontal boxes
+    pygame.gfxdraw.box(
+        image,
+        (
+            TERRITORY_BORDER_PADDING,
+            TERRITORY_BORDER_PADDING + 11,
+            TILE_SIZE - (2 * TERRITORY_BORDER_PADDING),
+            TILE_SIZE // 3,
+        ),
+        secondary_color,
+    )
+
+    pygame.gfxdraw.box(
+        image,
+        (
+            TERRITORY_BORDER_PADDING + 11,
+            TERRITORY_BORDER_PADDING,
+            TILE_SIZE // 3,
+            TILE_SIZE - (2 * TERRITORY_BORDER_PADDING),
+        ),
+        secondary_color,
+    )
+
+    top_offset: int = (
+        TERRITORY_BORDER_PADDING + TERRITORY_BORDER_THICKNESS
+        if CompassDir.NORTH in border_flags
+        else 0
+    )
+
+    left_offset: int = (
+        TERRITORY_BORDER_PADDING + TERRITORY_BORDER_THICKNESS
+        if CompassDir.WEST in border_flags
+        else 0
+    )
+
+    width: int = (
+        TILE_SIZE
+        - left_offset
+        - (
             TERRITORY_BORDER_PADDING + TERRITORY_BORDER_THICKNESS
-            if CompassDir.NORTH in self.border_flags
+            if CompassDir.EAST in border_flags
             else 0
         )
+    )
 
-        left_offset: int = (
+    height: int = (
+        TILE_SIZE
+        - top_offset
+        - (
             TERRITORY_BORDER_PADDING + TERRITORY_BORDER_THICKNESS
-            if CompassDir.WEST in self.border_flags
+            if CompassDir.SOUTH in border_flags
             else 0
         )
+    )
 
-        width: int = (
-            TILE_SIZE
-            - left_offset
-            - (
-                TERRITORY_BORDER_PADDING + TERRITORY_BORDER_THICKNESS
-                if CompassDir.EAST in self.border_flags
-                else 0
-            )
-        )
-
-        height: int = (
-            TILE_SIZE
-            - top_offset
-            - (
-                TERRITORY_BORDER_PADDING + TERRITORY_BORDER_THICKNESS
-                if CompassDir.SOUTH in self.border_flags
-                else 0
-            )
-        )
+    # Clear the center so only the walls remain visible.
+    image.fill((0, 0, 0, 0), (left_offset, top_offset, width, height))
 
-        pygame.gfxdraw.box(
-            self.image,
-            (left_offset, top_offset, width, height),
-            pygame.color.Color("#000000"),
-        )
+    return image
 
 
 class TerrainTileSprite(Sprite):
@@ -201,13 +223,21 @@ class TerrainTileSprite(Sprite):
         self, position: tuple[int, int], image_path: str, *groups: Any
     ) -> None:
         super().__init__(*groups)
-        self.image = pygame.transform.scale(
-            pygame.image.load(image_path).convert_alpha(), (32, 32)
-        )
+        self.image = get_terrain_image(image_path)
         self.rect = self.image.get_rect()
         self.rect.topleft = position
 
 
+def get_terrain_image(image_path: str) -> pygame.Surface:
+    """Get the shared image for a terrain tile."""
+    return sprite_atlas.get(
+        ("terrain", image_path),
+        lambda: pygame.transform.scale(
+            pygame.image.load(image_path), (TILE_SIZE, TILE_SIZE)
+        ),
+    )
+
+
 class TerrainType(enum.Enum):
     """Wall tile types."""
 
@@ -224,9 +254,13 @@ def get_terrain_tile(
 ) -> TerrainTileSprite:
     """Generate terrain tile."""
 
+    return TerrainTileSprite(position, get_terrain_image_path(terrain_type))
+
+
+def get_terrain_image_path(terrain_type: TerrainType) -> str:
+    """Get the path to the image used for a terrain type."""
+
     if terrain_type == TerrainType.GRASS:
-        return TerrainTileSprite(
-            position, str(pathlib.Path(__file__).parent / "resources/images/grass.png")
-        )
+        return str(pathlib.Path(__file__).parent / "resources/images/grass.png")
 
     raise ValueError(f"Unsupported terrain type: {terrain_type}")
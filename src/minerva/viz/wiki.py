@@ -1,8 +1,18 @@
-"""PyGame Minerva World Wiki Explorer."""
+"""PyGame Minerva World Wiki Explorer.
+
+Pages are generated on a background thread so navigating the wiki never blocks
+the game loop. List pages are paginated using the UID of the last entry on the
+previous page as a cursor, and rendered pages are cached until the database rows
+they were generated from change.
+
+"""
 
 import pathlib
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, ClassVar
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, ClassVar, Hashable, Optional
 from urllib.parse import parse_qs, urlparse
 
 import pygame
@@ -12,7 +22,8 @@ from pygame_gui.elements import UIButton, UITextBox, UIWindow
 from pygame_gui.ui_manager import UIManager
 
 from minerva.characters.components import Character, Family
-from minerva.ecs import Active, Entity
+from minerva.ecs import Entity
+from minerva.sim_db import SimDB
 from minerva.simulation import Simulation
 from minerva.world_map.components import PopulationHappiness, Territory
 
@@ -25,6 +36,13 @@ class WikiPageGenerator(ABC):
         """Generate a new page."""
         raise NotImplementedError
 
+    def get_cache_key(self, sim: Simulation, **kwargs: Any) -> Optional[Hashable]:
+        """Get a key that changes whenever the generated page would change.
+
+        Returns None if the page should not be cached.
+        """
+        return None
+
 
 _jinja_env = Environment(
     loader=FileSystemLoader(pathlib.Path(__file__).parent / "resources" / "templates"),
@@ -41,51 +59,130 @@ class IndexPageGenerator(WikiPageGenerator):
         content = content.replace("\n", "")
         return content
 
+    def get_cache_key(self, sim: Simulation, **kwargs: Any) -> Optional[Hashable]:
+        return sim.config.seed
 
-class TerritoryListPageGenerator(WikiPageGenerator):
-    """Generates the territory list page for the wiki window."""
+
+class PaginatedListPageGenerator(WikiPageGenerator):
+    """Generates a page of entity links using a cursor-based database query.
+
+    The 'after' parameter is the UID of the last entry on the previous page. Queries
+    must select (uid, name) rows with uid greater than the first parameter, ordered
+    by uid, limited to the second parameter.
+
+    """
+
+    PAGE_SIZE: ClassVar[int] = 50
+    """The max number of entries shown on each page."""
+
+    uri: ClassVar[str]
+    """The path of the page within the wiki."""
+    template_name: ClassVar[str]
+    """The name of the jinja template used to render the page."""
+    items_name: ClassVar[str]
+    """The template variable that receives the page entries."""
+    query_name: ClassVar[str]
+    """The name of the SimDB query that selects the page entries."""
+    table: ClassVar[str]
+    """The database table the query reads from."""
 
     def generate_page(self, sim: Simulation, **kwargs: Any) -> str:
-        template = _jinja_env.get_template("territory_list.jinja")
+        template = _jinja_env.get_template(self.template_name)
+        after = self._get_cursor(**kwargs)
 
-        territory_list: list[Any] = []
+        rows = sim.world.get_resource(SimDB).query(
+            self.query_name, (after, self.PAGE_SIZE + 1)
+        )
 
-        for uid, (territory, _) in sim.world.query_components((Territory, Active)):
-            territory_list.append({"uid": uid, "name": territory.entity.name})
+        items = [{"uid": uid, "name": name} for uid, name in rows[: self.PAGE_SIZE]]
+        next_cursor = items[-1]["uid"] if len(rows) > self.PAGE_SIZE else None
 
-        content = template.render(territories=territory_list)
+        content = template.render(
+            uri=self.uri,
+            is_first_page=after < 0,
+            next_cursor=next_cursor,
+            **{self.items_name: items},
+        )
         content = content.replace("\n", "")
         return content
 
+    def get_cache_key(self, sim: Simulation, **kwargs: Any) -> Optional[Hashable]:
+        return (
+            self._get_cursor(**kwargs),
+            sim.world.get_resource(SimDB).get_table_version(self.table),
+        )
 
-class FamilyListPageGenerator(WikiPageGenerator):
-    """Generates the family list page for the wiki window."""
+    @staticmethod
+    def _get_cursor(**kwargs: Any) -> int:
+        """Get the UID that entries on the page must come after."""
+        if "after" in kwargs:
+            return int(kwargs["after"][0])
 
-    def generate_page(self, sim: Simulation, **kwargs: Any) -> str:
-        template = _jinja_env.get_template("family_list.jinja")
-        family_list: list[Any] = []
+        return -1
 
-        for uid, (family, _) in sim.world.query_components((Family, Active)):
-            family_list.append({"uid": uid, "name": family.entity.name})
 
-        content = template.render(families=family_list)
-        content = content.replace("\n", "")
-        return content
+class TerritoryListPageGenerator(PaginatedListPageGenerator):
+    """Generates the territory list page for the wiki window."""
+
+    uri = "/territory_list"
+    template_name = "territory_list.jinja"
+    items_name = "territories"
+    query_name = "wiki_territory_list"
+    table = "territories"
 
 
-class CharacterListPageGenerator(WikiPageGenerator):
+class FamilyListPageGenerator(PaginatedListPageGenerator):
     """Generates the family list page for the wiki window."""
 
-    def generate_page(self, sim: Simulation, **kwargs: Any) -> str:
-        template = _jinja_env.get_template("character_list.jinja")
-        character_list: list[Any] = []
+    uri = "/family_list"
+    template_name = "family_list.jinja"
+    items_name = "families"
+    query_name = "wiki_family_list"
+    table = "families"
 
-        for uid, (character, _) in sim.world.query_components((Character, Active)):
-            character_list.append({"uid": uid, "name": character.entity.name})
 
-        content = template.render(characters=character_list)
-        content = content.replace("\n", "")
-        return content
+class CharacterListPageGenerator(PaginatedListPageGenerator):
+    """Generates the character list page for the wiki window."""
+
+    uri = "/character_list"
+    template_name = "character_list.jinja"
+    items_name = "characters"
+    query_name = "wiki_character_list"
+    table = "characters"
+
+
+SimDB.register_query(
+    "wiki_territory_list",
+    """
+    SELECT uid, name FROM territories
+    WHERE uid > ?
+    ORDER BY uid
+    LIMIT ?;
+    """,
+    ("territories",),
+)
+
+SimDB.register_query(
+    "wiki_family_list",
+    """
+    SELECT uid, name FROM families
+    WHERE defunct_date IS NULL AND uid > ?
+    ORDER BY uid
+    LIMIT ?;
+    """,
+    ("families",),
+)
+
+SimDB.register_query(
+    "wiki_character_list",
+    """
+    SELECT uid, ifnull(first_name, '') || ' ' || ifnull(surname, '') FROM characters
+    WHERE is_alive=1 AND uid > ?
+    ORDER BY uid
+    LIMIT ?;
+    """,
+    ("characters",),
+)
 
 
 class TerritoryPageGenerator(WikiPageGenerator):
@@ -148,6 +245,19 @@ class EntityPageGenerator(WikiPageGenerator):
         content = content.replace("\n", "")
         return content
 
+    def get_cache_key(self, sim: Simulation, **kwargs: Any) -> Optional[Hashable]:
+        uid = int(kwargs["uid"][0])
+        entity = sim.world.get_entity(uid)
+
+        # Territory pages show population happiness, which is not stored in the
+        # database, so they are always regenerated. Character and family pages only
+        # render values mirrored in the database (e.g., ages in whole years), so the
+        # entity's version changes whenever their content does.
+        if entity.has_component(Character) or entity.has_component(Family):
+            return (uid, sim.world.get_resource(SimDB).get_entity_version(uid))
+
+        return None
+
 
 _page_generators: dict[str, WikiPageGenerator] = {
     "/index": IndexPageGenerator(),
@@ -157,6 +267,97 @@ _page_generators: dict[str, WikiPageGenerator] = {
     "/entity": EntityPageGenerator(),
 }
 
+_page_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="minerva-wiki")
+"""Generates wiki pages in the background (one page at a time)."""
+
+
+class WikiPageCache:
+    """An LRU cache of rendered wiki pages."""
+
+    __slots__ = ("_pages", "_max_size")
+
+    _pages: OrderedDict[tuple[str, Hashable], str]
+    """(page path, cache key) mapped to rendered page content."""
+    _max_size: int
+    """The max number of pages to keep."""
+
+    def __init__(self, max_size: int = 256) -> None:
+        self._pages = OrderedDict()
+        self._max_size = max_size
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+    def get(self, path: str, key: Hashable) -> Optional[str]:
+        """Get a cached page (if any)."""
+        if (content := self._pages.get((path, key))) is not None:
+            self._pages.move_to_end((path, key))
+
+        return content
+
+    def put(self, path: str, key: Hashable, content: str) -> None:
+        """Cache a rendered page."""
+        self._pages[(path, key)] = content
+        self._pages.move_to_end((path, key))
+
+        if len(self._pages) > self._max_size:
+            self._pages.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached pages."""
+        self._pages.clear()
+
+
+def generate_wiki_page(
+    sim: Simulation,
+    uri: str,
+    sim_lock: threading.RLock,
+    cache: Optional[WikiPageCache] = None,
+) -> str:
+    """Generate (or retrieve from the cache) the content of a wiki page.
+
+    Parameters
+    ----------
+    sim
+        The simulation to read from.
+    uri
+        The path and query parameters of the page.
+    sim_lock
+        Held while reading the simulation.
+    cache
+        Rendered pages to reuse.
+
+    Returns
+    -------
+    str
+        The page content.
+    """
+    uri_data = urlparse(uri)
+    page_params = parse_qs(uri_data.query)
+    generator_path = uri_data.path
+
+    try:
+        generator = _page_generators[generator_path]
+    except KeyError as err:
+        raise KeyError(f"No wiki page found for path: {generator_path}.") from err
+
+    with sim_lock:
+        key = None
+
+        if cache is not None:
+            key = generator.get_cache_key(sim, **page_params)
+
+            if key is not None:
+                if (content := cache.get(generator_path, key)) is not None:
+                    return content
+
+        content = generator.generate_page(sim, **page_params)
+
+    if cache is not None and key is not None:
+        cache.put(generator_path, key, content)
+
+    return content
+
 
 class WikiWindow(UIWindow):
     """A window that displays information about all the characters."""
@@ -167,7 +368,13 @@ class WikiWindow(UIWindow):
     WINDOW_WIDTH: ClassVar[int] = 420
     WINDOW_HEIGHT: ClassVar[int] = 520
 
-    def __init__(self, manager: UIManager, sim: Simulation) -> None:
+    def __init__(
+        self,
+        manager: UIManager,
+        sim: Simulation,
+        sim_lock: Optional[threading.RLock] = None,
+        page_cache: Optional[WikiPageCache] = None,
+    ) -> None:
         super().__init__(
             pygame.Rect((200, 50), (self.WINDOW_WIDTH, self.WINDOW_HEIGHT)),
             manager,
@@ -176,6 +383,9 @@ class WikiWindow(UIWindow):
             object_id="#wiki_window",
         )
         self.sim = sim
+        self.sim_lock = sim_lock if sim_lock is not None else threading.RLock()
+        self.page_cache = page_cache if page_cache is not None else WikiPageCache()
+        self.pending_page: Optional[tuple[str, Future[str]]] = None
         # self.search_box = UITextEntryLine(
         #     pygame.Rect((150, search_bar_top_margin), (230, 30)),
         #     manager=manager,
@@ -283,23 +493,17 @@ class WikiWindow(UIWindow):
         self.go_to_page(destination)
 
     def go_to_page(self, uri: str) -> None:
-        """Sets the current page to display in the wiki window."""
+        """Sets the current page to display in the wiki window.
 
-        uri_data = urlparse(uri)
-        page_params = parse_qs(uri_data.query)
-        generator_path = uri_data.path
+        The page is generated in the background. The previous page stays visible
+        until the new one is ready.
+        """
 
-        content = _page_generators[generator_path].generate_page(
-            self.sim, **page_params
-        )
-
-        self.page_display.kill()
-        self.page_display = UITextBox(
-            content,
-            pygame.Rect((0, self.page_y_start_pos), self.remaining_window_size),
-            manager=self.ui_manager,
-            container=self,
-            parent_element=self,
+        self.pending_page = (
+            uri,
+            _page_executor.submit(
+                generate_wiki_page, self.sim, uri, self.sim_lock, self.page_cache
+            ),
         )
 
         self.current_page = uri
@@ -314,3 +518,22 @@ class WikiWindow(UIWindow):
             self.forward_button.disable()
         else:
             self.forward_button.enable()
+
+    def update(self, time_delta: float):
+        super().update(time_delta)
+
+        if self.pending_page is None or not self.pending_page[1].done():
+            return
+
+        # Only the most recently requested page is ever pending.
+        _, future = self.pending_page
+        self.pending_page = None
+
+        self.page_display.kill()
+        self.page_display = UITextBox(
+            future.result(),
+            pygame.Rect((0, self.page_y_start_pos), self.remaining_window_size),
+            manager=self.ui_manager,
+            container=self,
+            parent_element=self,
+        )
@@ -5,7 +5,15 @@ from __future__ import annotations
 import enum
 import itertools
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Generic, Iterator, Optional, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Generic,
+    Iterator,
+    Optional,
+    TypeVar,
+)
 
 from ordered_set import OrderedSet
 
@@ -13,8 +21,26 @@ from minerva.datetime import SimDate
 from minerva.ecs import Component, Entity
 from minerva.stats.base_types import IStatCalculationStrategy, StatComponent
 
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
 _GT = TypeVar("_GT")  # Generic Grid Type variable
 
+_CARDINAL_OFFSETS: tuple[tuple[int, int], ...] = ((0, -1), (1, 0), (0, 1), (-1, 0))
+"""Neighbor offsets in the order: north, east, south, west."""
+
+_DIAGONAL_OFFSETS: tuple[tuple[int, int], ...] = (
+    (0, -1),
+    (1, -1),
+    (1, 0),
+    (1, 1),
+    (0, 1),
+    (-1, 1),
+    (-1, 0),
+    (-1, -1),
+)
+"""Neighbor offsets in clockwise order starting from north."""
+
 
 class GridBase(ABC, Generic[_GT]):
     """An abstract base class for a grid of values."""
@@ -135,60 +161,18 @@ class CartesianGrid(GridBase[_GT]):
         self, coord: tuple[int, int], include_diagonals: bool = False, **kwargs: Any
     ) -> list[tuple[int, int]]:
 
+        # Neighbors only depend on the grid bounds, so cached entries never go stale
+        # when cell values change.
         if cache_entry := self._neighbor_cache.get(coord):
             if cache_entry.includes_diagonals == include_diagonals:
-                return cache_entry.neighbors
-
-        x, y = coord
-        neighbors: list[tuple[int, int]] = []
-
-        # North
-        if self.in_bounds((x, y - 1)) and self._cells[y - 1][x] == -1:
-            neighbors.append((x, y - 1))
-
-        # North-East
-        if (
-            self.in_bounds((x + 1, y - 1))
-            and self._cells[y - 1][x + 1] == -1
-            and include_diagonals
-        ):
-            neighbors.append((x + 1, y - 1))
-
-        # East
-        if self.in_bounds((x + 1, y)) and self._cells[y][x + 1] == -1:
-            neighbors.append((x + 1, y))
-
-        # South-East
-        if (
-            self.in_bounds((x + 1, y + 1))
-            and self._cells[y + 1][x + 1] == -1
-            and include_diagonals
-        ):
-            neighbors.append((x + 1, y + 1))
-
-        # South
-        if self.in_bounds((x, y + 1)) and self._cells[y + 1][x] == -1:
-            neighbors.append((x, y + 1))
-
-        # South-West
-        if (
-            self.in_bounds((x - 1, y + 1))
-            and self._cells[y + 1][x - 1] == -1
-            and include_diagonals
-        ):
-            neighbors.append((x - 1, y + 1))
-
-        # West
-        if self.in_bounds((x - 1, y)) and self._cells[y][x - 1] == -1:
-            neighbors.append((x - 1, y))
-
-        # North-West
-        if (
-            self.in_bounds((x - 1, y - 1))
-            and self._cells[y - 1][x - 1] == -1
-            and include_diagonals
-        ):
-            neighbors.append((x - 1, y - 1))
+                return [*cache_entry.neighbors]
+
+        offsets = _DIAGONAL_OFFSETS if include_diagonals else _CARDINAL_OFFSETS
+        neighbors = [
+            (coord[0] + dx, coord[1] + dy)
+            for dx, dy in offsets
+            if self.in_bounds((coord[0] + dx, coord[1] + dy))
+        ]
 
         self._neighbor_cache[coord] = CartesianNeighborhoodCache(
             coord=coord, neighbors=[*neighbors], includes_diagonals=include_diagonals
@@ -213,6 +197,125 @@ class CartesianGrid(GridBase[_GT]):
         return new_grid
 
 
+class ArrayGrid(GridBase[_GT]):
+    """A cartesian grid of fixed-width numeric values backed by a NumPy array.
+
+    Cells are stored in a (height, width) array, so whole-grid operations can be
+    vectorized using the `array` property. Individual cells are still accessible
+    using (x, y) coordinates like the CartesianGrid.
+
+    """
+
+    __slots__ = ("_size", "_cells", "_fill_value", "_value_type")
+
+    _size: tuple[int, int]
+    """The width (x) and height (y) of the grid."""
+    _cells: npt.NDArray[Any]
+    """Cell values indexed by [y, x]."""
+    _fill_value: int
+    """The initial value of every cell."""
+    _value_type: Optional[Callable[[int], _GT]]
+    """Converts raw cell values to the grid's value type (if any)."""
+
+    def __init__(
+        self,
+        size: tuple[int, int],
+        fill_value: int,
+        dtype: npt.DTypeLike,
+        value_type: Optional[Callable[[int], _GT]] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        size
+            The width and height of the grid.
+        fill_value
+            The initial value of every cell.
+        dtype
+            The NumPy data type of the cells.
+        value_type
+            An optional callable used to convert raw cell values when reading them.
+        """
+        # NumPy is only needed once a map is generated, so keep it out of the
+        # import path of headless simulations.
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        super().__init__()
+        self._size = size
+        self._cells = np.full((size[1], size[0]), fill_value, dtype=dtype)
+        self._fill_value = fill_value
+        self._value_type = value_type
+
+    @property
+    def array(self) -> npt.NDArray[Any]:
+        """The underlying (height, width) array of cell values."""
+        return self._cells
+
+    @array.setter
+    def array(self, value: npt.NDArray[Any]) -> None:
+        """Replace the cell values."""
+        if value.shape != self._cells.shape:
+            raise ValueError(
+                f"Expected an array with shape {self._cells.shape}, got {value.shape}."
+            )
+
+        self._cells = value.astype(self._cells.dtype, copy=False)
+
+    def get_size(self) -> tuple[int, int]:
+        """The size of the grid."""
+        return self._size
+
+    def get(self, coord: tuple[int, int]) -> _GT:
+        if not self.in_bounds(coord):
+            raise ValueError(f"{coord} is not within the bound of the grid.")
+
+        return self._convert(self._cells[coord[1], coord[0]])
+
+    def set(self, coord: tuple[int, int], value: _GT) -> None:
+        if not self.in_bounds(coord):
+            raise ValueError(f"{coord} is not within the bound of the grid.")
+
+        self._cells[coord[1], coord[0]] = value
+
+    def in_bounds(self, coord: tuple[int, int]) -> bool:
+        return 0 <= coord[0] < self._size[0] and 0 <= coord[1] < self._size[1]
+
+    def get_neighbors(
+        self, coord: tuple[int, int], include_diagonals: bool = False, **kwargs: Any
+    ) -> list[tuple[int, int]]:
+        offsets = _DIAGONAL_OFFSETS if include_diagonals else _CARDINAL_OFFSETS
+        return [
+            (coord[0] + dx, coord[1] + dy)
+            for dx, dy in offsets
+            if self.in_bounds((coord[0] + dx, coord[1] + dy))
+        ]
+
+    def iter_cells(self) -> Iterator[_GT]:
+        for value in self._cells.ravel().tolist():
+            yield self._convert(value)
+
+    def enumerate(self) -> Iterator[tuple[tuple[int, int], _GT]]:
+        width = self._size[0]
+
+        for i, value in enumerate(self._cells.ravel().tolist()):
+            yield (i % width, i // width), self._convert(value)
+
+    def copy(self) -> ArrayGrid[_GT]:
+        new_grid: ArrayGrid[_GT] = ArrayGrid(
+            self._size, self._fill_value, self._cells.dtype, self._value_type
+        )
+        new_grid._cells = self._cells.copy()
+
+        return new_grid
+
+    def _convert(self, value: Any) -> _GT:
+        """Convert a raw cell value to the grid's value type."""
+        if self._value_type is not None:
+            return self._value_type(int(value))
+
+        return int(value)  # type: ignore
+
+
 class WorldMap:
     """Singleton that tracks world map information."""
 
@@ -220,17 +323,17 @@ class WorldMap:
 
     _size: tuple[int, int]
     """The width (x) and height (y) of the world map."""
-    territory_grid: CartesianGrid[int]
-    """A grid where each cell contains the ID of the territory it belongs to."""
-    borders: CartesianGrid[CompassDir]
+    territory_grid: ArrayGrid[int]
+    """A grid where each cell contains the UID of the territory it belongs to."""
+    borders: ArrayGrid[CompassDir]
     """Border walls."""
     territories: list[Entity]
     """Information about territories."""
 
     def __init__(self, size: tuple[int, int]) -> None:
         self._size = size
-        self.territory_grid = CartesianGrid(size, lambda: -1)
-        self.borders = CartesianGrid(size, lambda: CompassDir.NONE)
+        self.territory_grid = ArrayGrid(size, -1, "int64")
+        self.borders = ArrayGrid(size, CompassDir.NONE, "uint8", CompassDir)
         self.territories: list[Entity] = []
 
     @property
@@ -317,6 +420,8 @@ class Territory(Component):
 class PopulationHappiness(StatComponent):
     """Tracks the happiness of general population (small folk) of a territory."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         base_value: float,
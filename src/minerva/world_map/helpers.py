@@ -8,6 +8,7 @@ from minerva.characters.components import Family
 from minerva.ecs import Entity
 from minerva.sim_db import SimDB
 from minerva.world_map.components import Territory
+from minerva.world_map.territory_index import TerritoryIndex
 
 
 def get_territory_political_influence(
@@ -34,10 +35,38 @@ def increment_political_influence(
 
     if family not in territory_component.political_influence:
         territory_component.political_influence[family] = 0
+        territory.world.get_resource(TerritoryIndex).add_family_presence(
+            family, territory
+        )
 
     territory_component.political_influence[family] += amount
 
 
+def set_political_influence(territory: Entity, family: Entity, amount: int) -> None:
+    """Set the political influence of a family over a given territory."""
+
+    territory_component = territory.get_component(Territory)
+
+    if family not in territory_component.political_influence:
+        territory.world.get_resource(TerritoryIndex).add_family_presence(
+            family, territory
+        )
+
+    territory_component.political_influence[family] = amount
+
+
+def remove_political_influence(territory: Entity, family: Entity) -> None:
+    """Remove all political influence a family has over a given territory."""
+
+    territory_component = territory.get_component(Territory)
+
+    if family in territory_component.political_influence:
+        del territory_component.political_influence[family]
+        territory.world.get_resource(TerritoryIndex).remove_family_presence(
+            family, territory
+        )
+
+
 def set_territory_controlling_family(
     territory: Entity, family: Optional[Entity]
 ) -> None:
@@ -45,6 +74,10 @@ def set_territory_controlling_family(
 
     territory_component = territory.get_component(Territory)
 
+    territory.world.get_resource(TerritoryIndex).set_controlling_family(
+        territory, territory_component.controlling_family, family
+    )
+
     if territory_component.controlling_family is not None:
         former_sovereign = territory_component.controlling_family
         family_component = former_sovereign.get_component(Family)
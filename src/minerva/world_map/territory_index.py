@@ -0,0 +1,123 @@
+"""Territory and family lookup index.
+
+Territory components track the families with political influence over them, and
+family components track the territories they control. Answering the reverse
+questions (e.g., "which territories does this family have influence in?" or "which
+territories border this family's lands?") otherwise requires scanning every
+territory on the map. The TerritoryIndex keeps these relationships in both
+directions, along with precomputed territory adjacency, so they can be answered in
+constant time or time proportional to the number of neighbors.
+
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Optional
+
+from minerva.ecs import Entity
+from minerva.world_map.components import Territory
+
+
+class TerritoryIndex:
+    """Shared singleton indexing territories, families, and territory adjacency."""
+
+    __slots__ = (
+        "_territory_families",
+        "_family_territories",
+        "_controlled_territories",
+        "_neighbors",
+        "_frontier",
+    )
+
+    _territory_families: dict[Entity, dict[Entity, None]]
+    """Territories mapped to families with political influence over them."""
+    _family_territories: dict[Entity, dict[Entity, None]]
+    """Families mapped to territories they have political influence over."""
+    _controlled_territories: dict[Entity, dict[Entity, None]]
+    """Families mapped to the territories they control."""
+    _neighbors: dict[Entity, frozenset[Entity]]
+    """Territories mapped to their neighboring territories."""
+    _frontier: dict[Entity, dict[Entity, int]]
+    """Families mapped to territories bordering their lands and the border count."""
+
+    def __init__(self) -> None:
+        self._territory_families = {}
+        self._family_territories = {}
+        self._controlled_territories = {}
+        self._neighbors = {}
+        self._frontier = {}
+
+    def set_neighbors(self, territory: Entity, neighbors: Iterable[Entity]) -> None:
+        """Set the territories that neighbor a territory."""
+        self._neighbors[territory] = frozenset(neighbors)
+
+    def get_neighbors(self, territory: Entity) -> frozenset[Entity]:
+        """Get the territories that neighbor a territory."""
+        if (neighbors := self._neighbors.get(territory)) is not None:
+            return neighbors
+
+        # Territories that were not registered during map generation.
+        neighbors = frozenset(territory.get_component(Territory).neighbors)
+        self._neighbors[territory] = neighbors
+
+        return neighbors
+
+    def are_neighbors(self, territory_a: Entity, territory_b: Entity) -> bool:
+        """Check if two territories share a border."""
+        return territory_b in self.get_neighbors(territory_a)
+
+    def add_family_presence(self, family: Entity, territory: Entity) -> None:
+        """Record that a family has political influence over a territory."""
+        self._territory_families.setdefault(territory, {})[family] = None
+        self._family_territories.setdefault(family, {})[territory] = None
+
+    def remove_family_presence(self, family: Entity, territory: Entity) -> None:
+        """Record that a family no longer has influence over a territory."""
+        self._territory_families.get(territory, {}).pop(family, None)
+        self._family_territories.get(family, {}).pop(territory, None)
+
+    def set_controlling_family(
+        self,
+        territory: Entity,
+        former_family: Optional[Entity],
+        family: Optional[Entity],
+    ) -> None:
+        """Update the index when a territory changes hands."""
+        if former_family is not None:
+            self._controlled_territories.get(former_family, {}).pop(territory, None)
+
+            frontier = self._frontier.get(former_family, {})
+
+            for neighbor in self.get_neighbors(territory):
+                count = frontier.get(neighbor, 0) - 1
+
+                if count > 0:
+                    frontier[neighbor] = count
+                else:
+                    frontier.pop(neighbor, None)
+
+        if family is not None:
+            self._controlled_territories.setdefault(family, {})[territory] = None
+
+            frontier = self._frontier.setdefault(family, {})
+
+            for neighbor in self.get_neighbors(territory):
+                frontier[neighbor] = frontier.get(neighbor, 0) + 1
+
+    def get_families_present_in(self, territory: Entity) -> list[Entity]:
+        """Get the families with political influence over a territory."""
+        return list(self._territory_families.get(territory, ()))
+
+    def get_territories_present_in(self, family: Entity) -> list[Entity]:
+        """Get the territories a family has political influence over."""
+        return list(self._family_territories.get(family, ()))
+
+    def get_controlled_territories(self, family: Entity) -> list[Entity]:
+        """Get the territories controlled by a family."""
+        return list(self._controlled_territories.get(family, ()))
+
+    def get_frontier(self, family: Entity) -> list[Entity]:
+        """Get territories that border a family's lands but are not controlled by it."""
+        controlled = self._controlled_territories.get(family, {})
+
+        return [t for t in self._frontier.get(family, ()) if t not in controlled]
@@ -0,0 +1,48 @@
+# pylint: disable=W0621
+"""Test character component data structures.
+
+"""
+
+import pytest
+
+from minerva.characters.components import Character
+from minerva.pcg.character import spawn_character
+from minerva.simulation import Simulation
+
+
+@pytest.fixture
+def sim() -> Simulation:
+    """Create a test simulation."""
+    test_sim = Simulation()
+
+    return test_sim
+
+
+def test_character_entity_sets(sim: Simulation):
+    """Test adding and removing entities from character relation sets."""
+
+    character = spawn_character(sim.world)
+    child_a = spawn_character(sim.world)
+    child_b = spawn_character(sim.world)
+
+    character_component = character.get_component(Character)
+
+    assert not character_component.children
+    assert len(character_component.children) == 0
+
+    character_component.children.append(child_a)
+    character_component.children.add(child_b)
+    character_component.children.add(child_a)
+
+    assert list(character_component.children) == [child_a, child_b]
+    assert child_b in character_component.children
+    assert character_component.children[0] == child_a
+
+    character_component.children.discard(child_a)
+
+    assert list(character_component.children) == [child_b]
+
+    character_component.children = [child_a, child_b, child_a]
+
+    assert list(character_component.children) == [child_a, child_b]
+    assert not character_component.siblings
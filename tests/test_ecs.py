@@ -0,0 +1,640 @@
+"""Test the entity component system.
+
+"""
+
+import numpy as np
+import pytest
+
+from minerva.config import Config
+from minerva.datetime import SimDate
+from minerva.ecs import Active, Component, Entity, System, SystemGroup, World
+from minerva.systems import EntityArchivalSystem
+
+
+class Shared:
+    """An object shared by many components."""
+
+    __slots__ = ("key",)
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+
+
+class Data(Component):
+    """A test component."""
+
+    __slots__ = ("value", "shared", "other")
+
+    def __init__(self, value: int, shared: Shared, other: Entity) -> None:
+        super().__init__()
+        self.value = value
+        self.shared = shared
+        self.other = other
+
+
+def test_archive_entity():
+    """Test evicting an entity to cold storage and restoring it."""
+
+    world = World()
+    shared_objects = {"a": Shared("a")}
+
+    world.register_persistent_type(
+        Shared, lambda obj: obj.key, lambda _, key: shared_objects[key]
+    )
+
+    other = world.entity(name="other")
+    entity = world.entity(name="archived")
+    entity.add_component(Data(7, shared_objects["a"], other))
+
+    with pytest.raises(ValueError):
+        world.archive_entity(entity)
+
+    entity.deactivate()
+    world.archive_entity(entity)
+
+    assert world.is_archived(entity.uid)
+    assert world.entity_exists(entity.uid)
+    assert list(world.query_components((Data,))) == []
+
+    # Accessing the archived entity's components restores it.
+    data = entity.get_component(Data)
+
+    assert not world.is_archived(entity.uid)
+    assert data.value == 7
+    assert data.shared is shared_objects["a"]
+    assert data.other is other
+    assert data.entity == entity
+    assert not entity.has_component(Active)
+    assert [uid for uid, _ in world.query_components((Data,))] == [entity.uid]
+
+
+def test_restore_archived_entities():
+    """Test restoring entities using their UIDs."""
+
+    world = World()
+    entity = world.entity(name="archived")
+    entity.deactivate()
+    world.archive_entity(entity)
+
+    assert world.get_entity(entity.uid) == entity
+    assert entity.name == "archived"
+    assert not world.is_archived(entity.uid)
+
+    entity.activate()
+
+    assert entity.is_active
+
+
+def test_destroy_archived_entity():
+    """Test destroying an entity while it is in cold storage."""
+
+    world = World()
+    entity = world.entity(name="archived")
+    entity.deactivate()
+    world.archive_entity(entity)
+
+    entity.destroy()
+    world.step()
+
+    assert not world.is_archived(entity.uid)
+    assert not world.entity_exists(entity.uid)
+
+
+def test_archival_skips_referenced_entities():
+    """Test that the archival system keeps entities referenced by live data."""
+
+    world = World()
+    world.add_resource(Config())
+    world.add_resource(SimDate())
+    shared = Shared("a")
+    held = world.entity(name="held")
+    loose = world.entity(name="loose")
+    world.entity(name="holder").add_component(Data(1, shared, held))
+
+    held.deactivate()
+    loose.deactivate()
+
+    system = EntityArchivalSystem()
+    system.on_update(world)
+    system.on_update(world)
+
+    assert world.is_archived(loose.uid)
+    assert not world.is_archived(held.uid)
+
+
+class Tag(Component):
+    """A test component without data."""
+
+
+def test_get_component_with_numpy_uid():
+    """Test looking up components using a NumPy integer UID."""
+
+    world = World()
+    entity = world.entity(components=[Tag()])
+    uid = np.int64(entity.uid)
+
+    assert world.has_component(uid, Tag)
+    assert isinstance(world.get_component(uid, Tag), Tag)
+
+
+def test_query_active_components():
+    """Test that querying with Active only returns active entities."""
+
+    world = World()
+    other = world.entity()
+
+    entities = [world.entity(components=[Tag()]) for _ in range(4)]
+
+    entities[1].deactivate()
+    entities[2].add_component(Data(1, Shared("a"), other))
+
+    assert [uid for uid, _ in world.query_components((Tag, Active))] == [
+        entities[0].uid,
+        entities[2].uid,
+        entities[3].uid,
+    ]
+    assert len(list(world.query_components((Tag,)))) == 4
+
+    entities[1].activate()
+    entities[3].remove_component(Tag)
+    entities[2].deactivate()
+
+    assert [uid for uid, _ in world.query_components((Tag, Active))] == [
+        entities[0].uid,
+        entities[1].uid,
+    ]
+    assert list(world.query_components((Data, Active))) == []
+
+    entities[2].activate()
+
+    results = list(world.query_components((Active, Data)))
+
+    assert len(results) == 1
+    assert results[0][0] == entities[2].uid
+    assert isinstance(results[0][1][0], Active)
+
+
+class QuarterlySystem(System):
+    """A system that updates every third tick."""
+
+    __tick_interval__ = 3
+    __tick_phase__ = 1
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.ticks: list[int] = []
+
+    def on_update(self, world: World) -> None:
+        self.ticks.append(world.tick)
+
+
+class StaggeredSystem(System):
+    """A system that processes each entity once every three ticks."""
+
+    __tick_interval__ = 3
+    __stagger_entities__ = True
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.processed: list[list[int]] = []
+
+    def on_update(self, world: World) -> None:
+        self.processed.append(
+            [
+                uid
+                for uid, _ in world.query_components((Tag, Active))
+                if self.is_entity_scheduled(world, world.get_entity(uid))
+            ]
+        )
+
+
+def test_system_tick_interval():
+    """Test that systems only update on ticks matching their interval and phase."""
+
+    world = World()
+    world.add_system(QuarterlySystem())
+
+    for _ in range(7):
+        world.step()
+
+    assert world.tick == 7
+    assert world.get_system(QuarterlySystem).ticks == [1, 4]
+
+
+def test_staggered_system_spreads_entities():
+    """Test that staggered systems process each entity once per interval."""
+
+    world = World()
+    world.add_system(StaggeredSystem())
+
+    entities = [world.entity(components=[Tag()]) for _ in range(6)]
+
+    for _ in range(6):
+        world.step()
+
+    processed = world.get_system(StaggeredSystem).processed
+
+    assert len(processed) == 6
+    assert all(len(uids) == 2 for uids in processed)
+    assert sorted(processed[0] + processed[1] + processed[2]) == [
+        entity.uid for entity in entities
+    ]
+    assert processed[:3] == processed[3:]
+
+
+class Counter(Component):
+    """A component with a counter."""
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.value = 0
+
+
+class IncrementCounterSystem(System):
+    """Increments every counter."""
+
+    __reads__ = ()
+    __writes__ = (Counter,)
+
+    def on_update(self, world: World) -> None:
+        for _, (counter,) in world.query_components((Counter,)):
+            counter.value += 1
+
+
+class ReadTagSystem(System):
+    """Counts tagged entities."""
+
+    __reads__ = (Tag,)
+    __writes__ = ()
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.counts: list[int] = []
+
+    def on_update(self, world: World) -> None:
+        self.counts.append(len(list(world.query_components((Tag,)))))
+
+
+class UndeclaredSystem(System):
+    """A system that does not declare its access."""
+
+    def on_update(self, world: World) -> None:
+        return
+
+
+class MisdeclaredSystem(System):
+    """A system that reads a component type it did not declare."""
+
+    __reads__ = (Tag,)
+    __writes__ = ()
+
+    def on_update(self, world: World) -> None:
+        for _ in world.query_components((Counter,)):
+            pass
+
+
+def test_system_access_conflicts():
+    """Test that conflicts are found using declared reads and writes."""
+
+    assert not IncrementCounterSystem.conflicts_with(ReadTagSystem)
+    assert IncrementCounterSystem.conflicts_with(IncrementCounterSystem)
+    assert ReadTagSystem.conflicts_with(UndeclaredSystem)
+    assert not ReadTagSystem.conflicts_with(MisdeclaredSystem)
+
+
+def test_concurrent_system_updates():
+    """Test that non-conflicting systems give the same results on worker threads."""
+
+    world = World()
+    world.set_system_workers(2)
+    world.add_system(IncrementCounterSystem())
+    world.add_system(ReadTagSystem())
+
+    counter = world.entity(components=[Counter()]).get_component(Counter)
+    world.entity(components=[Tag()])
+
+    for _ in range(3):
+        world.step()
+
+    assert counter.value == 3
+    assert world.get_system(ReadTagSystem).counts == [1, 1, 1]
+
+    world.set_system_workers(0)
+
+
+def test_system_access_verification():
+    """Test that systems accessing undeclared types raise errors in debug mode."""
+
+    world = World()
+    world.add_system(MisdeclaredSystem())
+    world.entity(components=[Counter()])
+
+    world.step()
+
+    world.set_access_verification(True)
+
+    with pytest.raises(RuntimeError):
+        world.step()
+
+
+class SpawnDuringQuerySystem(System):
+    """Spawns and modifies entities while iterating a query."""
+
+    def on_update(self, world: World) -> None:
+        for uid, (_, _) in world.query_components((Tag, Active)):
+            entity = world.get_entity(uid)
+            world.commands.remove_component(entity, Tag)
+            world.commands.add_component(entity, Counter())
+            world.commands.spawn([Tag()])
+
+        assert len(world.commands) > 0
+
+
+def test_command_buffer():
+    """Test that structural changes are deferred and applied in batches."""
+
+    world = World()
+    buffer = world.commands
+
+    entity = world.entity(components=[Tag()])
+    spawned = buffer.spawn([Counter()], name="spawned")
+
+    buffer.remove_component(entity, Tag)
+    buffer.add_component(entity, Counter())
+
+    assert entity.has_component(Tag)
+    assert not world.entity_exists(spawned.uid)
+
+    buffer.apply()
+
+    assert len(buffer) == 0
+    assert not entity.has_component(Tag)
+    assert spawned.name == "spawned"
+    assert [uid for uid, _ in world.query_components((Counter, Active))] == [
+        entity.uid,
+        spawned.uid,
+    ]
+
+    buffer.destroy(spawned)
+    buffer.apply()
+
+    assert not spawned.is_active
+
+
+def test_command_buffer_sync_point():
+    """Test that commands recorded by a system are applied after it updates."""
+
+    world = World()
+    world.add_system(SpawnDuringQuerySystem())
+
+    for _ in range(2):
+        world.entity(components=[Tag()])
+
+    world.step()
+
+    assert len(world.commands) == 0
+    assert len(list(world.query_components((Tag, Active)))) == 2
+    assert len(list(world.query_components((Counter, Active)))) == 2
+
+
+def test_component_observers():
+    """Test that observers are notified when components are added and removed."""
+
+    world = World()
+    added: list[tuple[Entity, Tag]] = []
+    removed: list[tuple[Entity, Tag]] = []
+    deactivated: list[Entity] = []
+
+    world.observe_added(Tag, lambda entity, tag: added.append((entity, tag)))
+    world.observe_removed(Tag, lambda entity, tag: removed.append((entity, tag)))
+    world.observe_removed(Active, lambda entity, _: deactivated.append(entity))
+
+    tag = Tag()
+    entity = world.entity(components=[tag])
+
+    assert added == [(entity, tag)]
+
+    entity.remove_component(Tag)
+
+    assert removed == [(entity, tag)]
+
+    world.commands.add_component(entity, Tag())
+    world.commands.apply()
+
+    assert len(added) == 2
+
+    entity.deactivate()
+
+    assert deactivated == [entity]
+
+
+def test_batched_component_observers():
+    """Test that batched observers receive their changes at the end of each step."""
+
+    world = World()
+    batches: list[list[tuple[Entity, Counter]]] = []
+
+    world.observe_added(Counter, batches.append, batched=True)
+
+    first = world.entity(components=[Counter()])
+    second = world.entity(components=[Counter()])
+
+    assert not batches
+
+    world.step()
+
+    assert [[entity for entity, _ in batch] for batch in batches] == [[first, second]]
+
+    world.step()
+
+    assert len(batches) == 1
+
+    destroyed: list[list[tuple[Entity, Counter]]] = []
+    world.observe_removed(Counter, destroyed.append, batched=True)
+    world.destroy(first)
+    world.step()
+
+    assert [[entity for entity, _ in batch] for batch in destroyed] == [[first]]
+
+    assert world.remove_observer(Counter, batches.append)
+    assert not world.remove_observer(Counter, batches.append)
+
+
+class OrderedSystemGroup(SystemGroup):
+    """A group that records the update order of its children."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.updated: list[str] = []
+
+
+class RecordOrderSystem(System):
+    """A system that records its name when it updates."""
+
+    __system_group__ = "OrderedSystemGroup"
+
+    def on_update(self, world: World) -> None:
+        world.get_system(OrderedSystemGroup).updated.append(self.system_name())
+
+
+class FirstSystem(RecordOrderSystem):
+    """Updates before SecondSystem."""
+
+    __update_order__ = ("before:SecondSystem",)
+
+
+class SecondSystem(RecordOrderSystem):
+    """Updates after FirstSystem."""
+
+
+class ThirdSystem(RecordOrderSystem):
+    """Has no ordering constraints."""
+
+
+class LastSystem(RecordOrderSystem):
+    """Always updates last."""
+
+    __update_order__ = ("last",)
+
+
+def test_system_registration():
+    """Test that systems are sorted lazily and looked up by type."""
+
+    world = World()
+    group = OrderedSystemGroup()
+
+    world.add_system(group)
+    world.add_system(LastSystem())
+    world.add_system(SecondSystem())
+    world.add_system(ThirdSystem())
+    world.add_system(FirstSystem())
+
+    assert isinstance(world.get_system(SecondSystem), SecondSystem)
+    assert isinstance(world.get_system(RecordOrderSystem), RecordOrderSystem)
+
+    with pytest.raises(KeyError):
+        world.get_system(QuarterlySystem)
+
+    world.step()
+
+    # Unconstrained systems keep the order they were added in.
+    assert group.updated == [
+        "ThirdSystem",
+        "FirstSystem",
+        "SecondSystem",
+        "LastSystem",
+    ]
+
+    world.remove_system(ThirdSystem)
+
+    with pytest.raises(KeyError):
+        world.get_system(ThirdSystem)
+
+
+def test_resource_handle():
+    """Test that resource handles follow the resource as it is replaced."""
+
+    world = World()
+    handle = world.resource_handle(Shared)
+
+    assert not hasattr(handle, "value")
+
+    first = Shared("first")
+    world.add_resource(first)
+
+    assert handle.value is first
+    assert world.resource_handle(Shared) is handle
+
+    second = Shared("second")
+    world.add_resource(second)
+
+    assert handle.value is second
+
+    world.remove_resource(Shared)
+
+    assert not hasattr(handle, "value")
+
+
+def test_uid_component_access():
+    """Test accessing components using entity UIDs."""
+
+    world = World()
+    entity = world.entity()
+    tag = entity.add_component(Tag())
+
+    assert world.get_component(entity.uid, Tag) is tag
+    assert world.has_component(entity.uid, Tag)
+    assert world.get_component(entity, Tag) is tag
+
+    with pytest.raises(KeyError):
+        world.get_component(entity.uid, Counter)
+
+    entity.destroy()
+    world.step()
+
+    with pytest.raises(ValueError):
+        entity.get_component(Tag)
+
+    with pytest.raises(ValueError):
+        world.has_component(entity.uid, Tag)
+
+
+def test_entities_are_interned():
+    """Test that there is only one entity instance per UID."""
+
+    world = World()
+    other = world.entity(name="other")
+    entity = world.entity(name="archived")
+    entity.add_component(Data(1, Shared("a"), other))
+    other.add_component(Data(2, Shared("b"), entity))
+
+    entity.deactivate()
+    other.deactivate()
+    world.archive_entity(entity)
+    world.archive_entity(other)
+    world.restore_archived_entities()
+
+    assert world.get_entity(entity.uid) is entity
+    assert world.get_entity(other.uid) is other
+    assert entity.get_component(Data).other is other
+    assert other.get_component(Data).other is entity
+    assert entity.get_component(Data).entity is entity
+
+
+def test_tag_components_are_slotted():
+    """Test that components without data do not allocate an instance dict."""
+
+    assert not hasattr(Active(), "__dict__")
+
+
+def test_entity_slots_are_recycled():
+    """Test that destroyed entities free their slot for a new generation."""
+
+    world = World()
+    entity = world.entity(name="first")
+    entity.add_component(Tag())
+    uid = entity.uid
+
+    entity.destroy()
+
+    # Slots are only freed once destroyed entities are cleared.
+    assert world.entity().slot != entity.slot
+
+    world.step()
+
+    recycled = world.entity(name="second")
+
+    assert recycled.slot == entity.slot
+    assert recycled.generation == entity.generation + 1
+    assert recycled.uid != uid
+    assert not world.entity_exists(uid)
+    assert not recycled.has_component(Tag)
+    assert entity.name == "first"
+
+    with pytest.raises(KeyError):
+        world.get_entity(uid)
+
+    with pytest.raises(ValueError):
+        world.get_component(uid, Tag)
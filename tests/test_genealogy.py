@@ -0,0 +1,140 @@
+# pylint: disable=W0621
+"""Test the genealogy index used for kinship queries.
+
+"""
+
+import pytest
+
+from minerva.characters.genealogy import GenealogyIndex
+from minerva.characters.helpers import (
+    set_character_biological_father,
+    set_character_father,
+    set_character_mother,
+    set_relation_child,
+)
+from minerva.pcg.character import spawn_character
+from minerva.simulation import Simulation
+
+
+@pytest.fixture
+def sim() -> Simulation:
+    """Create a test simulation."""
+    test_sim = Simulation()
+
+    return test_sim
+
+
+def test_kinship_degree(sim: Simulation):
+    """Test calculating the degree of kinship between characters."""
+
+    genealogy = sim.world.get_resource(GenealogyIndex)
+
+    grandma = spawn_character(sim.world)
+    grandpa = spawn_character(sim.world)
+    mom = spawn_character(sim.world)
+    uncle = spawn_character(sim.world)
+    dad = spawn_character(sim.world)
+    child = spawn_character(sim.world)
+    sibling = spawn_character(sim.world)
+    cousin = spawn_character(sim.world)
+    stranger = spawn_character(sim.world)
+
+    for c in (mom, uncle):
+        set_character_mother(c, grandma)
+        set_character_father(c, grandpa)
+
+    for c in (child, sibling):
+        set_character_mother(c, mom)
+        set_character_father(c, dad)
+
+    set_character_father(cousin, uncle)
+
+    assert genealogy.get_kinship_degree(child, child) == 0
+    assert genealogy.get_kinship_degree(child, mom) == 1
+    assert genealogy.get_kinship_degree(mom, child) == 1
+    assert genealogy.get_kinship_degree(child, sibling) == 2
+    assert genealogy.get_kinship_degree(child, grandma) == 2
+    assert genealogy.get_kinship_degree(child, uncle) == 3
+    assert genealogy.get_kinship_degree(child, cousin) == 4
+    assert genealogy.get_kinship_degree(child, stranger) is None
+
+    assert genealogy.common_ancestors(child, cousin) == {grandma.uid, grandpa.uid}
+    assert genealogy.are_related(child, cousin, max_degree=4)
+    assert not genealogy.are_related(child, cousin, max_degree=3)
+    assert not genealogy.are_related(dad, mom, max_degree=4)
+
+
+def test_incremental_updates(sim: Simulation):
+    """Test that memoized ancestors are updated by births and adoptions."""
+
+    genealogy = sim.world.get_resource(GenealogyIndex)
+
+    grandparent = spawn_character(sim.world)
+    parent = spawn_character(sim.world)
+    child = spawn_character(sim.world)
+    orphan = spawn_character(sim.world)
+
+    set_character_mother(child, parent)
+
+    # Populate the cache before linking an earlier generation
+    assert genealogy.get_ancestors(child) == {parent.uid: 1}
+
+    set_character_mother(parent, grandparent)
+
+    assert genealogy.get_ancestors(child) == {parent.uid: 1, grandparent.uid: 2}
+
+    # Adoption
+    set_relation_child(parent, orphan)
+
+    assert genealogy.get_kinship_degree(orphan, child) == 2
+    assert orphan.uid in genealogy.get_children(parent)
+
+
+def test_reassign_father(sim: Simulation):
+    """Test that reassigning a father removes the previous parent link."""
+
+    genealogy = sim.world.get_resource(GenealogyIndex)
+
+    father = spawn_character(sim.world)
+    stepfather = spawn_character(sim.world)
+    lover = spawn_character(sim.world)
+    child = spawn_character(sim.world)
+
+    set_character_father(child, father)
+    set_character_biological_father(child, father)
+
+    assert genealogy.get_parents(child) == {father.uid}
+
+    # The previous father is still the biological father
+    set_character_father(child, stepfather)
+
+    assert genealogy.get_parents(child) == {father.uid, stepfather.uid}
+
+    set_character_biological_father(child, lover)
+
+    assert genealogy.get_parents(child) == {stepfather.uid, lover.uid}
+    assert child.uid not in genealogy.get_children(father)
+
+    set_character_father(child, None)
+    set_character_biological_father(child, None)
+
+    assert genealogy.get_parents(child) == set()
+
+
+def test_max_depth():
+    """Test that ancestors beyond the max depth are ignored."""
+
+    sim = Simulation()
+    sim.world.add_resource(GenealogyIndex(max_depth=2))
+    genealogy = sim.world.get_resource(GenealogyIndex)
+
+    generations = [spawn_character(sim.world) for _ in range(4)]
+
+    for parent, child in zip(generations, generations[1:]):
+        set_character_mother(child, parent)
+
+    assert genealogy.get_ancestors(generations[-1]) == {
+        generations[2].uid: 1,
+        generations[1].uid: 2,
+    }
+    assert genealogy.get_kinship_degree(generations[0], generations[-1]) is None
@@ -0,0 +1,138 @@
+"""Test streaming history export.
+
+"""
+
+import io
+import json
+import struct
+
+from minerva.history_stream import HistoryStream
+from minerva.life_events.base_types import LifeEvent
+from minerva.pcg.character import spawn_character
+from minerva.sim_db import SimDB
+from minerva.simulation import Simulation
+
+
+def test_history_stream_ndjson():
+    """Test that rows are streamed as NDJSON and never re-sent."""
+
+    sim = Simulation()
+    output = io.BytesIO()
+    stream = HistoryStream(output, tables=("life_events",))
+    db = sim.world.get_resource(SimDB).db
+
+    character = spawn_character(sim.world)
+    LifeEvent("BecameFamilyHead", character).log_event()
+    LifeEvent("BecameFamilyHead", character).log_event()
+
+    assert stream.flush(db) == 2
+
+    records = [json.loads(line) for line in output.getvalue().splitlines()]
+
+    assert len(records) == 2
+    assert all(r["table"] == "life_events" for r in records)
+    assert records[0]["row"]["subject_id"] == character.uid
+
+    assert stream.flush(db) == 0
+
+    LifeEvent("BecameFamilyHead", character).log_event()
+
+    assert stream.flush(db) == 1
+    assert len(output.getvalue().splitlines()) == 3
+
+
+def test_history_stream_system():
+    """Test that new rows are streamed after every simulation step."""
+
+    sim = Simulation()
+    output = io.BytesIO()
+    sim.world.add_resource(HistoryStream(output))
+
+    for _ in range(3):
+        sim.step()
+
+    records = [json.loads(line) for line in output.getvalue().splitlines()]
+    event_ids = [r["row"]["event_id"] for r in records if r["table"] == "life_events"]
+    (n_life_events,) = (
+        sim.world.get_resource(SimDB)
+        .db.execute("SELECT COUNT(*) FROM life_events;")
+        .fetchone()
+    )
+
+    assert len(event_ids) == len(set(event_ids)) == n_life_events
+
+
+def test_history_stream_length_prefixed():
+    """Test framing records with their byte length."""
+
+    sim = Simulation()
+    output = io.BytesIO()
+    stream = HistoryStream(output, "length_prefixed", tables=("life_events",))
+
+    character = spawn_character(sim.world)
+    LifeEvent("BecameFamilyHead", character).log_event()
+
+    assert stream.flush(sim.world.get_resource(SimDB).db) == 1
+
+    data = output.getvalue()
+    (length,) = struct.unpack(">I", data[:4])
+    record = json.loads(data[4 : 4 + length])
+
+    assert len(data) == 4 + length
+    assert record["table"] == "life_events"
+    assert stream.high_water_marks["life_events"] == 1
+
+
+def test_history_stream_updates():
+    """Test that updates to previously sent rows are re-sent."""
+
+    sim = Simulation()
+    output = io.BytesIO()
+    stream = HistoryStream(output, tables=("marriages",))
+    db = sim.world.get_resource(SimDB).db
+
+    db.execute(
+        "INSERT INTO marriages (uid, character_id, spouse_id, start_date) "
+        "VALUES (1, 2, 3, '0001-01');"
+    )
+    db.commit()
+
+    assert stream.flush(db) == 1
+
+    db.execute("UPDATE marriages SET end_date='0010-01' WHERE uid=1;")
+    db.commit()
+
+    # Rows inserted and updated since the last flush are only sent once
+    db.execute(
+        "INSERT INTO marriages (uid, character_id, spouse_id, start_date) "
+        "VALUES (4, 5, 6, '0002-01');"
+    )
+    db.execute("UPDATE marriages SET end_date='0011-01' WHERE uid=4;")
+    db.commit()
+
+    assert stream.flush(db) == 2
+    assert stream.flush(db) == 0
+
+    records = [json.loads(line) for line in output.getvalue().splitlines()]
+
+    assert [(r["op"], r["row"]["uid"]) for r in records] == [
+        ("insert", 1),
+        ("update", 1),
+        ("insert", 4),
+    ]
+    assert records[1]["row"]["end_date"] == "0010-01"
+    assert records[2]["row"]["end_date"] == "0011-01"
+
+
+def test_simulation_close_releases_stream():
+    """Test that closing the simulation flushes and closes the stream."""
+
+    sim = Simulation()
+    output = io.BytesIO()
+    sim.world.add_resource(HistoryStream(output, tables=("life_events",)))
+
+    LifeEvent("BecameFamilyHead", spawn_character(sim.world)).log_event()
+    sim.close()
+
+    assert output.closed
+    assert not sim.world.has_resource(HistoryStream)
@@ -0,0 +1,37 @@
+"""Test that importing the headless simulation stays light.
+
+"""
+
+import json
+import subprocess
+import sys
+
+_IMPORT_SCRIPT = """
+import json
+import sys
+
+import minerva.simulation
+
+print(json.dumps({"modules": sorted(sys.modules)}))
+"""
+
+
+def _import_simulation() -> dict:
+    """Import minerva.simulation in a fresh interpreter and report the result."""
+    result = subprocess.run(
+        [sys.executable, "-c", _IMPORT_SCRIPT],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_import_skips_optional_dependencies():
+    """Test that visualization and inspection dependencies are not imported."""
+
+    modules = set(_import_simulation()["modules"])
+
+    for name in ("pygame", "pygame_gui", "rich", "numpy", "minerva.viz"):
+        assert name not in modules, f"{name} imported by minerva.simulation"
@@ -0,0 +1,90 @@
+"""Test the sprite atlas and pre-rendered static map layer.
+
+"""
+
+import numpy as np
+import pygame
+import pytest
+
+from minerva.viz.atlas import SpriteAtlas
+from minerva.viz.constants import TILE_SIZE
+from minerva.viz.map_layer import StaticMapLayer
+from minerva.world_map.components import CompassDir
+
+
+def _solid_tile(color: str) -> pygame.Surface:
+    """Create a tile filled with a single color."""
+    surface = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
+    surface.fill(color)
+    return surface
+
+
+def test_sprite_atlas_caches_by_key():
+    """Test that each unique key is only rendered once."""
+
+    atlas = SpriteAtlas(tiles_per_row=2)
+    calls: list[str] = []
+
+    def render(color: str):
+        calls.append(color)
+        return _solid_tile(color)
+
+    red = atlas.get("red", lambda: render("#ff0000"))
+    red_again = atlas.get("red", lambda: render("#ff0000"))
+
+    assert red is red_again
+    assert calls == ["#ff0000"]
+    assert tuple(red.get_at((0, 0))) == (255, 0, 0, 255)
+
+    for i in range(4):
+        atlas.get(i, lambda: render("#00ff00"))
+
+    assert len(atlas) == 5
+    assert atlas.page_count == 2
+
+    with pytest.raises(ValueError):
+        atlas.get("too_big", lambda: pygame.Surface((1, 1)))
+
+
+def test_static_map_layer_redraws_dirty_territories():
+    """Test that only chunks containing changed territories are updated."""
+
+    territory_grid = np.zeros((4, 8), dtype=np.int32)
+    territory_grid[:, 4:] = 1
+    borders = np.zeros((4, 8), dtype=np.uint8)
+    borders[:, 3] = CompassDir.EAST
+    borders[:, 4] = CompassDir.WEST
+
+    layer = StaticMapLayer(territory_grid, borders, chunk_size=4)
+    display = pygame.Surface((8 * TILE_SIZE, 4 * TILE_SIZE))
+
+    layer.draw(display, pygame.Vector2(0, 0))
+
+    assert layer.get_cached_chunk_count() == 2
+
+    wall_pixel = (4 * TILE_SIZE, TILE_SIZE // 2)
+    before = tuple(display.get_at(wall_pixel))
+
+    layer.set_territory_colors(1, "#ff0000", "#ff0000")
+    layer.draw(display, pygame.Vector2(0, 0))
+
+    assert tuple(display.get_at(wall_pixel)) != before
+    assert tuple(display.get_at(wall_pixel))[:3] == (255, 0, 0)
+
+    layer.draw(display, pygame.Vector2(0, 0), zoom=0.5)
+
+    assert layer.get_cached_chunk_count(0.5) == 2
+
+
+def test_static_map_layer_culls_offscreen_chunks():
+    """Test that chunks outside the surface are never rendered."""
+
+    territory_grid = np.zeros((64, 64), dtype=np.int32)
+    borders = np.zeros((64, 64), dtype=np.uint8)
+
+    layer = StaticMapLayer(territory_grid, borders, chunk_size=16)
+    display = pygame.Surface((16 * TILE_SIZE, 16 * TILE_SIZE))
+
+    layer.draw(display, pygame.Vector2(0, 0))
+
+    assert layer.get_cached_chunk_count() == 1
@@ -0,0 +1,88 @@
+"""Test render snapshots and the background simulation worker.
+
+"""
+
+import dataclasses
+import time
+
+import pytest
+
+from minerva.simulation import Simulation
+from minerva.viz.snapshots import (
+    SimulationWorker,
+    SnapshotBuffer,
+    build_render_snapshot,
+)
+
+
+def test_build_render_snapshot():
+    """Test capturing the render state of a simulation."""
+
+    sim = Simulation()
+
+    snapshot = build_render_snapshot(sim, 0)
+
+    assert snapshot.map_generated is False
+    assert snapshot.territories == ()
+
+    sim.step()
+
+    snapshot = build_render_snapshot(sim, 1)
+
+    assert snapshot.tick == 1
+    assert snapshot.map_generated is True
+    assert len(snapshot.territories) == sim.config.n_territories
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        snapshot.tick = 2  # type: ignore
+
+
+def test_snapshot_buffer():
+    """Test that readers see the most recently published snapshot."""
+
+    sim = Simulation()
+    buffer = SnapshotBuffer()
+
+    assert buffer.read() is None
+
+    first = build_render_snapshot(sim, 0)
+    buffer.publish(first)
+
+    assert buffer.read() is first
+
+    second = build_render_snapshot(sim, 1)
+    buffer.publish(second)
+
+    assert buffer.read() is second
+
+
+def test_simulation_worker():
+    """Test stepping the simulation on a background thread."""
+
+    sim = Simulation()
+    buffer = SnapshotBuffer()
+    worker = SimulationWorker(sim, buffer, steps_per_second=1000)
+
+    worker.start()
+
+    snapshot = buffer.read()
+    assert snapshot is not None
+    assert snapshot.tick == 0
+
+    worker.play()
+
+    deadline = time.perf_counter() + 10
+    while (snapshot := buffer.read()) and snapshot.tick < 3:
+        assert time.perf_counter() < deadline
+        time.sleep(0.01)
+
+    worker.stop(timeout=10)
+
+    assert not worker.is_alive
+    assert worker.error is None
+
+    with worker.lock:
+        assert buffer.read().date == str(sim.date)  # type: ignore
+
+    with pytest.raises(RuntimeError):
+        worker.start()
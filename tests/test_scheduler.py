@@ -0,0 +1,64 @@
+# pylint: disable=W0621
+"""Test scheduling entities to be woken at a later month.
+
+"""
+
+import pytest
+
+from minerva.characters.components import Character, Lifespan, Pregnancy
+from minerva.characters.stat_helpers import schedule_lifespan_check
+from minerva.ecs import World
+from minerva.pcg.character import spawn_character
+from minerva.scheduler import WakeScheduler
+from minerva.simulation import Simulation
+
+
+@pytest.fixture
+def sim() -> Simulation:
+    """Create a test simulation."""
+    test_sim = Simulation()
+
+    return test_sim
+
+
+def test_pop_due():
+    """Test that only due entities are returned, once each and ordered by UID."""
+
+    world = World()
+    scheduler = WakeScheduler()
+
+    a = world.entity()
+    b = world.entity()
+    c = world.entity()
+
+    scheduler.schedule(Pregnancy, c, 3)
+    scheduler.schedule(Pregnancy, a, 5)
+    scheduler.schedule(Pregnancy, c, 5)
+    scheduler.schedule(Pregnancy, b, 9)
+    scheduler.schedule(Lifespan, a, 1)
+
+    assert scheduler.pop_due(Pregnancy, 2) == []
+    assert scheduler.pop_due(Pregnancy, 6) == [a, c]
+    assert scheduler.pending_count(Pregnancy) == 1
+    assert scheduler.pending_count(Lifespan) == 1
+    assert scheduler.pop_due(Pregnancy, 20) == [b]
+    assert scheduler.pop_due(Pregnancy, 20) == []
+
+
+def test_lifespan_system_only_checks_due_characters(sim: Simulation):
+    """Test that characters die once scheduled and reaching their lifespan."""
+
+    character = spawn_character(sim.world)
+    character.get_component(Character).age = 30
+    character.get_component(Lifespan).base_value = 30
+    schedule_lifespan_check(character)
+
+    other = spawn_character(sim.world)
+    other.get_component(Character).age = 30
+    other.get_component(Lifespan).base_value = 70
+    schedule_lifespan_check(other)
+
+    sim.step()
+
+    assert character.get_component(Character).is_alive is False
+    assert other.get_component(Character).is_alive is True
@@ -0,0 +1,145 @@
+"""Test the simulation database query layer.
+
+"""
+
+import pytest
+
+from minerva.config import Config
+from minerva.life_events.base_types import (
+    LifeEvent,
+    compile_description_template,
+    get_life_event_description,
+    get_life_event_descriptions,
+    get_life_event_history,
+    get_life_event_ids,
+)
+from minerva.pcg.character import spawn_character
+from minerva.sim_db import SimDB
+from minerva.simulation import Simulation
+
+SimDB.register_query(
+    "test_relation_targets",
+    """
+    SELECT target_id FROM relations WHERE character_id=? ORDER BY target_id;
+    """,
+    ("relations",),
+)
+
+
+def test_query_cache_invalidation():
+    """Test that cached query results are invalidated by writes."""
+
+    db = SimDB()
+
+    assert db.query("test_relation_targets", (1,)) == []
+
+    version = db.get_table_version("relations")
+
+    db.db.execute(
+        "INSERT INTO relations (character_id, target_id, relation_type) "
+        "VALUES (1, 2, 'SIBLING');"
+    )
+    db.db.commit()
+
+    assert db.get_table_version("relations") == version + 1
+    assert db.query("test_relation_targets", (1,)) == [(2,)]
+
+    db.db.execute("DELETE FROM relations WHERE target_id=2;")
+    db.db.commit()
+
+    assert db.query("test_relation_targets", (1,)) == []
+
+    # Versions change once per statement, not once per row
+    version = db.get_table_version("relations")
+
+    db.db.cursor().executemany(
+        "INSERT INTO relations (character_id, target_id, relation_type) "
+        "VALUES (?, ?, 'SIBLING');",
+        [(1, 3), (1, 4), (1, 5)],
+    )
+    db.db.commit()
+
+    assert db.get_table_version("relations") == version + 1
+    assert db.query("test_relation_targets", (1,)) == [(3,), (4,), (5,)]
+
+
+def test_entity_versions():
+    """Test that entity versions change when rows describing them are written."""
+
+    db = SimDB()
+
+    assert db.get_entity_version(1) == 0
+
+    db.db.execute("INSERT INTO families (uid, name) VALUES (10, 'Stark');")
+    db.db.execute(
+        "INSERT INTO characters (uid, first_name, family) VALUES (1, 'Ned', 10);"
+    )
+
+    character_version = db.get_entity_version(1)
+    family_version = db.get_entity_version(10)
+
+    assert character_version > 0
+    assert family_version > 0
+
+    db.db.execute("UPDATE characters SET family=NULL WHERE uid=1;")
+
+    assert db.get_entity_version(1) > character_version
+    assert db.get_entity_version(10) > family_version
+    assert db.get_entity_version(2) == 0
+
+
+def test_query_unknown_name():
+    """Test that running an unregistered query raises a KeyError."""
+
+    db = SimDB()
+
+    with pytest.raises(KeyError):
+        db.query("test_missing_query")
+
+
+def test_get_life_event_descriptions():
+    """Test getting descriptions for many life events in one query."""
+
+    sim = Simulation()
+    character = spawn_character(sim.world)
+
+    for _ in range(3):
+        LifeEvent("BecameFamilyHead", character).log_event()
+
+    event_ids = get_life_event_ids(character)
+    descriptions = get_life_event_descriptions(sim.world, event_ids)
+
+    assert list(descriptions.keys()) == event_ids
+    for event_id, (_, description) in descriptions.items():
+        assert description == get_life_event_description(sim.world, event_id)
+
+
+def test_description_template_render():
+    """Test rendering pre-parsed description templates."""
+
+    template = compile_description_template("{subject_name} married {spouse_name}.")
+
+    assert template.render({"subject_name": "Rhaenyra", "spouse_name": "Daemon"}) == (
+        "Rhaenyra married Daemon."
+    )
+    assert template.render({"subject_name": "Rhaenyra"}) == (
+        "Rhaenyra married {spouse_name}."
+    )
+
+
+def test_get_life_event_history_without_materialization():
+    """Test rendering histories for events logged without a stored description."""
+
+    sim = Simulation(Config(materialize_life_event_descriptions=False))
+    character = spawn_character(sim.world)
+
+    event = LifeEvent("BecameFamilyHead", character)
+    event.event_args["family_name"] = "Targaryen"
+    event.log_event()
+
+    history = get_life_event_history(character)
+
+    assert len(history) == 1
+    assert history[0][0] == event.event_id
+    assert history[0][2] == event.render_description()
+    assert "Targaryen" in history[0][2]
@@ -0,0 +1,78 @@
+"""Test running the simulation for multiple timesteps.
+
+"""
+
+import pytest
+
+from minerva.config import Config
+from minerva.datetime import SimDate
+from minerva.simulation import Simulation
+
+
+def test_run_months():
+    """Test running the simulation for a fixed number of months."""
+
+    sim = Simulation(Config(logging_enabled=False))
+
+    assert sim.run(months=14) == 14
+    assert sim.date == SimDate(2, 3)
+
+
+def test_run_until_date():
+    """Test running the simulation until it reaches a date."""
+
+    sim = Simulation(Config(logging_enabled=False))
+
+    assert sim.run(until=SimDate(2, 1)) == 12
+    assert sim.run(until=SimDate(2, 1)) == 0
+
+
+def test_run_stop_when():
+    """Test stopping the simulation early using a predicate."""
+
+    sim = Simulation(Config(logging_enabled=False))
+
+    steps = sim.run(months=24, stop_when=lambda s: s.date.month == 6)
+
+    assert steps == 5
+    assert sim.date == SimDate(1, 6)
+
+
+def test_run_on_tick():
+    """Test that on_tick is called every tick_interval timesteps."""
+
+    sim = Simulation(Config(logging_enabled=False))
+    dates: list[str] = []
+
+    sim.run(
+        months=10,
+        on_tick=lambda s: dates.append(s.date.to_iso_str()),
+        tick_interval=4,
+    )
+
+    assert dates == [SimDate(1, 5).to_iso_str(), SimDate(1, 9).to_iso_str()]
+
+
+def test_run_time_budget():
+    """Test that the simulation stops once its time budget is used up."""
+
+    sim = Simulation(Config(logging_enabled=False))
+
+    assert sim.run(time_budget_s=0) == 0
+
+
+def test_run_requires_stopping_condition():
+    """Test that running without a stopping condition raises an error."""
+
+    sim = Simulation(Config(logging_enabled=False))
+
+    with pytest.raises(ValueError):
+        sim.run()
+
+
+def test_run_with_system_access_verification():
+    """Test that the built-in systems declare every resource and component they use."""
+
+    sim = Simulation(Config(seed=1, logging_enabled=False, verify_system_access=True))
+
+    assert sim.run(months=48) == 48
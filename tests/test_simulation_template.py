@@ -0,0 +1,102 @@
+"""Test creating simulations from a pre-built template.
+
+"""
+
+from minerva.config import Config
+from minerva.life_events.base_types import LifeEventTypeLibrary
+from minerva.pcg.text_gen import Tracery
+from minerva.sim_db import SimDB
+from minerva.simulation import Simulation, SimulationTemplate
+from minerva.traits.base_types import Trait, TraitLibrary
+
+
+def test_template_content_is_copy_on_write():
+    """Test that simulations share template content without modifying it."""
+
+    template = SimulationTemplate()
+    template.world.get_resource(TraitLibrary).add_trait(
+        Trait(trait_id="brave", name="Brave")
+    )
+
+    sim = template.create_simulation(Config(logging_enabled=False))
+    other_sim = template.create_simulation(Config(logging_enabled=False))
+
+    sim_traits = sim.world.get_resource(TraitLibrary)
+    template_traits = template.world.get_resource(TraitLibrary)
+
+    assert sim_traits.get_trait("brave") is template_traits.get_trait("brave")
+
+    sim_traits.add_trait(Trait(trait_id="craven", name="Craven"))
+    template_traits.add_trait(Trait(trait_id="shy", name="Shy"))
+
+    assert "craven" in sim_traits.traits
+    assert "shy" not in sim_traits.traits
+    assert "craven" not in template_traits.traits
+    assert set(other_sim.world.get_resource(TraitLibrary).traits) == {"brave"}
+
+
+def test_template_database_is_copied():
+    """Test that simulations start with a copy of the template's database."""
+
+    template = SimulationTemplate()
+    sim = template.create_simulation(Config(logging_enabled=False))
+
+    template_db = template.world.get_resource(SimDB).db
+    sim_db = sim.world.get_resource(SimDB).db
+    count_sql = "SELECT COUNT(*) FROM life_event_types;"
+
+    n_event_types = template_db.execute(count_sql).fetchone()[0]
+
+    assert n_event_types > 0
+    assert sim_db.execute(count_sql).fetchone()[0] == n_event_types
+
+    sim_db.execute(
+        "INSERT INTO life_event_types (name, display_name, description) "
+        "VALUES ('Test', 'Test', 'Test');"
+    )
+    sim_db.commit()
+
+    assert template_db.execute(count_sql).fetchone()[0] == n_event_types
+
+
+def test_template_matches_fresh_simulation():
+    """Test that templated simulations behave like ones built from scratch."""
+
+    rules = {"surname": ["Stark", "Lannister", "Tully", "Arryn"]}
+
+    template = SimulationTemplate()
+    template.world.get_resource(Tracery).add_rules(rules)
+
+    fresh_sim = Simulation(Config(seed=101, logging_enabled=False))
+    fresh_sim.world.get_resource(Tracery).add_rules(rules)
+
+    template_sim = template.create_simulation(Config(seed=101, logging_enabled=False))
+
+    for _ in range(12):
+        fresh_sim.step()
+        template_sim.step()
+
+    sql = "SELECT uid, first_name, surname, age FROM characters ORDER BY uid;"
+
+    assert (
+        fresh_sim.world.get_resource(SimDB).db.execute(sql).fetchall()
+        == template_sim.world.get_resource(SimDB).db.execute(sql).fetchall()
+    )
+
+
+def test_template_life_event_types_are_copied():
+    """Test that simulations render life events using the template's types."""
+
+    template = SimulationTemplate()
+    sim = template.create_simulation(Config(logging_enabled=False))
+
+    template_types = template.world.get_resource(LifeEventTypeLibrary)
+    sim_types = sim.world.get_resource(LifeEventTypeLibrary)
+
+    assert sim_types.get_type("Death") is template_types.get_type("Death")
+    assert (
+        sim_types.get_type("Death").template.render(
+            {"subject_name": "Ned", "subject_id": "7", "cause": "execution"}
+        )
+        == "Ned (7) died (cause: execution)."
+    )
@@ -0,0 +1,74 @@
+# pylint: disable=W0621
+"""Test the territory index used for territory and family lookups.
+
+"""
+
+import pytest
+
+from minerva.pcg.character import spawn_family
+from minerva.pcg.territory_pcg import spawn_territory
+from minerva.simulation import Simulation
+from minerva.world_map.components import Territory
+from minerva.world_map.helpers import (
+    increment_political_influence,
+    remove_political_influence,
+    set_territory_controlling_family,
+)
+from minerva.world_map.territory_index import TerritoryIndex
+
+
+@pytest.fixture
+def sim() -> Simulation:
+    """Create a test simulation."""
+    test_sim = Simulation()
+
+    return test_sim
+
+
+def test_family_presence(sim: Simulation):
+    """Test tracking which families have influence over territories."""
+
+    territory_index = sim.world.get_resource(TerritoryIndex)
+
+    territory = spawn_territory(sim.world)
+    family = spawn_family(sim.world)
+
+    increment_political_influence(territory, family, 10)
+
+    assert territory_index.get_families_present_in(territory) == [family]
+    assert territory_index.get_territories_present_in(family) == [territory]
+
+    remove_political_influence(territory, family)
+
+    assert territory_index.get_families_present_in(territory) == []
+    assert family not in territory.get_component(Territory).political_influence
+
+
+def test_frontier(sim: Simulation):
+    """Test calculating the territories bordering a family's lands."""
+
+    territory_index = sim.world.get_resource(TerritoryIndex)
+
+    territories = [spawn_territory(sim.world) for _ in range(4)]
+    family = spawn_family(sim.world)
+
+    # Territories are connected in a line: 0 - 1 - 2 - 3
+    for i, territory in enumerate(territories):
+        neighbors = [territories[j] for j in (i - 1, i + 1) if 0 <= j < 4]
+        territory_index.set_neighbors(territory, neighbors)
+
+    assert territory_index.are_neighbors(territories[0], territories[1])
+    assert not territory_index.are_neighbors(territories[0], territories[2])
+
+    set_territory_controlling_family(territories[1], family)
+
+    assert set(territory_index.get_frontier(family)) == {territories[0], territories[2]}
+
+    set_territory_controlling_family(territories[2], family)
+
+    assert set(territory_index.get_frontier(family)) == {territories[0], territories[3]}
+    assert territory_index.get_controlled_territories(family) == territories[1:3]
+
+    set_territory_controlling_family(territories[1], None)
+
+    assert set(territory_index.get_frontier(family)) == {territories[1], territories[3]}
@@ -0,0 +1,116 @@
+# pylint: disable=W0621
+"""Test wiki page generation, pagination, and caching.
+
+"""
+
+import re
+import threading
+
+import pytest
+
+from minerva.characters.components import Character
+from minerva.characters.helpers import set_character_age
+from minerva.simulation import Simulation
+from minerva.viz.wiki import (
+    CharacterListPageGenerator,
+    WikiPageCache,
+    generate_wiki_page,
+)
+
+
+@pytest.fixture
+def sim() -> Simulation:
+    """Create a test simulation with a generated world."""
+    test_sim = Simulation()
+    test_sim.step()
+
+    return test_sim
+
+
+def test_character_list_pagination(sim: Simulation, monkeypatch: pytest.MonkeyPatch):
+    """Test that character list pages link to the next page using a cursor."""
+
+    monkeypatch.setattr(CharacterListPageGenerator, "PAGE_SIZE", 5)
+    lock = threading.RLock()
+
+    first_page = generate_wiki_page(sim, "/character_list", lock)
+    first_uids = [int(uid) for uid in re.findall(r"/entity\?uid=(\d+)", first_page)]
+
+    assert len(first_uids) == 5
+    assert "First Page" not in first_page
+
+    cursor = re.search(r"/character_list\?after=(\d+)", first_page)
+    assert cursor is not None
+    assert int(cursor.group(1)) == first_uids[-1]
+
+    second_page = generate_wiki_page(
+        sim, f"/character_list?after={cursor.group(1)}", lock
+    )
+    second_uids = [int(uid) for uid in re.findall(r"/entity\?uid=(\d+)", second_page)]
+
+    assert "First Page" in second_page
+    assert min(second_uids) > max(first_uids)
+
+
+def test_wiki_page_cache(sim: Simulation):
+    """Test that pages are cached until the entity they describe changes."""
+
+    lock = threading.RLock()
+    cache = WikiPageCache()
+
+    character_list = generate_wiki_page(sim, "/character_list", lock, cache)
+    uid = int(re.findall(r"/entity\?uid=(\d+)", character_list)[0])
+
+    assert len(cache) == 1
+
+    generate_wiki_page(sim, f"/entity?uid={uid}", lock, cache)
+    generate_wiki_page(sim, f"/entity?uid={uid}", lock, cache)
+
+    assert len(cache) == 2
+
+    for _ in range(12):
+        sim.step()
+
+    generate_wiki_page(sim, f"/entity?uid={uid}", lock, cache)
+
+    assert len(cache) == 3
+
+
+def test_cached_character_page_age(sim: Simulation):
+    """Test that cached character pages show the same age as a fresh render."""
+
+    lock = threading.RLock()
+    cache = WikiPageCache()
+    uid, _ = next(iter(sim.world.query_components((Character,))))
+    character = sim.world.get_entity(uid)
+
+    set_character_age(character, 30.25)
+    page = generate_wiki_page(sim, f"/entity?uid={uid}", lock, cache)
+
+    set_character_age(character, 30.75)
+
+    assert generate_wiki_page(sim, f"/entity?uid={uid}", lock, cache) == page
+    assert generate_wiki_page(sim, f"/entity?uid={uid}", lock) == page
+
+
+def test_wiki_page_cache_eviction():
+    """Test that the least recently used pages are evicted first."""
+
+    cache = WikiPageCache(max_size=2)
+    cache.put("/a", 1, "a")
+    cache.put("/b", 1, "b")
+
+    assert cache.get("/a", 1) == "a"
+
+    cache.put("/c", 1, "c")
+
+    assert cache.get("/b", 1) is None
+    assert cache.get("/a", 1) == "a"
+    assert cache.get("/c", 1) == "c"
+
+
+def test_unknown_wiki_page(sim: Simulation):
+    """Test that unknown pages raise a KeyError."""
+
+    with pytest.raises(KeyError):
+        generate_wiki_page(sim, "/unknown", threading.RLock())
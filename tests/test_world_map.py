@@ -0,0 +1,107 @@
+"""Test world map grids and territory generation.
+
+"""
+
+import numpy as np
+
+from minerva.pcg.world_map import TerritoryGenerator
+from minerva.world_map.components import (
+    ArrayGrid,
+    CartesianGrid,
+    CompassDir,
+    WorldMap,
+)
+
+
+def test_array_grid_get_set():
+    """Test reading and writing individual cells of an array grid."""
+
+    grid: ArrayGrid[int] = ArrayGrid((4, 3), -1, np.int32)
+
+    assert grid.get_size() == (4, 3)
+    assert grid.array.shape == (3, 4)
+    assert grid.get((3, 2)) == -1
+
+    grid.set((3, 2), 7)
+
+    assert grid.get((3, 2)) == 7
+    assert grid.array[2, 3] == 7
+    assert ((3, 2), 7) in list(grid.enumerate())
+
+    copy = grid.copy()
+    copy.set((3, 2), 1)
+
+    assert grid.get((3, 2)) == 7
+
+
+def test_array_grid_value_type():
+    """Test that array grids convert raw values to their value type."""
+
+    grid: ArrayGrid[CompassDir] = ArrayGrid((2, 2), 0, np.uint8, CompassDir)
+    grid.set((0, 1), CompassDir.NORTH | CompassDir.EAST)
+
+    value = grid.get((0, 1))
+
+    assert isinstance(value, CompassDir)
+    assert value == CompassDir.NORTH | CompassDir.EAST
+    assert grid.array.dtype == np.uint8
+
+
+def test_world_map_holds_generational_uids():
+    """Test that the territory grid stores UIDs that need more than 32 bits."""
+
+    world_map = WorldMap((2, 2))
+    uid = (3 << 32) | 5
+
+    world_map.territory_grid.set((1, 0), uid)
+
+    assert world_map.territory_grid.get((1, 0)) == uid
+    assert world_map.territory_grid.array.dtype == np.int64
+
+
+def test_cartesian_grid_neighbors_ignore_cell_values():
+    """Test that cached neighbors are not affected by later cell updates."""
+
+    grid: CartesianGrid[int] = CartesianGrid((3, 3), lambda: -1)
+
+    assert grid.get_neighbors((1, 1)) == [(1, 0), (2, 1), (1, 2), (0, 1)]
+
+    grid.set((1, 0), 5)
+
+    assert grid.get_neighbors((1, 1)) == [(1, 0), (2, 1), (1, 2), (0, 1)]
+    assert grid.get_neighbors((0, 0)) == [(1, 0), (0, 1)]
+
+
+def test_generate_territories():
+    """Test that every cell is claimed and borders match the territory grid."""
+
+    generator = TerritoryGenerator((30, 25), 12, seed=3)
+    generator.generate_territories()
+
+    assert generator.is_complete
+    assert int(generator.territory_grid.array.min()) == 0
+
+    for territory in generator.territories:
+        assert generator.territory_grid.get(territory.castle_pos) == territory.uid
+
+    for (x, y), territory_id in generator.territory_grid.enumerate():
+        expected = CompassDir.NONE
+
+        for direction, (dx, dy) in (
+            (CompassDir.NORTH, (0, -1)),
+            (CompassDir.EAST, (1, 0)),
+            (CompassDir.SOUTH, (0, 1)),
+            (CompassDir.WEST, (-1, 0)),
+        ):
+            coord = (x + dx, y + dy)
+
+            if not generator.territory_grid.in_bounds(coord):
+                continue
+
+            neighbor_id = generator.territory_grid.get(coord)
+
+            if neighbor_id != territory_id:
+                expected |= direction
+                assert neighbor_id in generator.territories[territory_id].neighbors
+
+        assert generator.borders.get((x, y)) == expected
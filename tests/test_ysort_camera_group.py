@@ -0,0 +1,67 @@
+"""Test viewport culling in the y-sorted camera sprite group.
+
+"""
+
+import pygame
+
+from minerva.viz.game import YSortCameraGroup
+
+
+def _create_sprite(x: int, y: int) -> pygame.sprite.Sprite:
+    """Create a 32x32 sprite at the given position."""
+    sprite = pygame.sprite.Sprite()
+    sprite.image = pygame.Surface((32, 32))
+    sprite.rect = sprite.image.get_rect(topleft=(x, y))
+    return sprite
+
+
+def test_get_visible_sprites():
+    """Test that only sprites near the viewport are returned."""
+
+    group = YSortCameraGroup(pygame.Surface((640, 480)))
+    group.offset = pygame.Vector2(0, 0)
+
+    on_screen = _create_sprite(100, 100)
+    off_screen = _create_sprite(5000, 5000)
+    group.add(on_screen, off_screen)  # type: ignore
+
+    assert group.get_visible_sprites() == [on_screen]
+
+    group.update(pygame.Vector2(-490, -490))
+
+    assert group.get_visible_sprites() == [off_screen]
+
+
+def test_sprite_spanning_chunks():
+    """Test that sprites overlapping chunk boundaries are only returned once."""
+
+    group = YSortCameraGroup(pygame.Surface((640, 480)))
+    group.offset = pygame.Vector2(0, 0)
+
+    edge = YSortCameraGroup.CHUNK_SIZE - 16
+    sprite = _create_sprite(edge, edge)
+    group.add(sprite)  # type: ignore
+
+    assert group.get_visible_sprites() == [sprite]
+
+
+def test_remove_and_refresh_sprite():
+    """Test that chunks stay in sync as sprites are removed and moved."""
+
+    group = YSortCameraGroup(pygame.Surface((640, 480)))
+    group.offset = pygame.Vector2(0, 0)
+
+    sprite = _create_sprite(5000, 5000)
+    group.add(sprite)  # type: ignore
+
+    assert not group.get_visible_sprites()
+
+    assert sprite.rect
+    sprite.rect.topleft = (10, 10)
+    group.refresh_sprite(sprite)
+
+    assert group.get_visible_sprites() == [sprite]
+
+    sprite.kill()
+
+    assert not group.get_visible_sprites()